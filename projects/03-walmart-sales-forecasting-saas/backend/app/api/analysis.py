@@ -1,7 +1,7 @@
 """
 Analysis API - Endpoints for data analysis and model training
 """
-from fastapi import APIRouter, HTTPException, UploadFile, File, BackgroundTasks
+from fastapi import APIRouter, HTTPException, UploadFile, File, BackgroundTasks, Query
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import Dict, List, Optional
@@ -783,11 +783,15 @@ async def preprocess_dataset(session_id: str):
 async def train_model(
     session_id: str, 
     request: TrainingRequest,
-    background_tasks: BackgroundTasks
+    background_tasks: BackgroundTasks,
+    fast: bool = Query(False, description="Skip in-sample metrics for baseline models")
 ):
     """
     Start model training job
     Returns job_id for status polling
+    
+    With ?fast=true, baseline (naive / moving average) models skip their
+    in-sample metric computation and report zeroed metrics.
     """
     logger.info(f"🚂 Training request for session: {session_id}, model: {request.model_type}")
     
@@ -825,7 +829,8 @@ async def train_model(
         request.target_col,
         request.date_col,
         request.forecast_periods,
-        request.confidence_level
+        request.confidence_level,
+        fast
     )
     
     return {
@@ -842,7 +847,8 @@ async def run_training(
     target_col: str,
     date_col: str,
     forecast_periods: int,
-    confidence_level: float
+    confidence_level: float,
+    fast_fit: bool = False
 ):
     """Background task to run model training"""
     from app.services.websocket_manager import manager
@@ -960,7 +966,10 @@ async def run_training(
                 logger.info(f"Attempting to train {candidate}...")
                 
                 model_instance = model_classes[candidate]()
-                metrics_result = model_instance.train(df, target_col, date_col)
+                if fast_fit and candidate in ('naive', 'moving_average'):
+                    metrics_result = model_instance.train(df, target_col, date_col, compute_metrics=False)
+                else:
+                    metrics_result = model_instance.train(df, target_col, date_col)
                 
                 # Check for validity (basic check)
                 if metrics_result.mape is None or np.isnan(metrics_result.mape):
@@ -1009,12 +1018,12 @@ async def run_training(
             'accuracy_rating': trained_model.get_accuracy_rating(metrics.mape),
             'used_model': used_model_name # Explicitly correct model name
         }
+        forecast_json = forecast.to_json_dict()
         training_jobs[job_id]['forecast'] = {
-            'dates': forecast.dates,
-            'predictions': forecast.predictions,
-            'lower_bound': forecast.lower_bound,
-
-            'upper_bound': forecast.upper_bound,
+            'dates': forecast_json['dates'],
+            'predictions': forecast_json['predictions'],
+            'lower_bound': forecast_json['lower_bound'],
+            'upper_bound': forecast_json['upper_bound'],
             'confidence_level': forecast.confidence_level
         }
         
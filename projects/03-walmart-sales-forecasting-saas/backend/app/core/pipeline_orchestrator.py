@@ -3,20 +3,55 @@ Enterprise Pipeline Orchestrator
 Main controller for the analysis pipeline with robust error handling and session management
 """
 
+import atexit
+import gc
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
 import time
-import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
 from typing import Dict, List, Any, Optional, Callable, Tuple
-from dataclasses import dataclass, field, asdict
-from functools import wraps
+from dataclasses import dataclass, field
+from functools import partial, wraps
 
+import numpy as np
 import pandas as pd
 
 from ..utils.structured_logger import pipeline_logger
 from ..services.enterprise_validator import EnterpriseDataValidator, ValidationError
 
 
+# Preprocessed frames are cached in a private (0700) temp directory so a retry
+# can resume at feature engineering; entries expire by age and total size
+PIPELINE_CACHE_PREFIX = "pipeline_cache_"
+PIPELINE_CACHE_MAX_AGE_SECONDS = 6 * 3600
+PIPELINE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Session retention: LRU cap plus an age limit enforced by a background pruner
+MAX_ACTIVE_SESSIONS = 256
+SESSION_TTL_SECONDS = 3600
+SESSION_PRUNE_INTERVAL_SECONDS = 300
+
+# Target lags added by _engineer_features
+FEATURE_LAGS = (1, 7, 14)
+LAG_COLUMNS = frozenset(f'lag_{lag}' for lag in FEATURE_LAGS)
+
+# Tried in order when decoding delimited text uploads
+CSV_ENCODINGS = ('utf-8', 'latin-1', 'cp1252', 'ISO-8859-1')
+
+# Stage outcome recorded in PipelineContext.stage_history
+STAGE_COMPLETED = "completed"
+STAGE_FAILED = "failed"
+StageRecord = Tuple[str, int, int, str, Optional[str]]
+
+
 class PipelineStage(Enum):
     """Enumeration of pipeline stages for tracking"""
     INGESTION = "ingestion"
@@ -31,7 +66,7 @@ class PipelineStage(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineContext:
     """Context object passed through pipeline stages"""
     session_id: str
@@ -42,29 +77,28 @@ class PipelineContext:
     upload_timestamp: datetime
     column_mapping: Dict[str, str]
     current_stage: PipelineStage = PipelineStage.INGESTION
-    stage_history: List[Dict] = field(default_factory=list)
+    # (stage, started_ns, ended_ns, status, error) - see stage_history_dicts()
+    stage_history: List[StageRecord] = field(default_factory=list)
     data_quality_score: float = 0.0
     errors: List[Dict] = field(default_factory=list)
     warnings: List[Dict] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
     
-    def to_dict(self) -> Dict:
-        """Convert context to dictionary"""
-        return {
-            "session_id": self.session_id,
-            "user_id": self.user_id,
-            "file_path": self.file_path,
-            "original_filename": self.original_filename,
-            "file_size_bytes": self.file_size_bytes,
-            "upload_timestamp": self.upload_timestamp.isoformat(),
-            "column_mapping": self.column_mapping,
-            "current_stage": self.current_stage.value,
-            "stage_history": self.stage_history,
-            "data_quality_score": self.data_quality_score,
-            "errors": self.errors,
-            "warnings": self.warnings,
-            "metadata": self.metadata
-        }
+    def stage_history_dicts(self) -> List[Dict]:
+        """Materialize stage_history as dictionaries for API responses"""
+        history = []
+        for stage, started_ns, ended_ns, status, error in self.stage_history:
+            entry = {
+                "stage": stage,
+                "started_at": _ns_to_iso(started_ns),
+                "ended_at": _ns_to_iso(ended_ns),
+                "status": status,
+                "duration_seconds": (ended_ns - started_ns) / 1e9
+            }
+            if error is not None:
+                entry["error"] = error
+            history.append(entry)
+        return history
 
 
 class PipelineError(Exception):
@@ -77,72 +111,86 @@ class PipelineError(Exception):
         super().__init__(self.message)
 
 
+def _read_delimited(file_path: str, sep: str) -> Tuple[pd.DataFrame, Optional[str]]:
+    """Read a delimited text file, returning the frame and the encoding that worked"""
+    for encoding in CSV_ENCODINGS:
+        try:
+            return pd.read_csv(file_path, sep=sep, encoding=encoding), encoding
+        except UnicodeDecodeError:
+            continue
+    raise ValueError("Could not decode file")
+
+
+def _read_spreadsheet(file_path: str) -> Tuple[pd.DataFrame, Optional[str]]:
+    """Read an Excel workbook (no text encoding applies)"""
+    return pd.read_excel(file_path), None
+
+
+def _ns_to_iso(ns: int) -> str:
+    """Format a time.time_ns() timestamp as an ISO-8601 UTC string"""
+    return datetime.utcfromtimestamp(ns / 1e9).isoformat()
+
+
 def stage_wrapper(stage_name: PipelineStage):
     """Decorator for pipeline stage execution with error handling"""
+    # Resolved once per decorated stage rather than on every call
+    stage_value = stage_name.value
+    
     def decorator(func):
         @wraps(func)
         def wrapper(self, context: PipelineContext, *args, **kwargs):
-            start_time = time.time()
-            stage_entry = {
-                "stage": stage_name.value,
-                "started_at": datetime.utcnow().isoformat(),
-                "status": "running"
-            }
-            context.stage_history.append(stage_entry)
+            # Raw epoch nanoseconds; ISO strings are only built on the error path
+            start_ns = time.time_ns()
             context.current_stage = stage_name
             
             pipeline_logger.log_event("stage_started", {
                 "session_id": context.session_id,
-                "stage": stage_name.value,
-                "timestamp": start_time
+                "stage": stage_value,
+                "timestamp": start_ns / 1e9
             })
             
             try:
                 # Execute the stage
                 result = func(self, context, *args, **kwargs)
                 
-                # Record success
-                duration = time.time() - start_time
-                stage_entry.update({
-                    "completed_at": datetime.utcnow().isoformat(),
-                    "status": "completed",
-                    "duration_seconds": duration
-                })
+                # Record success (single append once all fields are known)
+                end_ns = time.time_ns()
+                context.stage_history.append(
+                    (stage_value, start_ns, end_ns, STAGE_COMPLETED, None)
+                )
                 
                 pipeline_logger.log_event("stage_completed", {
                     "session_id": context.session_id,
-                    "stage": stage_name.value,
-                    "duration_seconds": duration
+                    "stage": stage_value,
+                    "duration_seconds": (end_ns - start_ns) / 1e9
                 })
                 
                 return result
                 
             except Exception as e:
                 # Record failure
-                duration = time.time() - start_time
-                stage_entry.update({
-                    "failed_at": datetime.utcnow().isoformat(),
-                    "status": "failed",
-                    "duration_seconds": duration,
-                    "error": str(e)
-                })
+                end_ns = time.time_ns()
+                duration = (end_ns - start_ns) / 1e9
+                context.stage_history.append(
+                    (stage_value, start_ns, end_ns, STAGE_FAILED, str(e))
+                )
                 
                 pipeline_logger.log_error(e, {
                     "session_id": context.session_id,
-                    "stage": stage_name.value,
+                    "stage": stage_value,
                     "duration_seconds": duration
-                }, f"pipeline_stage_{stage_name.value}")
+                }, f"pipeline_stage_{stage_value}")
                 
                 # Create detailed error context
                 error_context = {
                     "session_id": context.session_id,
-                    "stage": stage_name.value,
+                    "stage": stage_value,
                     "operation": func.__name__,
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": _ns_to_iso(end_ns)
                 }
                 
                 raise PipelineError(
-                    message=f"Stage {stage_name.value} failed: {str(e)}",
+                    message=f"Stage {stage_value} failed: {str(e)}",
                     stage=stage_name,
                     context=error_context,
                     recoverable=isinstance(e, ValidationError)
@@ -155,9 +203,30 @@ def stage_wrapper(stage_name: PipelineStage):
 class EnterprisePipelineOrchestrator:
     """Main orchestrator for the enterprise analysis pipeline"""
     
-    def __init__(self):
+    def __init__(self, max_sessions: int = MAX_ACTIVE_SESSIONS,
+                 session_ttl_seconds: int = SESSION_TTL_SECONDS,
+                 cache_dir: Optional[Path] = None):
         self.logger = pipeline_logger
-        self.active_sessions: Dict[str, PipelineContext] = {}
+        # Created lazily by _ensure_cache_dir; a mkdtemp directory (no cache_dir
+        # given) is ours and is removed again by shutdown() or at exit
+        self._cache_dir: Optional[Path] = Path(cache_dir) if cache_dir is not None else None
+        self._owns_cache_dir = cache_dir is None
+        self._cache_lock = threading.Lock()
+        # Least-recently-used first; each context may hold a trained ensemble in metadata
+        self.active_sessions: "OrderedDict[str, PipelineContext]" = OrderedDict()
+        self.max_sessions = max_sessions
+        self.session_ttl_seconds = session_ttl_seconds
+        self._sessions_lock = threading.Lock()
+        self._stop_pruning = threading.Event()
+        # Started with the first session (see _ensure_pruner), stopped by shutdown()
+        self._pruner: Optional[threading.Thread] = None
+        # Extension -> reader dispatch table used by _ingest_data
+        self._readers: Dict[str, Callable[[str], Tuple[pd.DataFrame, Optional[str]]]] = {
+            'csv': partial(_read_delimited, sep=','),
+            'tsv': partial(_read_delimited, sep='\t'),
+            'xlsx': _read_spreadsheet,
+            'xls': _read_spreadsheet,
+        }
     
     def create_session(self, user_id: str, file_path: str, 
                       original_filename: str, file_size: int,
@@ -187,7 +256,13 @@ class EnterprisePipelineOrchestrator:
             column_mapping=column_mapping
         )
         
-        self.active_sessions[session_id] = context
+        with self._sessions_lock:
+            self._ensure_pruner()
+            self.active_sessions[session_id] = context
+            self.active_sessions.move_to_end(session_id)
+            while len(self.active_sessions) > self.max_sessions:
+                _, evicted = self.active_sessions.popitem(last=False)
+                self._release_session(evicted)
         
         self.logger.log_event("session_created", {
             "session_id": session_id,
@@ -200,7 +275,199 @@ class EnterprisePipelineOrchestrator:
     
     def get_session(self, session_id: str) -> Optional[PipelineContext]:
         """Get active session by ID"""
-        return self.active_sessions.get(session_id)
+        with self._sessions_lock:
+            context = self.active_sessions.get(session_id)
+            if context is not None:
+                self.active_sessions.move_to_end(session_id)
+            return context
+    
+    @staticmethod
+    def _release_session(context: PipelineContext):
+        """Drop the heavy model reference held by an evicted session"""
+        context.metadata.pop('_ensemble_model', None)
+    
+    def prune_expired(self, max_age_s: Optional[int] = None) -> int:
+        """
+        Remove sessions older than max_age_s
+        
+        Args:
+            max_age_s: Maximum session age in seconds (defaults to the configured TTL)
+            
+        Returns:
+            Number of sessions removed
+        """
+        max_age_s = self.session_ttl_seconds if max_age_s is None else max_age_s
+        now = datetime.utcnow()
+        with self._sessions_lock:
+            expired = [
+                session_id for session_id, context in self.active_sessions.items()
+                if (now - context.upload_timestamp).total_seconds() > max_age_s
+            ]
+            for session_id in expired:
+                self._release_session(self.active_sessions.pop(session_id))
+        
+        if expired:
+            # Ensembles can hold reference cycles; reclaim them now rather than at the next GC
+            gc.collect()
+            self.logger.log_event("sessions_pruned", {
+                "removed": len(expired),
+                "remaining": len(self.active_sessions)
+            })
+        return len(expired)
+    
+    def _ensure_pruner(self):
+        """Start the background pruner once (caller holds _sessions_lock)"""
+        if self._pruner is None and not self._stop_pruning.is_set():
+            self._pruner = threading.Thread(
+                target=self._prune_loop, name="pipeline-session-pruner", daemon=True
+            )
+            self._pruner.start()
+    
+    def shutdown(self, timeout: Optional[float] = 5.0):
+        """Stop the background pruner and remove the temporary cache directory"""
+        self._stop_pruning.set()
+        with self._sessions_lock:
+            pruner = self._pruner
+        if pruner is not None:
+            pruner.join(timeout)
+        with self._cache_lock:
+            if self._owns_cache_dir and self._cache_dir is not None:
+                shutil.rmtree(self._cache_dir, ignore_errors=True)
+                self._cache_dir = None
+    
+    def _prune_loop(self):
+        """Background loop that expires stale sessions"""
+        while not self._stop_pruning.wait(SESSION_PRUNE_INTERVAL_SECONDS):
+            try:
+                self.prune_expired()
+            except Exception as e:
+                self.logger.log_error(e, {}, "session_prune")
+    
+    def _cache_key(self, context: PipelineContext) -> str:
+        """
+        Build the cache key for the uploaded file
+        
+        Streams a SHA-256 of the whole file and mixes in the user and the
+        column mapping, so entries are never shared across users or mappings.
+        """
+        with open(context.file_path, 'rb') as f:
+            digest = hashlib.file_digest(f, 'sha256')
+        digest.update(b'\0' + str(context.user_id).encode())
+        digest.update(b'\0' + json.dumps(context.column_mapping, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+    
+    def _ensure_cache_dir(self) -> Path:
+        """Return the private cache directory, creating it with mode 0700"""
+        with self._cache_lock:
+            if self._cache_dir is None:
+                self._cache_dir = Path(tempfile.mkdtemp(prefix=PIPELINE_CACHE_PREFIX))
+                # Backstop for processes that exit without shutdown()
+                atexit.register(shutil.rmtree, self._cache_dir, ignore_errors=True)
+            else:
+                self._cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+                os.chmod(self._cache_dir, 0o700)
+            return self._cache_dir
+    
+    def _remove_cache_entry(self, cache_key: str):
+        """Delete both files of a cache entry (missing files are ignored)"""
+        if self._cache_dir is None:
+            return
+        for suffix in ('.feather', '.json'):
+            (self._cache_dir / f"{cache_key}{suffix}").unlink(missing_ok=True)
+    
+    def _evict_cache(self, max_age_s: int = PIPELINE_CACHE_MAX_AGE_SECONDS,
+                     max_bytes: int = PIPELINE_CACHE_MAX_BYTES) -> int:
+        """
+        Drop cache entries older than max_age_s, then the oldest entries until
+        the directory fits in max_bytes
+        
+        Returns:
+            Number of entries removed
+        """
+        if self._cache_dir is None or not self._cache_dir.exists():
+            return 0
+        # cache_key -> [mtime, total bytes]
+        entries: Dict[str, List[float]] = {}
+        for path in self._cache_dir.iterdir():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entry = entries.setdefault(path.stem, [stat.st_mtime, 0])
+            entry[0] = min(entry[0], stat.st_mtime)
+            entry[1] += stat.st_size
+        
+        cutoff = time.time() - max_age_s
+        total_bytes = sum(size for _, size in entries.values())
+        removed = 0
+        for cache_key, (mtime, size) in sorted(entries.items(), key=lambda kv: kv[1][0]):
+            if mtime >= cutoff and total_bytes <= max_bytes:
+                break
+            self._remove_cache_entry(cache_key)
+            total_bytes -= size
+            removed += 1
+        return removed
+    
+    def _load_cached_preprocessing(self, context: PipelineContext) -> Optional[Tuple[pd.DataFrame, Dict, Dict]]:
+        """Return (preprocessed frame, profile, validation results) from a previous run, if cached"""
+        cache_key = None
+        try:
+            cache_key = self._cache_key(context)
+            context.metadata['cache_key'] = cache_key
+            cache_dir = self._ensure_cache_dir()
+            frame_path = cache_dir / f"{cache_key}.feather"
+            meta_path = cache_dir / f"{cache_key}.json"
+            if not (frame_path.exists() and meta_path.exists()):
+                return None
+            
+            cached = json.loads(meta_path.read_text())
+            validation = cached["validation"]
+            df_processed = pd.read_feather(frame_path)
+        except Exception as e:
+            # A broken cache entry only costs us the normal pipeline run
+            self.logger.log_error(e, {"session_id": context.session_id}, "pipeline_cache_read")
+            if cache_key:
+                self._remove_cache_entry(cache_key)
+            return None
+        
+        self.logger.log_event("pipeline_cache_hit", {
+            "session_id": context.session_id,
+            "cache_key": cache_key,
+            "rows": len(df_processed)
+        })
+        return df_processed, cached.get("profile", {}), validation
+    
+    def _store_cached_preprocessing(self, context: PipelineContext, df_processed: pd.DataFrame,
+                                    profile: Dict, validation_results: Dict):
+        """Persist the preprocessed frame, profile and validation results for retries (best effort)"""
+        cache_key = context.metadata.get('cache_key')
+        if not cache_key:
+            return
+        try:
+            cache_dir = self._ensure_cache_dir()
+            # Feather requires a default RangeIndex; sanitization may have dropped rows
+            df_processed.reset_index(drop=True).to_feather(
+                cache_dir / f"{cache_key}.feather", compression='lz4'
+            )
+            (cache_dir / f"{cache_key}.json").write_text(json.dumps({
+                "profile": profile,
+                "validation": validation_results
+            }, default=str))
+            self._evict_cache()
+        except Exception as e:
+            self.logger.log_error(e, {"session_id": context.session_id}, "pipeline_cache_write")
+            self._remove_cache_entry(cache_key)
+    
+    def _apply_cached_validation(self, context: PipelineContext, results: Dict) -> bool:
+        """Replay stored validation results onto the context; returns is_valid"""
+        context.data_quality_score = results.get("quality_score", 0.0)
+        for warning in results.get("warnings", []):
+            context.warnings.append({
+                "stage": "validation",
+                "check": warning["check"],
+                "message": warning["message"]
+            })
+        return not results.get("failed")
     
     @stage_wrapper(PipelineStage.VALIDATION)
     def validate_data(self, context: PipelineContext, df: pd.DataFrame) -> Tuple[bool, Dict]:
@@ -291,7 +558,7 @@ class EnterprisePipelineOrchestrator:
         Returns:
             Error response dictionary
         """
-        self.logger.log_error(error, context.to_dict(), "pipeline_execution")
+        self.logger.log_error(error, context, "pipeline_execution")
         
         return {
             "success": False,
@@ -314,7 +581,7 @@ class EnterprisePipelineOrchestrator:
         Returns:
             Error response dictionary
         """
-        self.logger.log_error(error, context.to_dict(), "unexpected_error")
+        self.logger.log_error(error, context, "unexpected_error")
         
         return {
             "success": False,
@@ -329,31 +596,20 @@ class EnterprisePipelineOrchestrator:
     @stage_wrapper(PipelineStage.INGESTION)
     def _ingest_data(self, context: PipelineContext) -> pd.DataFrame:
         """Ingest data from file"""
-        import io
-        
         ext = context.file_path.split('.')[-1].lower()
         
         try:
-            if ext in ['csv', 'tsv']:
-                sep = '\t' if ext == 'tsv' else ','
-                for encoding in ['utf-8', 'latin-1', 'cp1252', 'ISO-8859-1']:
-                    try:
-                        df = pd.read_csv(context.file_path, sep=sep, encoding=encoding)
-                        self.logger.log_event("data_ingested", {
-                            "session_id": context.session_id,
-                            "encoding": encoding,
-                            "rows": len(df),
-                            "columns": len(df.columns)
-                        })
-                        return df
-                    except UnicodeDecodeError:
-                        continue
-                raise ValueError("Could not decode file")
-            elif ext in ['xlsx', 'xls']:
-                df = pd.read_excel(context.file_path)
-                return df
-            else:
+            reader = self._readers.get(ext)
+            if reader is None:
                 raise ValueError(f"Unsupported format: {ext}")
+            df, encoding = reader(context.file_path)
+            self.logger.log_event("data_ingested", {
+                "session_id": context.session_id,
+                "encoding": encoding,
+                "rows": len(df),
+                "columns": len(df.columns)
+            })
+            return df
         except Exception as e:
             raise PipelineError(
                 f"Failed to ingest data: {str(e)}",
@@ -364,12 +620,23 @@ class EnterprisePipelineOrchestrator:
     
     @stage_wrapper(PipelineStage.SANITIZATION)
     def _sanitize_data(self, context: PipelineContext, df: pd.DataFrame) -> pd.DataFrame:
-        """Clean and sanitize data"""
-        df_clean = df.copy()
-        df_clean = df_clean.dropna(how='all')
-        duplicates = df_clean.duplicated().sum()
+        """
+        Clean and sanitize data
+        
+        The input frame is consumed: dropna/drop_duplicates already return new
+        frames, so no defensive copy is taken and callers should use the result.
+        """
+        df_clean = df.dropna(how='all')
+        # drop_duplicates() already hashes every row; a separate duplicated().sum()
+        # probe would double that work, so derive the count from the length delta
+        rows_before = len(df_clean)
+        df_clean = df_clean.drop_duplicates()
+        duplicates = rows_before - len(df_clean)
         if duplicates > 0:
-            df_clean = df_clean.drop_duplicates()
+            self.logger.log_event("duplicates_removed", {
+                "session_id": context.session_id,
+                "rows_removed": duplicates
+            })
         return df_clean
     
     @stage_wrapper(PipelineStage.PROFILING)
@@ -380,18 +647,19 @@ class EnterprisePipelineOrchestrator:
             "columns": [],
             "data_quality": {}
         }
-        for col in df.columns:
+        # Column-wise reductions computed once for the whole frame
+        n_rows = max(len(df), 1)
+        missing = df.isna().sum()
+        numeric_stats = df.select_dtypes('number').agg(['mean', 'std']).round(2).to_dict()
+        for col, dtype in df.dtypes.items():
+            n_missing = int(missing[col])
             col_info = {
                 "name": col,
-                "dtype": str(df[col].dtype),
-                "missing": int(df[col].isna().sum()),
-                "missing_pct": round(df[col].isna().sum() / len(df) * 100, 2)
+                "dtype": str(dtype),
+                "missing": n_missing,
+                "missing_pct": round(n_missing / n_rows * 100, 2)
             }
-            if pd.api.types.is_numeric_dtype(df[col]):
-                col_info.update({
-                    "mean": round(float(df[col].mean()), 2),
-                    "std": round(float(df[col].std()), 2)
-                })
+            col_info.update(numeric_stats.get(col, {}))
             profile["columns"].append(col_info)
         return profile
     
@@ -405,12 +673,23 @@ class EnterprisePipelineOrchestrator:
     
     @stage_wrapper(PipelineStage.FEATURE_ENGINEERING)
     def _engineer_features(self, context: PipelineContext, df: pd.DataFrame) -> pd.DataFrame:
-        """Engineer features for ML models"""
-        df_features = df.copy()
+        """
+        Engineer features for ML models
+        
+        The input is never modified, but it is returned as-is (same object)
+        when lags already exist or there is no target column; copy the
+        result before mutating it.
+        """
+        if LAG_COLUMNS.issubset(df.columns):
+            # Already engineered (e.g. resumed pipeline) - nothing to add
+            return df
+        df_features = df
         target_col = context.column_mapping.get('target')
         if target_col and target_col in df_features.columns:
-            for lag in [1, 7, 14]:
-                df_features[f'lag_{lag}'] = df_features[target_col].shift(lag)
+            # assign() returns a new frame, so no up-front copy is needed
+            df_features = df_features.assign(**{
+                f'lag_{lag}': df_features[target_col].shift(lag) for lag in FEATURE_LAGS
+            })
             # Use bfill() instead of deprecated fillna(method='bfill')
             df_features = df_features.bfill().fillna(0)
         return df_features
@@ -424,10 +703,16 @@ class EnterprisePipelineOrchestrator:
         target_col = context.column_mapping.get('target', 'target')
         date_col = context.column_mapping.get('date', 'date')
         
+        # Single dtype snapshot shared by both fallbacks below
+        dtypes = features.dtypes.to_dict()
+        
         # Ensure columns exist in features
         if target_col not in features.columns:
             # Try to find a numeric column as fallback
-            numeric_cols = features.select_dtypes(include='number').columns.tolist()
+            numeric_cols = [
+                col for col, dtype in dtypes.items()
+                if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+            ]
             if numeric_cols:
                 target_col = numeric_cols[0]
                 self.logger.log_event("column_fallback", {
@@ -444,7 +729,10 @@ class EnterprisePipelineOrchestrator:
         
         if date_col not in features.columns:
             # Try to find a datetime column as fallback
-            date_cols = features.select_dtypes(include=['datetime64']).columns.tolist()
+            date_cols = [
+                col for col, dtype in dtypes.items()
+                if pd.api.types.is_datetime64_dtype(dtype)
+            ]
             if date_cols:
                 date_col = date_cols[0]
             else:
@@ -539,7 +827,8 @@ class EnterprisePipelineOrchestrator:
         try:
             forecast_result = ensemble.predict(periods=30, confidence_level=0.95)
             
-            # Extract forecast data
+            # Rounded in NumPy, then one tolist() per array so the response
+            # holds plain floats/strings that jsonable_encoder can handle
             dates = []
             predictions = []
             lower_bound = []
@@ -548,14 +837,20 @@ class EnterprisePipelineOrchestrator:
             if hasattr(forecast_result, 'forecast_df') and forecast_result.forecast_df is not None:
                 fdf = forecast_result.forecast_df
                 dates = fdf['ds'].dt.strftime('%Y-%m-%d').tolist() if 'ds' in fdf.columns else []
-                predictions = fdf['yhat'].round(2).tolist() if 'yhat' in fdf.columns else []
-                lower_bound = fdf['yhat_lower'].round(2).tolist() if 'yhat_lower' in fdf.columns else []
-                upper_bound = fdf['yhat_upper'].round(2).tolist() if 'yhat_upper' in fdf.columns else []
+                predictions = fdf['yhat'].to_numpy().round(2).tolist() if 'yhat' in fdf.columns else []
+                lower_bound = fdf['yhat_lower'].to_numpy().round(2).tolist() if 'yhat_lower' in fdf.columns else []
+                upper_bound = fdf['yhat_upper'].to_numpy().round(2).tolist() if 'yhat_upper' in fdf.columns else []
+            elif hasattr(forecast_result, 'predictions'):
+                # ForecastResult from EnsembleForecaster.predict
+                dates = forecast_result.date_strings().tolist()
+                predictions = forecast_result.predictions.round(2).tolist()
+                lower_bound = forecast_result.lower_bound.round(2).tolist()
+                upper_bound = forecast_result.upper_bound.round(2).tolist()
             elif isinstance(forecast_result, dict):
-                dates = forecast_result.get('dates', [])
-                predictions = forecast_result.get('predictions', [])
-                lower_bound = forecast_result.get('lower_bound', [])
-                upper_bound = forecast_result.get('upper_bound', [])
+                dates = np.asarray(forecast_result.get('dates', [])).tolist()
+                predictions = np.asarray(forecast_result.get('predictions', [])).tolist()
+                lower_bound = np.asarray(forecast_result.get('lower_bound', [])).tolist()
+                upper_bound = np.asarray(forecast_result.get('upper_bound', [])).tolist()
             
             # Get model comparison
             model_comparison = {}
@@ -600,13 +895,34 @@ class EnterprisePipelineOrchestrator:
                         progress_callback=None) -> Dict:
         """Execute full pipeline with comprehensive error handling"""
         try:
-            df = self._ingest_data(context)
-            is_valid, validation_results = self.validate_data(context, df)
-            if not is_valid:
-                return self.handle_validation_failure(context, validation_results)
-            df_clean = self._sanitize_data(context, df)
-            profile = self._profile_data(context, df_clean)
-            df_processed = self._preprocess_data(context, df_clean)
+            cached = self._load_cached_preprocessing(context)
+            if cached is not None:
+                # Retry / re-upload of identical bytes: the stored validation
+                # results stand in for validate_data, and the cached frame was
+                # sanitized and preprocessed before it was written
+                df_processed, profile, validation_results = cached
+                if not self._apply_cached_validation(context, validation_results):
+                    return self.handle_validation_failure(context, validation_results)
+            else:
+                df = self._ingest_data(context)
+                is_valid, validation_results = self.validate_data(context, df)
+                if not is_valid:
+                    return self.handle_validation_failure(context, validation_results)
+                df_clean = self._sanitize_data(context, df)
+                # Profiling only reads the frame, so it can overlap with preprocessing.
+                # The adapter relabels columns in place, hence the shallow copy.
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    profile_future = executor.submit(self._profile_data, context, df_clean)
+                    preprocess_future = executor.submit(
+                        self._preprocess_data, context, df_clean.copy(deep=False)
+                    )
+                # Both stages set context.current_stage from their own thread; pin
+                # it once both are done so errors report the stage that failed
+                context.current_stage = PipelineStage.PROFILING
+                profile = profile_future.result()
+                context.current_stage = PipelineStage.PREPROCESSING
+                df_processed = preprocess_future.result()
+                self._store_cached_preprocessing(context, df_processed, profile, validation_results)
             features = self._engineer_features(context, df_processed)
             models = self._train_models(context, features, progress_callback)
             ensemble_results = self._create_ensemble(context, models)
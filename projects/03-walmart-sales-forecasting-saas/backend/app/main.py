@@ -1,12 +1,16 @@
 
 import os
+import time
+import asyncio
 import logging
 from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Dict, Optional
 from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import JSONResponse
 from app.config import settings
+from app.middleware.cors import FrozenOriginCORSMiddleware
+from app.utils.static_files import CachedStaticFiles, compress_variants, encoded_response
 
 # Configure logging
 logging.basicConfig(
@@ -15,6 +19,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Request handlers only enqueue log records; stderr writes happen on a listener thread
+from app.utils.structured_logger import queue_logger_handlers
+queue_logger_handlers(logging.getLogger())
+queue_logger_handlers(logging.getLogger("uvicorn.access"))
+
 # Startup and shutdown events
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -47,9 +56,27 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"⚠️ Maintenance cleanup failed: {e}")
     
+    # Cache and precompress the SPA shell and bundles before the first request
+    if _load_index_html() is not None:
+        logger.info("📄 Cached frontend index.html")
+    if assets_app is not None:
+        try:
+            logger.info(f"📦 Precompressed {assets_app.preload()} static assets")
+        except Exception as e:
+            logger.warning(f"⚠️ Static asset preload failed: {e}")
+    
+    # Sample psutil off the request path
+    metrics_task = asyncio.create_task(_refresh_system_metrics_loop())
+    
     yield
     
     # Shutdown
+    metrics_task.cancel()
+    try:
+        from app.core.pipeline_orchestrator import orchestrator
+        orchestrator.shutdown()
+    except Exception as e:
+        logger.warning(f"⚠️ Pipeline orchestrator shutdown failed: {e}")
     logger.info("👋 Shutting down...")
 
 app = FastAPI(
@@ -61,34 +88,47 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-# CORS Configuration
-origins = settings.ALLOWED_ORIGINS + [
+def _system_health() -> dict:
+    """Build the /health payload, reporting degraded instead of raising"""
+    try:
+        from app.services.maintenance import maintenance_service
+        return maintenance_service.check_system_health()
+    except Exception as e:
+        logger.error(f"Health check failed: {e}")
+        return {
+            "status": "degraded", 
+            "error": str(e),
+            "version": settings.VERSION
+        }
+
+# Health probes skip routing; registered before CORS so CORS wraps it and the
+# frontend's health check still gets Access-Control-Allow-Origin. The /health
+# routes below remain for docs.
+from app.middleware.health_fast_path import HealthFastPathMiddleware
+app.add_middleware(HealthFastPathMiddleware, paths=("/health", "/api/health"), build_payload=_system_health)
+
+# CORS Configuration (deduplicated; matched as a frozenset by the middleware)
+origins = list(dict.fromkeys(settings.ALLOWED_ORIGINS + [
     "http://127.0.0.1:3000",
     "http://127.0.0.1:5173", 
     "http://127.0.0.1:5174"
-]
+]))
 
 app.add_middleware(
-    CORSMiddleware,
+    FrozenOriginCORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-from starlette.middleware.sessions import SessionMiddleware
-app.add_middleware(SessionMiddleware, secret_key=settings.SECRET_KEY)
+# Sessions are only used by the OAuth flow
+from app.middleware.scoped_session import ScopedSessionMiddleware
+app.add_middleware(ScopedSessionMiddleware, path_prefix="/api/auth", secret_key=settings.SECRET_KEY)
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    logger.info(f"👉 Request: {request.method} {request.url} | Origin: {request.headers.get('origin')}")
-    try:
-        response = await call_next(request)
-        logger.info(f"👈 Response: {response.status_code}")
-        return response
-    except Exception as e:
-        logger.error(f"❌ Request failed: {str(e)}")
-        raise e
+# Request logging (pure ASGI, added last so it wraps CORS and sessions)
+from app.middleware.request_logger import RequestLogMiddleware
+app.add_middleware(RequestLogMiddleware)
 
 # Include routers
 from app.api import auth, dashboard, sales, forecasts, analysis, monitoring, data_pipeline, oauth, error_handler
@@ -120,10 +160,14 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
     await manager.connect(websocket, session_id, user_id)
     try:
         while True:
-            # Keep connection alive and handle incoming messages (e.g. pings)
-            data = await websocket.receive_text()
-            # Optional: handle client messages
+            # Client messages (e.g. pings) are unused: take the raw ASGI
+            # message instead of decoding text, and stop on disconnect
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(websocket, session_id, user_id)
 app.include_router(error_handler.router, tags=["Error Handling"])
 
@@ -134,22 +178,47 @@ app.include_router(reports.router, prefix="/api/reports", tags=["Reporting"])
 # Mount static files (Frontend)
 # Try to find the static directory relative to the current file or working directory
 static_dir = os.path.join(os.getcwd(), "app/static")
+
+# The SPA shell never changes at runtime: read it once, let browsers revalidate
+SPA_SHELL_HEADERS = {"Cache-Control": "no-cache, must-revalidate"}
+_INDEX_HTML_VARIANTS: Optional[Dict[str, bytes]] = None
+assets_app: Optional[CachedStaticFiles] = None
+
+
+def _load_index_html() -> Optional[Dict[str, bytes]]:
+    """Read and precompress index.html into the module-level cache (None if not built)"""
+    global _INDEX_HTML_VARIANTS
+    index_path = os.path.join(static_dir, "index.html")
+    if os.path.exists(index_path):
+        with open(index_path, "rb") as f:
+            _INDEX_HTML_VARIANTS = compress_variants(f.read())
+    return _INDEX_HTML_VARIANTS
+
 if os.path.exists(static_dir):
     # Mount assets specifically (Vite build output)
-    app.mount("/assets", StaticFiles(directory=os.path.join(static_dir, "assets")), name="assets")
+    assets_app = CachedStaticFiles(directory=os.path.join(static_dir, "assets"))
+    app.mount("/assets", assets_app, name="assets")
+
+    # Outermost middleware: hashed bundles bypass the rest of the stack
+    from app.middleware.static_fast_path import StaticFastPathMiddleware
+    app.add_middleware(StaticFastPathMiddleware, prefix="/assets", static_app=assets_app)
     
     # Catch-all route for SPA
     @app.get("/{full_path:path}")
-    async def serve_spa(full_path: str):
+    async def serve_spa(full_path: str, request: Request):
         # Allow API routes to pass through (though they should be matched above)
         if full_path.startswith("api"):
              return JSONResponse(status_code=404, content={"detail": "API endpoint not found"})
         
-        # Serve index.html for all other routes
-        index_path = os.path.join(static_dir, "index.html")
-        if os.path.exists(index_path):
-            with open(index_path, "r") as f:
-                return HTMLResponse(content=f.read())
+        # Serve the cached index.html for all other routes
+        index_html = _INDEX_HTML_VARIANTS if _INDEX_HTML_VARIANTS is not None else _load_index_html()
+        if index_html is not None:
+            return encoded_response(
+                index_html,
+                request.headers.get("accept-encoding", ""),
+                headers=SPA_SHELL_HEADERS,
+                media_type="text/html"
+            )
         return JSONResponse(status_code=404, content={"detail": "Frontend not found"})
 else:
     logger.warning(f"Static directory not found at {static_dir}. Frontend will not be served.")
@@ -168,45 +237,64 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint with system metrics (Task 5.2)"""
-    try:
-        from app.services.maintenance import maintenance_service
-        return maintenance_service.check_system_health()
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return {
-            "status": "degraded", 
-            "error": str(e),
-            "version": settings.VERSION
-        }
+    return _system_health()
 
 @app.get("/api/health")
 async def health_check_alias():
     return await health_check()
 
+
+# Latest psutil snapshot, refreshed by a background task started in lifespan
+SYSTEM_METRICS_REFRESH_SECONDS = 5.0
+_SYSTEM_METRICS: dict = {}
+
+
+def _collect_system_metrics() -> dict:
+    """Sample CPU, memory and disk usage (blocks for the CPU sampling window)"""
+    try:
+        import psutil
+        return {
+            "cpu_percent": psutil.cpu_percent(interval=0.5),
+            "memory_percent": psutil.virtual_memory().percent,
+            "disk_percent": psutil.disk_usage('/').percent
+        }
+    except Exception:
+        return {"error": "psutil not available"}
+
+
+async def _refresh_system_metrics_loop():
+    """Keep _SYSTEM_METRICS current without blocking the event loop"""
+    global _SYSTEM_METRICS
+    while True:
+        _SYSTEM_METRICS = await asyncio.to_thread(_collect_system_metrics)
+        await asyncio.sleep(SYSTEM_METRICS_REFRESH_SECONDS)
+
+
+# ISO timestamp memoized per wall-clock second: (epoch second, formatted string)
+_LAST_TIMESTAMP = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO-8601 at one-second resolution"""
+    global _LAST_TIMESTAMP
+    sec = int(time.time())
+    if sec != _LAST_TIMESTAMP[0]:
+        _LAST_TIMESTAMP = (sec, datetime.utcfromtimestamp(sec).isoformat())
+    return _LAST_TIMESTAMP[1]
+
+
 @app.get("/api/health/detailed")
 async def detailed_health_check():
     """Detailed health check with circuit breaker states and pipeline info"""
-    import psutil
-    import os
-    
     health_data = {
         "status": "operational",
         "version": settings.VERSION,
         "environment": settings.ENVIRONMENT,
-        "timestamp": __import__('datetime').datetime.utcnow().isoformat(),
-        "system": {}
+        "timestamp": _utc_timestamp(),
+        # Snapshot from the background sampler (empty until its first pass)
+        "system": _SYSTEM_METRICS or {"status": "collecting"}
     }
     
-    # System metrics
-    try:
-        health_data["system"] = {
-            "cpu_percent": psutil.cpu_percent(interval=0.1),
-            "memory_percent": psutil.virtual_memory().percent,
-            "disk_percent": psutil.disk_usage('/').percent
-        }
-    except Exception:
-        health_data["system"] = {"error": "psutil not available"}
-    
     # Circuit breaker states
     try:
         from app.utils.circuit_breaker import ml_training_breaker, data_profiling_breaker, database_breaker
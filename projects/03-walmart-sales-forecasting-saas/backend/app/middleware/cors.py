@@ -0,0 +1,19 @@
+"""
+CORS Middleware
+Starlette's CORSMiddleware with constant-time origin matching
+"""
+
+from starlette.middleware.cors import CORSMiddleware
+
+
+class FrozenOriginCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware whose exact-origin allow list is a frozenset
+
+    The stock middleware keeps allow_origins as a list and does a linear
+    `origin in list` scan on every request that carries an Origin header.
+    """
+
+    def __init__(self, app, **kwargs):
+        super().__init__(app, **kwargs)
+        self.allow_origins = frozenset(self.allow_origins)
@@ -0,0 +1,66 @@
+"""
+Health Check Fast Path
+Answers health probes without routing (payload may be up to 5 s stale)
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, FrozenSet, Iterable
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.utils.structured_logger import dumps
+
+# How long a computed health payload is served before it is refreshed
+HEALTH_REFRESH_SECONDS = 5.0
+
+
+class HealthFastPathMiddleware:
+    """
+    Serve GET requests for exact health paths from a memoized JSON body
+
+    The payload builder runs at most once per refresh interval, in a worker
+    thread so psutil calls never block the event loop; every other probe in
+    between gets the same pre-encoded bytes.
+    """
+
+    def __init__(self, app: ASGIApp, paths: Iterable[str],
+                 build_payload: Callable[[], Dict[str, Any]],
+                 refresh_seconds: float = HEALTH_REFRESH_SECONDS):
+        self.app = app
+        self.paths: FrozenSet[str] = frozenset(paths)
+        self.build_payload = build_payload
+        self.refresh_seconds = refresh_seconds
+        self._body = b""
+        self._expires_at = 0.0
+        self._refresh_lock = asyncio.Lock()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "GET" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        body = await self._get_body()
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"cache-control", b"no-store"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def _get_body(self) -> bytes:
+        """Return the cached payload, rebuilding it once it has expired"""
+        if time.monotonic() < self._expires_at:
+            return self._body
+
+        async with self._refresh_lock:
+            # Another probe may have refreshed while we waited
+            if time.monotonic() >= self._expires_at:
+                payload = await asyncio.to_thread(self.build_payload)
+                self._body = dumps(payload).encode("utf-8")
+                self._expires_at = time.monotonic() + self.refresh_seconds
+        return self._body
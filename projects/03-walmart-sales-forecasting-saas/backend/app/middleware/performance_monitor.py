@@ -5,57 +5,70 @@ Tracks request duration, memory usage, and error rates
 
 import time
 import logging
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from app.utils.memory_optimizer import memory_optimizer
 
 logger = logging.getLogger(__name__)
 
 
-class PerformanceMonitoringMiddleware(BaseHTTPMiddleware):
+class PerformanceMonitoringMiddleware:
     """
     Monitor API performance and resource usage
+
+    Implemented as plain ASGI middleware (rather than BaseHTTPMiddleware) so
+    no Request/Response objects or extra task group are created per request;
+    timing headers are injected into the http.response.start message.
     """
-    
-    async def dispatch(self, request: Request, call_next):
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Start timing
-        start_time = time.time()
-        
+        start_time = time.perf_counter()
+
         # Get initial memory
         initial_memory = memory_optimizer.get_memory_usage()
-        
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                # Calculate duration
+                duration = time.perf_counter() - start_time
+
+                # Get final memory
+                final_memory = memory_optimizer.get_memory_usage()
+                memory_delta = final_memory['rss_mb'] - initial_memory['rss_mb']
+
+                # Log performance metrics
+                logger.info(
+                    f"Request: {scope['method']} {scope['path']} | "
+                    f"Duration: {duration:.2f}s | "
+                    f"Memory: {final_memory['rss_gb']:.2f}GB (Δ {memory_delta:+.1f}MB) | "
+                    f"Status: {message['status']}"
+                )
+
+                # Check memory limits
+                memory_optimizer.check_memory_limit()
+
+                # Add performance headers
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Response-Time", f"{duration:.3f}s")
+                headers.append("X-Memory-Usage", f"{final_memory['rss_gb']:.2f}GB")
+
+            await send(message)
+
         # Process request
         try:
-            response = await call_next(request)
-            
-            # Calculate duration
-            duration = time.time() - start_time
-            
-            # Get final memory
-            final_memory = memory_optimizer.get_memory_usage()
-            memory_delta = final_memory['rss_mb'] - initial_memory['rss_mb']
-            
-            # Log performance metrics
-            logger.info(
-                f"Request: {request.method} {request.url.path} | "
-                f"Duration: {duration:.2f}s | "
-                f"Memory: {final_memory['rss_gb']:.2f}GB (Δ {memory_delta:+.1f}MB) | "
-                f"Status: {response.status_code}"
-            )
-            
-            # Check memory limits
-            memory_optimizer.check_memory_limit()
-            
-            # Add performance headers
-            response.headers["X-Response-Time"] = f"{duration:.3f}s"
-            response.headers["X-Memory-Usage"] = f"{final_memory['rss_gb']:.2f}GB"
-            
-            return response
-            
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             logger.error(
-                f"Request FAILED: {request.method} {request.url.path} | "
+                f"Request FAILED: {scope['method']} {scope['path']} | "
                 f"Duration: {duration:.2f}s | "
                 f"Error: {str(e)}"
             )
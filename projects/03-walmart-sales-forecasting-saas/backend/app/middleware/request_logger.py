@@ -0,0 +1,50 @@
+"""
+Request Logging Middleware
+Logs method, path, origin and response status for every HTTP request
+"""
+
+import logging
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class RequestLogMiddleware:
+    """
+    Pure ASGI request logger
+
+    Reads everything it needs from the ASGI scope and the
+    http.response.start message, so no Request object is built. Per-request
+    lines are logged at DEBUG and skipped entirely (no string formatting)
+    unless that level is enabled; failures are always logged.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if not logger.isEnabledFor(logging.DEBUG):
+            try:
+                await self.app(scope, receive, send)
+            except Exception as e:
+                logger.error(f"❌ Request failed: {scope['method']} {scope['path']} | {str(e)}")
+                raise
+            return
+
+        origin = dict(scope["headers"]).get(b"origin", b"").decode("latin-1") or None
+        logger.debug(f"👉 Request: {scope['method']} {scope['path']} | Origin: {origin}")
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                logger.debug(f"👈 Response: {message['status']}")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            logger.error(f"❌ Request failed: {scope['method']} {scope['path']} | {str(e)}")
+            raise
@@ -0,0 +1,30 @@
+"""
+Path-Scoped Session Middleware
+Applies cookie sessions only to the routes that use them
+"""
+
+from typing import Any
+
+from starlette.middleware.sessions import SessionMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class ScopedSessionMiddleware:
+    """
+    Run Starlette's SessionMiddleware only under a path prefix
+
+    Only the OAuth flow (/api/auth) reads request.session, so every other
+    request skips the signed-cookie decode and the extra send wrapper.
+    """
+
+    def __init__(self, app: ASGIApp, path_prefix: str, **session_kwargs: Any):
+        self.app = app
+        self.path_prefix = path_prefix
+        self.session_app = SessionMiddleware(app, **session_kwargs)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] in ("http", "websocket") and scope["path"].startswith(self.path_prefix):
+            await self.session_app(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,32 @@
+"""
+Static Asset Fast Path
+Serves a static mount directly, ahead of the rest of the middleware stack
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class StaticFastPathMiddleware:
+    """
+    Short-circuit requests under a path prefix to a static ASGI app
+
+    Added as the outermost middleware so hashed bundle requests (e.g.
+    /assets/*) skip CORS, sessions, request logging and performance
+    monitoring, whose per-request Python overhead dwarfs the file I/O.
+    """
+
+    def __init__(self, app: ASGIApp, prefix: str, static_app: ASGIApp):
+        self.app = app
+        self.prefix = prefix.rstrip("/")
+        self.static_app = static_app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http" and scope["path"].startswith(self.prefix + "/"):
+            # Same scope shape a Mount would hand to the static app
+            child_scope = dict(scope)
+            child_scope["path"] = scope["path"][len(self.prefix):]
+            child_scope["root_path"] = scope.get("root_path", "") + self.prefix
+            await self.static_app(child_scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
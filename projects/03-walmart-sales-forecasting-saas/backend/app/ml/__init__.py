@@ -1,45 +1,47 @@
 # ML Models Package
-from app.ml.base_model import BaseForecaster
-from app.ml.prophet_model import ProphetForecaster
-from app.ml.xgboost_model import XGBoostForecaster
-from app.ml.sarima_model import SARIMAForecaster
-from app.ml.ensemble_model import EnsembleForecaster
-from app.ml.dynamic_ensemble import DynamicEnsemble
-
-# New ML Fixes (from New Changes analysis)
-from app.ml.feature_engineering import TimeSeriesFeatureEngineer
-from app.ml.data_imputer import MarkdownImputer, GeneralImputer, DataPreprocessor
-from app.ml.sales_processor import SalesReturnsSeparator, ReturnsPredictionModel
-from app.ml.hyperparameter_optimizer import TimeSeriesHyperparameterOptimizer
-from app.ml.model_monitor import ModelMonitor, DriftMetrics, PerformanceTracker
-
-# Business Optimization Modules
-from app.ml.store_clustering import StoreClusteringStrategy
-from app.ml.promotional_analyzer import PromotionalROIAnalyzer
-
-__all__ = [
+#
+# Components are imported lazily on first attribute access (PEP 562), so
+# `from app.ml.base_model import ...` or a single `from app.ml import X`
+# no longer pulls in Prophet, XGBoost, statsmodels, etc. all at once.
+import importlib
+
+_LAZY_IMPORTS = {
     # Core Models
-    'BaseForecaster',
-    'ProphetForecaster', 
-    'XGBoostForecaster',
-    'SARIMAForecaster',
-    'EnsembleForecaster',
-    'DynamicEnsemble',
-    
-    # ML Fixes
-    'TimeSeriesFeatureEngineer',
-    'MarkdownImputer',
-    'GeneralImputer', 
-    'DataPreprocessor',
-    'SalesReturnsSeparator',
-    'ReturnsPredictionModel',
-    'TimeSeriesHyperparameterOptimizer',
-    'ModelMonitor',
-    'DriftMetrics',
-    'PerformanceTracker',
-    
-    # Business Optimization
-    'StoreClusteringStrategy',
-    'PromotionalROIAnalyzer',
-]
+    'BaseForecaster': 'app.ml.base_model',
+    'ProphetForecaster': 'app.ml.prophet_model',
+    'XGBoostForecaster': 'app.ml.xgboost_model',
+    'SARIMAForecaster': 'app.ml.sarima_model',
+    'EnsembleForecaster': 'app.ml.ensemble_model',
+    'DynamicEnsemble': 'app.ml.dynamic_ensemble',
+
+    # New ML Fixes (from New Changes analysis)
+    'TimeSeriesFeatureEngineer': 'app.ml.feature_engineering',
+    'MarkdownImputer': 'app.ml.data_imputer',
+    'GeneralImputer': 'app.ml.data_imputer',
+    'DataPreprocessor': 'app.ml.data_imputer',
+    'SalesReturnsSeparator': 'app.ml.sales_processor',
+    'ReturnsPredictionModel': 'app.ml.sales_processor',
+    'TimeSeriesHyperparameterOptimizer': 'app.ml.hyperparameter_optimizer',
+    'ModelMonitor': 'app.ml.model_monitor',
+    'DriftMetrics': 'app.ml.model_monitor',
+    'PerformanceTracker': 'app.ml.model_monitor',
+
+    # Business Optimization Modules
+    'StoreClusteringStrategy': 'app.ml.store_clustering',
+    'PromotionalROIAnalyzer': 'app.ml.promotional_analyzer',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
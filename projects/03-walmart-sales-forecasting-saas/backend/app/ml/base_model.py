@@ -2,28 +2,139 @@
 Base Forecaster - Abstract base class for all ML models
 """
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import pandas as pd
 import numpy as np
 from datetime import datetime
 import logging
+import math
+import re
 
 logger = logging.getLogger(__name__)
 
+# Forecast date labels that can be stored as datetime64[D]
+_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# MAPE upper edges (exclusive) for each accuracy rating; anything above is "Poor"
+MAPE_RATING_EDGES = (5, 10, 20, 30)
+MAPE_RATINGS = ("Excellent", "Very Good", "Good", "Fair", "Poor")
+
+
+def _metrics_kernel(actual: np.ndarray, predicted: np.ndarray) -> Tuple[float, float, float, float, int]:
+    """
+    Accumulate the sums behind MAPE, RMSE, MAE and R² in one fused loop
+
+    Returns:
+        (ss_res, ss_tot, sum_abs_error, sum_abs_pct_error, nonzero_count)
+    """
+    n = actual.shape[0]
+    mean = 0.0
+    for i in range(n):
+        mean += actual[i]
+    mean = mean / n if n else 0.0
+    
+    ss_res = 0.0
+    ss_tot = 0.0
+    sum_abs = 0.0
+    sum_ape = 0.0
+    nonzero = 0
+    for i in range(n):
+        diff = actual[i] - predicted[i]
+        abs_diff = abs(diff)
+        dev = actual[i] - mean
+        ss_res += diff * diff
+        ss_tot += dev * dev
+        sum_abs += abs_diff
+        if actual[i] != 0:
+            sum_ape += abs_diff / abs(actual[i])
+            nonzero += 1
+    return ss_res, ss_tot, sum_abs, sum_ape, nonzero
+
+
+if NUMBA_AVAILABLE:
+    # Reassociation lets LLVM vectorize the reductions; NaN semantics are kept
+    _metrics_kernel = njit(cache=True, fastmath={"reassoc", "contract", "arcp"})(_metrics_kernel)
+
+
+# Candidate datetime64 units for forecast dates, coarsest first
+_DATE_UNITS = ('D', 'm', 's')
+
+
+def _coarsest_exact_unit(dates: np.ndarray) -> np.ndarray:
+    """Cast datetime64 values to the coarsest unit in _DATE_UNITS that loses nothing"""
+    valid = ~np.isnat(dates)
+    for unit in _DATE_UNITS:
+        cast = dates.astype(f'datetime64[{unit}]')
+        if (cast[valid] == dates[valid]).all():
+            return cast
+    return dates
+
 
 @dataclass
 class ForecastResult:
-    """Standardized forecast result structure"""
-    dates: List[str]
-    predictions: List[float]
-    lower_bound: List[float]
-    upper_bound: List[float]
+    """
+    Standardized forecast result structure
+    
+    Series fields accept any sequence and are stored as NumPy arrays
+    (dates as datetime64 when they parse as dates: [D] when every value is
+    midnight, else the coarsest unit that keeps them exact); call to_json_dict()
+    at the API boundary to get plain lists.
+    """
+    dates: np.ndarray
+    predictions: np.ndarray
+    lower_bound: np.ndarray
+    upper_bound: np.ndarray
     model_type: str
     confidence_level: float
     metrics: Dict[str, float]
     training_time: float
     feature_importance: Optional[Dict[str, float]] = None
+    
+    def __post_init__(self):
+        dates = np.asarray(self.dates)
+        if dates.dtype.kind != 'M' and dates.size and all(_ISO_DATE.match(str(d)) for d in dates.flat):
+            try:
+                # Unit inferred from the labels, so times of day are kept
+                dates = dates.astype('datetime64')
+            except (TypeError, ValueError):
+                pass
+        if dates.dtype.kind == 'M':
+            dates = _coarsest_exact_unit(dates)
+        else:
+            # Non-date labels (e.g. period indices) are kept as strings
+            dates = dates.astype(str)
+        self.dates = dates
+        self.predictions = np.asarray(self.predictions, dtype=np.float64)
+        self.lower_bound = np.asarray(self.lower_bound, dtype=np.float64)
+        self.upper_bound = np.asarray(self.upper_bound, dtype=np.float64)
+    
+    def date_strings(self) -> np.ndarray:
+        """Dates as ISO strings ('YYYY-MM-DD' for daily data, with the time otherwise)"""
+        if np.issubdtype(self.dates.dtype, np.datetime64):
+            return np.datetime_as_string(self.dates)
+        return self.dates
+    
+    def to_json_dict(self) -> Dict[str, Any]:
+        """Convert to JSON-serializable builtins (one tolist() per array)"""
+        return {
+            'dates': self.date_strings().tolist(),
+            'predictions': self.predictions.tolist(),
+            'lower_bound': self.lower_bound.tolist(),
+            'upper_bound': self.upper_bound.tolist(),
+            'model_type': self.model_type,
+            'confidence_level': self.confidence_level,
+            'metrics': self.metrics,
+            'training_time': self.training_time,
+            'feature_importance': self.feature_importance
+        }
 
 
 @dataclass
@@ -74,48 +185,61 @@ class BaseForecaster(ABC):
         target_col: str = 'sales',
         date_col: str = 'date'
     ) -> pd.DataFrame:
-        """Prepare and clean data for training"""
-        df = df.copy()
+        """
+        Prepare and clean data for training
         
-        # Ensure date column is datetime
+        Sorting and de-duplication are resolved as row positions first and
+        applied with a single take(), so the caller's frame is copied once
+        rather than once per step, and never mutated.
+        """
         if date_col in df.columns:
-            df[date_col] = pd.to_datetime(df[date_col])
-            df = df.sort_values(date_col)
+            dates = pd.to_datetime(df[date_col]).array
+            
+            # Keep the last row per date (in input order), then order by date
+            positions = np.flatnonzero(~pd.Series(dates).duplicated(keep='last').to_numpy())
+            if not pd.Index(dates).is_monotonic_increasing:
+                positions = positions[dates[positions].argsort(kind='stable')]
+            
+            df = df.take(positions)
+            df[date_col] = dates[positions]
+        else:
+            df = df.copy()
         
         # Handle missing values
         if target_col in df.columns:
-            # Use forward fill to prevent data leakage (respects time order)
-            df[target_col] = df[target_col].ffill()
-            # If any remaining NaNs at the start, fill with 0 or the first valid value
-            df[target_col] = df[target_col].fillna(0)
-        
-        # Remove duplicates
-        if date_col in df.columns:
-            df = df.drop_duplicates(subset=[date_col], keep='last')
+            # Use forward fill to prevent data leakage (respects time order);
+            # any remaining NaNs at the start are filled with 0
+            df[target_col] = df[target_col].ffill().fillna(0)
         
         return df
     
     def create_features(self, df: pd.DataFrame, date_col: str = 'date') -> pd.DataFrame:
         """Create time-based features for modeling"""
-        df = df.copy()
-        
         if date_col not in df.columns:
-            return df
+            return df.copy()
             
-        df[date_col] = pd.to_datetime(df[date_col])
+        dates = pd.to_datetime(df[date_col])
         
-        # Time-based features
-        df['day_of_week'] = df[date_col].dt.dayofweek
-        df['day_of_month'] = df[date_col].dt.day
-        df['month'] = df[date_col].dt.month
-        df['quarter'] = df[date_col].dt.quarter
-        df['year'] = df[date_col].dt.year
-        df['week_of_year'] = df[date_col].dt.isocalendar().week.astype(int)
-        df['is_weekend'] = (df['day_of_week'] >= 5).astype(int)
-        df['is_month_start'] = df[date_col].dt.is_month_start.astype(int)
-        df['is_month_end'] = df[date_col].dt.is_month_end.astype(int)
+        # Time-based features: read every field off one DatetimeIndex and
+        # store them as small integers (calendar values fit in int8/int16).
+        # Missing dates need NaN, so they fall back to float32.
+        idx = pd.DatetimeIndex(dates)
+        small_int, year_int = (np.float32, np.float32) if idx.hasnans else (np.int8, np.int16)
+        day_of_week = idx.dayofweek.to_numpy()
         
-        return df
+        # assign() returns a new frame, so the caller's frame is left untouched
+        return df.assign(**{
+            date_col: dates,
+            'day_of_week': day_of_week.astype(small_int),
+            'day_of_month': idx.day.to_numpy().astype(small_int),
+            'month': idx.month.to_numpy().astype(small_int),
+            'quarter': idx.quarter.to_numpy().astype(small_int),
+            'year': idx.year.to_numpy().astype(year_int),
+            'week_of_year': idx.isocalendar().week.to_numpy(dtype=np.float32, na_value=np.nan).astype(small_int),
+            'is_weekend': (day_of_week >= 5).astype(np.int8),
+            'is_month_start': idx.is_month_start.astype(np.int8),
+            'is_month_end': idx.is_month_end.astype(np.int8)
+        })
     
     def create_lag_features(
         self, 
@@ -124,17 +248,29 @@ class BaseForecaster(ABC):
         lags: List[int] = [1, 7, 14, 30]
     ) -> pd.DataFrame:
         """Create lag features for time series modeling"""
-        df = df.copy()
+        values = df[target_col].to_numpy(dtype=np.float64)
+        n = len(values)
+        features: Dict[str, np.ndarray] = {}
         
         for lag in lags:
-            df[f'lag_{lag}'] = df[target_col].shift(lag)
+            shifted = np.full(n, np.nan, dtype=np.float32)
+            if lag < n:
+                shifted[lag:] = values[:n - lag]
+            features[f'lag_{lag}'] = shifted
         
-        # Rolling statistics
+        # Rolling statistics over strided window views (NaN until a window is full)
         for window in [7, 14, 30]:
-            df[f'rolling_mean_{window}'] = df[target_col].rolling(window=window).mean()
-            df[f'rolling_std_{window}'] = df[target_col].rolling(window=window).std()
+            rolling_mean = np.full(n, np.nan, dtype=np.float32)
+            rolling_std = np.full(n, np.nan, dtype=np.float32)
+            if window <= n:
+                windows = np.lib.stride_tricks.sliding_window_view(values, window)
+                rolling_mean[window - 1:] = windows.mean(axis=1)
+                rolling_std[window - 1:] = windows.std(axis=1, ddof=1)
+            features[f'rolling_mean_{window}'] = rolling_mean
+            features[f'rolling_std_{window}'] = rolling_std
         
-        return df
+        # float32 halves the feature block and is what XGBoost trains on anyway
+        return df.assign(**features)
     
     def calculate_metrics(
         self, 
@@ -142,45 +278,46 @@ class BaseForecaster(ABC):
         predicted: np.ndarray
     ) -> Dict[str, float]:
         """Calculate forecast accuracy metrics"""
-        actual = np.array(actual)
-        predicted = np.array(predicted)
-        
-        # Filter out zeros to avoid division errors
-        mask = actual != 0
+        # asarray avoids copying inputs that are already float64 arrays
+        actual = np.asarray(actual, dtype=np.float64)
+        predicted = np.asarray(predicted, dtype=np.float64)
         
-        # MAPE
-        if mask.sum() > 0:
-            mape = np.mean(np.abs((actual[mask] - predicted[mask]) / actual[mask])) * 100
+        n = len(actual)
+        if NUMBA_AVAILABLE and n:
+            # Single compiled pass over both arrays
+            ss_res, ss_tot, sum_abs, sum_ape, nonzero = _metrics_kernel(actual, predicted)
+            mape = sum_ape / nonzero * 100 if nonzero else 0.0
+            mae = sum_abs / n
         else:
-            mape = 0.0
-        
-        # RMSE
-        rmse = np.sqrt(np.mean((actual - predicted) ** 2))
+            # Shared residuals: one subtraction feeds MAPE, RMSE, MAE and R²
+            diff = actual - predicted
+            abs_diff = np.abs(diff)
+            ss_res = float(np.dot(diff, diff))
+            
+            # MAPE (filter out zeros to avoid division errors)
+            mask = actual != 0
+            if mask.any():
+                mape = float(np.mean(abs_diff[mask] / np.abs(actual[mask]))) * 100
+            else:
+                mape = 0.0
+            
+            mae = float(abs_diff.mean()) if n else float('nan')
+            dev = actual - actual.mean() if n else actual
+            ss_tot = float(np.dot(dev, dev))
         
-        # MAE
-        mae = np.mean(np.abs(actual - predicted))
+        rmse = math.sqrt(ss_res / n) if n else float('nan')
         
         # R²
-        ss_res = np.sum((actual - predicted) ** 2)
-        ss_tot = np.sum((actual - np.mean(actual)) ** 2)
         r2 = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
         
         return {
-            'mape': float(round(mape, 2)),
-            'rmse': float(round(rmse, 2)),
-            'mae': float(round(mae, 2)),
-            'r2': float(round(max(0, min(1, r2)), 4))  # Clamp between 0 and 1
+            'mape': round(mape, 2),
+            'rmse': round(rmse, 2),
+            'mae': round(mae, 2),
+            'r2': round(max(0.0, min(1.0, float(r2))), 4)  # Clamp between 0 and 1
         }
     
     def get_accuracy_rating(self, mape: float) -> str:
         """Get human-readable accuracy rating based on MAPE"""
-        if mape < 5:
-            return "Excellent"
-        elif mape < 10:
-            return "Very Good"
-        elif mape < 20:
-            return "Good"
-        elif mape < 30:
-            return "Fair"
-        else:
-            return "Poor"
+        # bisect_right keeps each edge exclusive (e.g. MAPE 5.0 is "Very Good")
+        return MAPE_RATINGS[bisect_right(MAPE_RATING_EDGES, mape)]
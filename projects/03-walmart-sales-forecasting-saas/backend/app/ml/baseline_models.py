@@ -1,16 +1,373 @@
 
 import pandas as pd
 import numpy as np
+import math
 import time
 import logging
-from typing import Dict, List, Optional
-from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
 
 from app.ml.base_model import BaseForecaster, ForecastResult, TrainingMetrics
 
 logger = logging.getLogger(__name__)
 
-class NaiveForecaster(BaseForecaster):
+try:
+    from numba import njit, prange, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+# Added to MAPE / R² denominators so zero sales (or a flat series) don't divide by zero
+EPSILON = 1e-6
+
+# Below this many observations the vectorized NumPy paths are as fast as the
+# numba kernels, and short trainings never trigger a JIT compile
+NUMBA_MIN_SAMPLES = 1000
+
+# Reassociation lets LLVM vectorize the reductions; NaN semantics are kept
+_FASTMATH = {"reassoc", "contract", "arcp"}
+
+
+def _target_values(series: pd.Series) -> np.ndarray:
+    """
+    Target column as a float array, without copying when already float
+    
+    float32 columns stay float32 (half the memory traffic in the kernels);
+    other dtypes are converted to float64.
+    """
+    if series.dtype in (np.float32, np.float64):
+        return series.to_numpy()
+    return series.to_numpy(dtype=np.float64)
+
+
+def _use_numba(n_samples: int) -> bool:
+    """Whether a workload of n_samples observations should go to the numba kernels"""
+    return NUMBA_AVAILABLE and n_samples >= NUMBA_MIN_SAMPLES
+
+
+def _regression_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> Tuple[float, float, float, float, float, float]:
+    """
+    (mape, rmse, mae, r2, sum_c, sum_c_sq) of y_pred against y_true, in one pass
+    
+    Shared by both baseline forecasters. sum_c / sum_c_sq are the sum and
+    sum of squares of y_true - y_true[0]; they give ss_tot here (centering
+    keeps a single pass accurate for large sales values) and let callers
+    derive the series standard deviation without another pass.
+    """
+    n = y_true.shape[0]
+    if n < 1:
+        return np.nan, np.nan, np.nan, np.nan, 0.0, 0.0
+    
+    shift = y_true[0]
+    sum_abs = 0.0
+    sum_sq = 0.0
+    sum_ape = 0.0
+    sum_y = 0.0
+    sum_y_sq = 0.0
+    for i in range(n):
+        y = y_true[i]
+        diff = y - y_pred[i]
+        sum_abs += abs(diff)
+        sum_sq += diff * diff
+        sum_ape += abs(diff / (y + EPSILON))
+        centered = y - shift
+        sum_y += centered
+        sum_y_sq += centered * centered
+    
+    ss_tot = sum_y_sq - sum_y * sum_y / n
+    return (
+        sum_ape / n * 100,
+        math.sqrt(sum_sq / n),
+        sum_abs / n,
+        1 - sum_sq / (ss_tot + EPSILON),
+        sum_y,
+        sum_y_sq
+    )
+
+
+def _regression_metrics_numpy(y_true: np.ndarray, y_pred: np.ndarray) -> Tuple[float, float, float, float, float, float]:
+    """NumPy equivalent of _regression_metrics for when numba is not installed"""
+    if len(y_true) == 0:
+        return np.nan, np.nan, np.nan, np.nan, 0.0, 0.0
+    diff = y_true - y_pred
+    mape = np.mean(np.abs(diff / (y_true + EPSILON))) * 100
+    rmse = np.sqrt(np.mean(diff ** 2))
+    mae = np.mean(np.abs(diff))
+    
+    # R2 score
+    ss_res = np.sum(diff ** 2)
+    ss_tot = np.sum((y_true - np.mean(y_true)) ** 2)
+    r2 = 1 - (ss_res / (ss_tot + EPSILON))
+    
+    centered = y_true - y_true[0]
+    return mape, rmse, mae, r2, float(centered.sum()), float(np.dot(centered, centered))
+
+
+def _fit_stats(head: np.ndarray, y_true: np.ndarray, y_pred: np.ndarray) -> Tuple[float, float, float, float, float]:
+    """
+    In-sample metrics plus the sample std of the full series, head + y_true
+    
+    Args:
+        head: Leading observations that have no backtest prediction
+        y_true: Remaining observations
+        y_pred: Backtest predictions aligned with y_true
+        
+    Returns:
+        (mape, rmse, mae, r2, std); std matches Series.std() (ddof=1, NaN skipped)
+    """
+    metrics = _regression_metrics if _use_numba(len(y_true)) else _regression_metrics_numpy
+    mape, rmse, mae, r2, sum_c, sum_c_sq = metrics(y_true, y_pred)
+    
+    # Fold the (short) head into the centered accumulators
+    center = y_true[0] if len(y_true) else 0.0
+    head_c = head - center
+    n = len(head) + len(y_true)
+    sum_c += float(head_c.sum())
+    sum_c_sq += float(np.dot(head_c, head_c))
+    std = math.sqrt(max(sum_c_sq - sum_c * sum_c / n, 0.0) / (n - 1)) if n > 1 else np.nan
+    if math.isnan(std) and n > 1:
+        # A NaN target poisons the accumulators; Series.std() skips NaN
+        std = _nan_sample_std(np.concatenate((head, y_true)))
+    return mape, rmse, mae, r2, std
+
+
+def _nan_sample_std(x: np.ndarray) -> float:
+    """Sample std (ddof=1) over the non-NaN values; NaN when fewer than two remain"""
+    n_valid = x.shape[0] - np.count_nonzero(np.isnan(x))
+    return float(np.nanstd(x, ddof=1)) if n_valid > 1 else np.nan
+
+
+def _series_std(x: np.ndarray) -> float:
+    """Sample std (ddof=1, NaN skipped) of the target, for intervals when metrics are skipped"""
+    return _nan_sample_std(x)
+
+
+def _rolling_mean_shift1(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing mean of the previous `window` values: out[i] = mean(x[i - window:i])
+    
+    Equivalent to Series.rolling(window).mean().shift(1) but computed with a
+    running sum (one add and one subtract per step). Entries before the first
+    full window, or whose window contains a NaN, are NaN.
+    """
+    n = x.shape[0]
+    out = np.empty(n)
+    out[:min(window, n)] = np.nan
+    
+    window_sum = 0.0
+    nan_count = 0
+    for i in range(min(window, n)):
+        if np.isnan(x[i]):
+            nan_count += 1
+        else:
+            window_sum += x[i]
+    
+    for i in range(window, n):
+        out[i] = window_sum / window if nan_count == 0 else np.nan
+        entering = x[i]
+        leaving = x[i - window]
+        if np.isnan(entering):
+            nan_count += 1
+        else:
+            window_sum += entering
+        if np.isnan(leaving):
+            nan_count -= 1
+        else:
+            window_sum -= leaving
+    return out
+
+
+def _rolling_mean_shift1_numpy(x: np.ndarray, window: int) -> np.ndarray:
+    """Vectorized _rolling_mean_shift1 (NaN windows propagate through the mean)"""
+    out = np.full(x.shape[0], np.nan)
+    if x.shape[0] > window:
+        windows = np.lib.stride_tricks.sliding_window_view(x[:-1], window)
+        out[window:] = windows.mean(axis=1)
+    return out
+
+
+def _nan_sample_std_loop(x: np.ndarray) -> float:
+    """Loop form of _nan_sample_std for the numba batch kernel (two passes)"""
+    n_valid = 0
+    total = 0.0
+    for v in x:
+        if not np.isnan(v):
+            n_valid += 1
+            total += v
+    if n_valid < 2:
+        return np.nan
+    mean = total / n_valid
+    sum_sq = 0.0
+    for v in x:
+        if not np.isnan(v):
+            sum_sq += (v - mean) * (v - mean)
+    return math.sqrt(sum_sq / (n_valid - 1))
+
+
+def _batch_ma_stats(X: np.ndarray, window: int) -> np.ndarray:
+    """
+    Moving-average fit statistics for many series at once
+    
+    Args:
+        X: (n_series, n_time) float64 targets, one date-ordered series per row
+        window: Moving average window
+        
+    Returns:
+        (n_series, 6) array of [last_window_mean, mape, rmse, mae, r2, std]
+        per row, matching what MovingAverageForecaster.train computes
+    """
+    n_series = X.shape[0]
+    n_time = X.shape[1]
+    out = np.empty((n_series, 6))
+    for s in prange(n_series):
+        row = X[s]
+        out[s, 0] = np.nanmean(row[max(n_time - window, 0):])
+        
+        y_pred = _rolling_mean_shift1(row, window)[window:]
+        y_true = row[window:]
+        if np.isnan(row).any():
+            # Same NaN-window mask and NaN-skipping std as train()
+            valid = ~np.isnan(y_pred)
+            n_valid = np.count_nonzero(valid)
+            mape, rmse, mae, r2, _, _ = _regression_metrics(y_true[valid], y_pred[valid])
+            std = _nan_sample_std_loop(row)
+        else:
+            n_valid = y_true.shape[0]
+            mape, rmse, mae, r2, sum_c, sum_c_sq = _regression_metrics(y_true, y_pred)
+            # Same head folding as _fit_stats
+            center = y_true[0] if n_valid > 0 else 0.0
+            for i in range(min(window, n_time)):
+                c = row[i] - center
+                sum_c += c
+                sum_c_sq += c * c
+            if n_time > 1:
+                std = math.sqrt(max(sum_c_sq - sum_c * sum_c / n_time, 0.0) / (n_time - 1))
+            else:
+                std = np.nan
+        if n_valid == 0:
+            mape, rmse, mae, r2 = 0.0, 0.0, 0.0, 0.0
+        
+        out[s, 1] = mape
+        out[s, 2] = rmse
+        out[s, 3] = mae
+        out[s, 4] = r2
+        out[s, 5] = std
+    return out
+
+
+def _batch_ma_stats_numpy(X: np.ndarray, window: int) -> np.ndarray:
+    """Row-by-row equivalent of _batch_ma_stats for when numba is not installed"""
+    # One pandas rolling pass over all series (columns) at once
+    y_pred = pd.DataFrame(X.T).rolling(window=window).mean().shift(1).to_numpy().T
+    out = np.empty((X.shape[0], 6))
+    for s in range(X.shape[0]):
+        row = X[s]
+        out[s, 0] = np.nanmean(row[-window:])
+        y_true = row[window:]
+        row_pred = y_pred[s, window:]
+        if np.isnan(row).any():
+            valid = ~np.isnan(row_pred)
+            y_true = y_true[valid]
+            out[s, 1:5] = _fit_stats(row[:0], y_true, row_pred[valid])[:4]
+            out[s, 5] = _series_std(row)
+        else:
+            out[s, 1:] = _fit_stats(row[:window], y_true, row_pred)
+        if len(y_true) == 0:
+            out[s, 1:5] = 0.0
+    return out
+
+
+if NUMBA_AVAILABLE:
+    # Explicit signature: compiled (or loaded from the on-disk cache) at import,
+    # so the first train() call doesn't pay JIT latency. Declared read-only
+    # because pandas may hand out read-only arrays (writable ones also match).
+    # float32 targets are consumed as-is (accumulators stay float64 inside).
+    _F8_ARRAY = types.Array(types.float64, 1, 'A', readonly=True)
+    _F4_ARRAY = types.Array(types.float32, 1, 'A', readonly=True)
+    _METRICS_RESULT = types.UniTuple(types.float64, 6)
+    _regression_metrics = njit(
+        [
+            _METRICS_RESULT(_F8_ARRAY, _F8_ARRAY),
+            _METRICS_RESULT(_F4_ARRAY, _F4_ARRAY),
+            _METRICS_RESULT(_F4_ARRAY, _F8_ARRAY),
+        ],
+        cache=True, fastmath=_FASTMATH
+    )(_regression_metrics)
+    # inline='always' only affects jitted callers: the specialized kernels
+    # below get the body with `window` folded in as a constant
+    _rolling_mean_shift1 = njit(cache=True, inline='always')(_rolling_mean_shift1)
+    _nan_sample_std_loop = njit(cache=True)(_nan_sample_std_loop)
+    # Compiled on first fit_many() call; series are spread across threads
+    _batch_ma_stats = njit(parallel=True, cache=True, fastmath=_FASTMATH)(_batch_ma_stats)
+
+
+def _make_rolling_mean_kernel(window: int):
+    """Rolling-mean kernel with `window` baked in, so LLVM can unroll the warm-up loop"""
+    def kernel(x):
+        return _rolling_mean_shift1(x, window)
+    # Closures can't use numba's on-disk cache; compiled on first use
+    return njit(kernel)
+
+
+# Window-specialized kernels for the common daily windows (week, fortnight, month)
+SPECIALIZED_WINDOWS = (7, 14, 30)
+_ROLLING_MEAN_KERNELS = (
+    {w: _make_rolling_mean_kernel(w) for w in SPECIALIZED_WINDOWS} if NUMBA_AVAILABLE else {}
+)
+
+
+def _rolling_mean_kernel(x: np.ndarray, window: int) -> np.ndarray:
+    """Numba rolling mean, using a window-specialized kernel when one exists"""
+    kernel = _ROLLING_MEAN_KERNELS.get(window)
+    if kernel is not None:
+        return kernel(x)
+    return _rolling_mean_shift1(x, window)
+
+
+class _BaselineForecaster(BaseForecaster):
+    """Shared plumbing for the constant-projection baseline forecasters"""
+    
+    def __init__(self, model_name: str):
+        super().__init__(model_name)
+        self.last_date = None
+        # ((last_date, periods), forecast dates) from the previous predict()
+        self._dates_cache: Optional[Tuple[Tuple, np.ndarray]] = None
+        # Training metrics as a plain dict, built once per train() for predict()
+        self._metrics_dict: Optional[Dict] = None
+    
+    @staticmethod
+    def _extract_arrays(df: pd.DataFrame, target_col: str, date_col: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pull the target and date columns out as date-ordered NumPy arrays
+        
+        Training works on these arrays only, so pandas is touched just for
+        the sortedness check and the two column extractions.
+        """
+        x = _target_values(df[target_col])
+        dates = df[date_col].to_numpy()
+        # Time-series input usually arrives sorted already
+        if not df[date_col].is_monotonic_increasing:
+            order = np.argsort(dates, kind='stable')
+            x = x[order]
+            dates = dates[order]
+        return x, dates
+    
+    def _forecast_dates(self, periods: int) -> np.ndarray:
+        """
+        Daily datetime64[D] dates following last_date, memoized for repeated predict() calls
+        
+        ForecastResult stores dates as datetime64[D] and only formats them at
+        the API boundary, so no strings are built (or re-parsed) here.
+        """
+        key = (self.last_date, periods)
+        if self._dates_cache is None or self._dates_cache[0] != key:
+            last_day = np.datetime64(self.last_date.date(), 'D')
+            dates = last_day + np.arange(1, periods + 1)
+            self._dates_cache = (key, dates)
+        return self._dates_cache[1]
+
+
+class NaiveForecaster(_BaselineForecaster):
     """
     Naive Forecaster - Predicts the last observed value.
     Best for: Very small datasets, random walks, or as a baseline.
@@ -19,33 +376,25 @@ class NaiveForecaster(BaseForecaster):
         super().__init__("Naive")
         self.last_value = None
         self.std_dev = None
-        self.last_date = None
 
-    def train(self, df: pd.DataFrame, target_col: str = 'sales', date_col: str = 'date', **kwargs) -> TrainingMetrics:
+    def train(self, df: pd.DataFrame, target_col: str = 'sales', date_col: str = 'date',
+              compute_metrics: bool = True, **kwargs) -> TrainingMetrics:
         start_time = time.time()
         
-        # Sort by date
-        df = df.sort_values(date_col)
+        x, dates = self._extract_arrays(df, target_col, date_col)
         
         # Simple training: just store the last value and stats
-        self.last_value = df[target_col].iloc[-1]
-        self.last_date = df[date_col].iloc[-1]
-        self.std_dev = df[target_col].std()
+        self.last_value = float(x[-1])
+        self.last_date = pd.Timestamp(dates[-1])
         
-        # Calculate in-sample metrics (naive forecast usually has high error on volatile data)
-        # Shift target by 1 to simulate "naive" prediction on historical data
-        y_true = df[target_col].iloc[1:].values
-        y_pred = df[target_col].iloc[:-1].values
-        
-        # Metrics
-        mape = np.mean(np.abs((y_true - y_pred) / (y_true + 1e-6))) * 100
-        rmse = np.sqrt(np.mean((y_true - y_pred)**2))
-        mae = np.mean(np.abs(y_true - y_pred))
-        
-        # R2 score
-        ss_res = np.sum((y_true - y_pred)**2)
-        ss_tot = np.sum((y_true - np.mean(y_true))**2)
-        r2 = 1 - (ss_res / (ss_tot + 1e-6))
+        if compute_metrics:
+            # Calculate in-sample metrics (naive forecast usually has high error on volatile data)
+            # Shift target by 1 to simulate "naive" prediction on historical data;
+            # the same pass yields the series std used for the intervals
+            mape, rmse, mae, r2, self.std_dev = _fit_stats(x[:1], x[1:], x[:-1])
+        else:
+            mape, rmse, mae, r2 = 0, 0, 0, 0
+            self.std_dev = _series_std(x)
         
         self.is_trained = True
         training_time = time.time() - start_time
@@ -55,10 +404,11 @@ class NaiveForecaster(BaseForecaster):
             rmse=round(float(rmse), 2),
             mae=round(float(mae), 2),
             r2=round(float(r2), 4),
-            training_samples=len(df),
+            training_samples=len(x),
             validation_samples=0, # No validation set for naive
             training_time_seconds=round(training_time, 4)
         )
+        self._metrics_dict = self.training_metrics.__dict__.copy()
         return self.training_metrics
 
     def predict(self, periods: int = 30, confidence_level: float = 0.95) -> ForecastResult:
@@ -66,22 +416,19 @@ class NaiveForecaster(BaseForecaster):
              raise ValueError("Model must be trained before prediction")
 
         start_time = time.time()
-        dates = []
-        preds = []
         
         # Constant prediction
-        current_date = pd.to_datetime(self.last_date)
-        for i in range(periods):
-            current_date += timedelta(days=1)
-            dates.append(current_date.strftime('%Y-%m-%d'))
-            preds.append(self.last_value)
+        dates = self._forecast_dates(periods)
+        preds = np.full(periods, self.last_value, dtype=np.float64)
             
-        # Confidence intervals based on historical volatility
+        # Confidence intervals based on historical volatility; the forecast
+        # is constant, so each bound is one scalar broadcast over the horizon
         z_score = 1.96 # Approx for 95%
         margin = z_score * self.std_dev
         
-        lower_bound = [max(0, p - margin) for p in preds] # Assuming non-negative sales
-        upper_bound = [p + margin for p in preds]
+        # Arrays go straight into ForecastResult; lists are built at the API boundary
+        lower_bound = np.full(periods, max(self.last_value - margin, 0.0)) # Assuming non-negative sales
+        upper_bound = np.full(periods, self.last_value + margin)
         
         return ForecastResult(
             dates=dates,
@@ -90,12 +437,12 @@ class NaiveForecaster(BaseForecaster):
             upper_bound=upper_bound,
             model_type=self.model_name,
             confidence_level=confidence_level * 100,
-            metrics=self.training_metrics.__dict__,
+            metrics=self._metrics_dict,
             training_time=time.time() - start_time
         )
 
 
-class MovingAverageForecaster(BaseForecaster):
+class MovingAverageForecaster(_BaselineForecaster):
     """
     Moving Average Forecaster - Predicts the average of the last N periods.
     Best for: Stable trends, smoothing noise.
@@ -105,41 +452,44 @@ class MovingAverageForecaster(BaseForecaster):
         self.window = window
         self.last_window_mean = None
         self.std_dev = None
-        self.last_date = None
 
-    def train(self, df: pd.DataFrame, target_col: str = 'sales', date_col: str = 'date', window: int = 7, **kwargs) -> TrainingMetrics:
+    def train(self, df: pd.DataFrame, target_col: str = 'sales', date_col: str = 'date', window: int = 7,
+              compute_metrics: bool = True, **kwargs) -> TrainingMetrics:
         start_time = time.time()
         self.window = window
         self.model_name = f"MovingAverage({window})"
         
-        df = df.sort_values(date_col)
+        x, dates = self._extract_arrays(df, target_col, date_col)
         
         # "Train" = Calculate stats
-        series = df[target_col]
-        self.last_window_mean = series.iloc[-self.window:].mean()
-        self.last_date = df[date_col].iloc[-1]
-        self.std_dev = series.std()
-        
-        # Calculate historical performance (Rolling Mean Shifted)
-        y_true = series.iloc[window:].values
-        y_pred = series.rolling(window=window).mean().shift(1).iloc[window:].values
+        self.last_window_mean = float(np.nanmean(x[-self.window:]))
+        self.last_date = pd.Timestamp(dates[-1])
         
-        # Clean NaNs from shift
-        valid_idx = ~np.isnan(y_pred)
-        y_true = y_true[valid_idx]
-        y_pred = y_pred[valid_idx]
-        
-        if len(y_true) == 0:
-             # Fallback if data too short
-             mape, rmse, mae, r2 = 0, 0, 0, 0
+        if compute_metrics:
+            # Calculate historical performance (Rolling Mean Shifted)
+            if _use_numba(len(x)):
+                y_pred_full = _rolling_mean_kernel(x, window)
+            else:
+                y_pred_full = _rolling_mean_shift1_numpy(x, window)
+            y_true = x[window:]
+            y_pred = y_pred_full[window:]
+            if np.isnan(x).any():
+                # NaN targets also blank every window they fall in; drop those
+                # pairs and take the std over the whole (NaN-skipping) series
+                valid = ~np.isnan(y_pred)
+                y_true = y_true[valid]
+                mape, rmse, mae, r2, _ = _fit_stats(x[:0], y_true, y_pred[valid])
+                self.std_dev = _series_std(x)
+            else:
+                # The shifted rolling mean is NaN exactly for the first `window`
+                # entries, so slicing replaces an isnan mask + two copies
+                mape, rmse, mae, r2, self.std_dev = _fit_stats(x[:window], y_true, y_pred)
+            if len(y_true) == 0:
+                 # Fallback if data too short
+                 mape, rmse, mae, r2 = 0, 0, 0, 0
         else:
-            mape = np.mean(np.abs((y_true - y_pred) / (y_true + 1e-6))) * 100
-            rmse = np.sqrt(np.mean((y_true - y_pred)**2))
-            mae = np.mean(np.abs(y_true - y_pred))
-            
-            ss_res = np.sum((y_true - y_pred)**2)
-            ss_tot = np.sum((y_true - np.mean(y_true))**2)
-            r2 = 1 - (ss_res / (ss_tot + 1e-6))
+            mape, rmse, mae, r2 = 0, 0, 0, 0
+            self.std_dev = _series_std(x)
 
         self.is_trained = True
         training_time = time.time() - start_time
@@ -149,34 +499,69 @@ class MovingAverageForecaster(BaseForecaster):
             rmse=round(float(rmse), 2),
             mae=round(float(mae), 2),
             r2=round(float(r2), 4),
-            training_samples=len(df),
+            training_samples=len(x),
             validation_samples=0,
             training_time_seconds=round(training_time, 4)
         )
+        self._metrics_dict = self.training_metrics.__dict__.copy()
         return self.training_metrics
 
+    @staticmethod
+    def fit_many(df_wide: pd.DataFrame, window: int = 7) -> Tuple[np.ndarray, np.ndarray, List[TrainingMetrics]]:
+        """
+        Fit one moving average per column of a wide frame in a single pass
+        
+        Args:
+            df_wide: Date-indexed frame with one series per column
+                     (e.g. one column per store/item)
+            window: Moving average window
+            
+        Returns:
+            (last_window_mean, std, metrics): per-column arrays and
+            TrainingMetrics, in df_wide column order. Forecasts for all
+            series are np.broadcast_to(last_window_mean[:, None], (n, periods)).
+        """
+        start_time = time.time()
+        if not df_wide.index.is_monotonic_increasing:
+            df_wide = df_wide.sort_index(kind='mergesort')
+        
+        # Row-major per series so each kernel iteration reads contiguous memory
+        X = np.ascontiguousarray(df_wide.to_numpy(dtype=np.float64).T)
+        batch_stats = _batch_ma_stats if _use_numba(X.size) else _batch_ma_stats_numpy
+        stats = batch_stats(X, window)
+        
+        training_time = (time.time() - start_time) / max(X.shape[0], 1)
+        metrics = [
+            TrainingMetrics(
+                mape=round(float(mape), 2),
+                rmse=round(float(rmse), 2),
+                mae=round(float(mae), 2),
+                r2=round(float(r2), 4),
+                training_samples=X.shape[1],
+                validation_samples=0,
+                training_time_seconds=round(training_time, 4)
+            )
+            for mape, rmse, mae, r2 in stats[:, 1:5]
+        ]
+        return stats[:, 0], stats[:, 5], metrics
+
     def predict(self, periods: int = 30, confidence_level: float = 0.95) -> ForecastResult:
         if not self.is_trained:
              raise ValueError("Model must be trained before prediction")
 
         start_time = time.time()
-        dates = []
-        preds = []
         
         # For simple Moving Average, we project the LAST calculated mean forward
         # (Recursive MA would converge to mean, but simple MA just projects the window)
-        current_date = pd.to_datetime(self.last_date)
-        for i in range(periods):
-            current_date += timedelta(days=1)
-            dates.append(current_date.strftime('%Y-%m-%d'))
-            preds.append(self.last_window_mean)
+        dates = self._forecast_dates(periods)
+        preds = np.full(periods, self.last_window_mean, dtype=np.float64)
             
-        # Confidence
+        # Confidence (scalar bounds, as for the naive forecast)
         z_score = 1.96
         margin = z_score * self.std_dev
         
-        lower_bound = [max(0, p - margin) for p in preds]
-        upper_bound = [p + margin for p in preds]
+        lower_bound = np.full(periods, max(self.last_window_mean - margin, 0.0))
+        upper_bound = np.full(periods, self.last_window_mean + margin)
         
         return ForecastResult(
             dates=dates,
@@ -185,6 +570,6 @@ class MovingAverageForecaster(BaseForecaster):
             upper_bound=upper_bound,
             model_type=self.model_name,
             confidence_level=confidence_level * 100,
-            metrics=self.training_metrics.__dict__,
+            metrics=self._metrics_dict,
             training_time=time.time() - start_time
         )
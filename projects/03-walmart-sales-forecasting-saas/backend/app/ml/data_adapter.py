@@ -8,21 +8,61 @@ Provides:
   - DataValidator: Lightweight validation checks.
   - UniversalDataAdapter: Orchestrates all of the above.
 
-Constraints: CPU-only, no GPU, no BERT. Pure Python + fuzzywuzzy.
+Constraints: CPU-only, no GPU, no BERT. Pure Python + RapidFuzz
+(falls back to fuzzywuzzy when RapidFuzz is not installed).
 
 Author: ForecastAI Team
 Date: 2026-02-13
 """
 import re
+import math
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+import warnings
+from collections import Counter, OrderedDict
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple, Any
 from dataclasses import dataclass, field
 
 import pandas as pd
 import numpy as np
+from pandas.api.types import is_bool_dtype, is_numeric_dtype, is_timedelta64_dtype
+from pandas.tseries.api import guess_datetime_format
 
 logger = logging.getLogger(__name__)
 
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Minimum fuzzy ratio (0-100) for a column to be mapped to a role
+FUZZY_SCORE_CUTOFF = 65
+
+# Names shorter than this skip the substring pass, and synonyms of at most
+# SHORT_SYNONYM_LEN characters only match whole "_"-separated name tokens
+MIN_SUBSTRING_LEN = 3
+SHORT_SYNONYM_LEN = 3
+
+# Normalized column names that suggest a date column
+DATE_NAME_HINTS = frozenset({
+    "date", "datetime", "timestamp", "ds", "time", "period",
+    "order_date", "sale_date", "transaction_date",
+    "report_date", "created_at", "calendar_date",
+})
+
+# Runs of whitespace, dashes and dots, collapsed to "_" when normalizing names
+_SEPARATOR_RE = re.compile(r"[\s\-.]+")
+
+# Rows per chunk when UniversalDataAdapter.adapt_csv streams a file
+CSV_CHUNK_ROWS = 256_000
+
+# Distinct normalized column names remembered by each SimpleColumnMatcher
+MATCH_CACHE_SIZE = 512
+
+# match_all only fans the fuzzy pass out over threads above this many
+# unmatched columns; below it thread startup costs more than the scoring
+PARALLEL_MATCH_MIN_COLUMNS = 16
+
 # ---------------------------------------------------------------------------
 # Constants – 200+ common column-name synonyms grouped by semantic role
 # ---------------------------------------------------------------------------
@@ -38,6 +78,7 @@ COLUMN_SYNONYMS: Dict[str, List[str]] = {
         "profit", "earnings", "sum", "price", "cost", "spend",
         "expenditure", "retail_sales", "warehouse_sales", "volume",
         "item_cnt_day", "cnt", "count",
+        "y",  # Prophet's target column (exact match only)
     ],
     # Date / Time
     "date": [
@@ -78,11 +119,71 @@ COLUMN_SYNONYMS: Dict[str, List[str]] = {
     ],
 }
 
+def _trigrams(text: str) -> Set[str]:
+    """All 3-character windows of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class _SynonymTables(NamedTuple):
+    """Lookup structures SimpleColumnMatcher derives from a synonym dict."""
+    index: Dict[str, str]                     # synonym -> role
+    keys: Tuple[str, ...]                     # synonyms, in dictionary order
+    roles: Tuple[str, ...]                    # role of each entry in keys
+    short_syns: Dict[str, int]                # token-match-only synonym -> position in keys
+    substring_keys: Tuple[str, ...]           # synonyms used for substring matching
+    substring_roles: Tuple[str, ...]
+    substring_ranks: Tuple[int, ...]          # position in keys of each substring_keys entry
+    trigram_index: Dict[str, FrozenSet[int]]  # trigram -> substring_keys positions containing it
+    leading_index: Dict[str, Tuple[int, ...]] # trigram -> substring_keys positions starting with it
+
+
+def _build_synonym_tables(synonyms: Dict[str, List[str]]) -> _SynonymTables:
+    """Flatten a role -> synonyms dict into the matcher's lookup tables."""
+    index: Dict[str, str] = {}
+    for role, syns in synonyms.items():
+        for syn in syns:
+            index[syn.lower().strip()] = role
+
+    # Very short synonyms ("ds", "sku", "cpi", ...) only match whole name
+    # tokens; as raw substrings they hit unrelated names ("goods", "discount")
+    short_syns = {
+        syn: rank for rank, syn in enumerate(index) if len(syn) <= SHORT_SYNONYM_LEN
+    }
+    substring_items = [
+        (rank, syn, role) for rank, (syn, role) in enumerate(index.items()) if syn not in short_syns
+    ]
+    substring_keys = tuple(syn for _, syn, _ in substring_items)
+
+    # Trigram side tables over the substring synonyms (by position, so the
+    # first synonym in dictionary order still wins)
+    trigram_lists: Dict[str, List[int]] = {}
+    leading_lists: Dict[str, List[int]] = {}
+    for pos, syn in enumerate(substring_keys):
+        for gram in _trigrams(syn):
+            trigram_lists.setdefault(gram, []).append(pos)
+        leading_lists.setdefault(syn[:3], []).append(pos)
+
+    return _SynonymTables(
+        index=index,
+        keys=tuple(index),
+        roles=tuple(index.values()),
+        short_syns=short_syns,
+        substring_keys=substring_keys,
+        substring_roles=tuple(role for _, _, role in substring_items),
+        substring_ranks=tuple(rank for rank, _, _ in substring_items),
+        trigram_index={gram: frozenset(p) for gram, p in trigram_lists.items()},
+        leading_index={gram: tuple(p) for gram, p in leading_lists.items()},
+    )
+
+
+# Tables for the built-in COLUMN_SYNONYMS, built once and shared by every
+# default SimpleColumnMatcher
+_DEFAULT_SYNONYM_TABLES = _build_synonym_tables(COLUMN_SYNONYMS)
+
 # Flattened reverse index: synonym -> canonical role
-_SYNONYM_INDEX: Dict[str, str] = {}
-for role, synonyms in COLUMN_SYNONYMS.items():
-    for syn in synonyms:
-        _SYNONYM_INDEX[syn.lower().strip()] = role
+_SYNONYM_INDEX: Dict[str, str] = _DEFAULT_SYNONYM_TABLES.index
+# Trigram -> positions of the (substring-eligible) synonyms containing it
+_SYNONYM_TRIGRAM_INDEX: Dict[str, FrozenSet[int]] = _DEFAULT_SYNONYM_TABLES.trigram_index
 
 
 # ---------------------------------------------------------------------------
@@ -117,71 +218,74 @@ class SimpleColumnMatcher:
     Match user-supplied column names to known semantic roles using:
       1. Exact match (lowered)
       2. Contains / substring match
-      3. Fuzzy ratio from fuzzywuzzy
+      3. Fuzzy ratio (RapidFuzz, or fuzzywuzzy as a fallback)
     """
 
     def __init__(self, synonyms: Optional[Dict[str, List[str]]] = None):
         self.synonyms = synonyms or COLUMN_SYNONYMS
-        # Build reverse index
-        self._index: Dict[str, str] = {}
-        for role, syns in self.synonyms.items():
-            for s in syns:
-                self._index[s.lower().strip()] = role
+        # The built-in synonyms' tables are shared; custom dicts get their own
+        tables = _DEFAULT_SYNONYM_TABLES if not synonyms else _build_synonym_tables(self.synonyms)
+        self._index = tables.index
+        self._synonym_keys = tables.keys
+        self._synonym_roles = tables.roles
+        self._short_syns = tables.short_syns
+        self._substring_keys = tables.substring_keys
+        self._substring_roles = tables.substring_roles
+        self._substring_ranks = tables.substring_ranks
+        self._trigram_index = tables.trigram_index
+        self._leading_index = tables.leading_index
+        # Per-instance LRU of normalized name -> (role, confidence); adapters
+        # see the same schemas over and over
+        self._match_cache: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
 
     def match(self, column_name: str) -> ColumnMapping:
         """Return best-effort mapping for a single column name."""
         clean = self._normalize(column_name)
-
-        # 1. Exact match
-        if clean in self._index:
-            return ColumnMapping(
-                original_name=column_name,
-                matched_role=self._index[clean],
-                confidence=1.0,
-                suggested_rename=self._index[clean],
-            )
-
-        # 2. Substring / contains check
-        for syn, role in self._index.items():
-            if syn in clean or clean in syn:
-                return ColumnMapping(
-                    original_name=column_name,
-                    matched_role=role,
-                    confidence=0.80,
-                    suggested_rename=role,
-                )
-
-        # 3. Fuzzy matching (best across all synonyms)
-        best_score = 0
-        best_role = None
-        try:
-            from fuzzywuzzy import fuzz
-            for syn, role in self._index.items():
-                score = fuzz.ratio(clean, syn) / 100.0
-                if score > best_score:
-                    best_score = score
-                    best_role = role
-        except ImportError:
-            logger.warning("fuzzywuzzy not installed – fuzzy matching disabled")
-
-        if best_score >= 0.65:
-            return ColumnMapping(
-                original_name=column_name,
-                matched_role=best_role,
-                confidence=round(best_score, 2),
-                suggested_rename=best_role,
-            )
-
-        # Unknown
-        return ColumnMapping(
-            original_name=column_name,
-            matched_role=None,
-            confidence=0.0,
-        )
+        result = self._cache_get(clean)
+        if result is None:
+            result = self._match_lexical(clean) or self._match_fuzzy(clean)
+            self._cache_put(clean, result)
+        return self._to_mapping(column_name, result)
 
     def match_all(self, columns: List[str]) -> List[ColumnMapping]:
         """Match every column; resolve conflicts (two cols mapping to same role)."""
-        raw_mappings = [self.match(col) for col in columns]
+        cleaned = [self._normalize(col) for col in columns]
+        results: List[Optional[Tuple[Optional[str], float]]] = []
+        pending: List[int] = []
+        for i, clean in enumerate(cleaned):
+            result = self._cache_get(clean)
+            if result is None:
+                result = self._match_lexical(clean)
+                if result is None:
+                    pending.append(i)
+                else:
+                    self._cache_put(clean, result)
+            results.append(result)
+
+        # Fuzzy pass for everything exact/substring matching missed
+        if pending:
+            pending_names = [cleaned[i] for i in pending]
+            if RAPIDFUZZ_AVAILABLE:
+                # One (columns x synonyms) similarity matrix, computed in C
+                # (across all cores, without the GIL, for wide frames)
+                workers = -1 if len(pending) > PARALLEL_MATCH_MIN_COLUMNS else 1
+                scores = process.cdist(
+                    pending_names, self._synonym_keys, scorer=fuzz.ratio,
+                    score_cutoff=FUZZY_SCORE_CUTOFF, dtype=np.float64, workers=workers,
+                )
+                best = scores.argmax(axis=1)  # first best synonym, as extractOne
+                best_scores = scores[np.arange(len(pending)), best]
+                fuzzy = [
+                    (self._synonym_roles[b], round(score / 100.0, 2)) if score >= FUZZY_SCORE_CUTOFF else (None, 0.0)
+                    for b, score in zip(best.tolist(), best_scores.tolist())
+                ]
+            else:
+                fuzzy = [self._match_fuzzy(name) for name in pending_names]
+            for i, result in zip(pending, fuzzy):
+                results[i] = result
+                self._cache_put(cleaned[i], result)
+
+        raw_mappings = [self._to_mapping(col, result) for col, result in zip(columns, results)]
 
         # Resolve conflicts: keep highest confidence per role
         role_best: Dict[str, ColumnMapping] = {}
@@ -201,12 +305,108 @@ class SimpleColumnMatcher:
 
         return raw_mappings
 
+    def _match_lexical(self, clean: str) -> Optional[Tuple[str, float]]:
+        """(role, confidence) from exact or substring matching, else None."""
+        # 1. Exact match
+        if clean in self._index:
+            return self._index[clean], 1.0
+
+        # One- or two-character names are contained in half the synonyms;
+        # leave them to the fuzzy pass
+        if len(clean) < MIN_SUBSTRING_LEN:
+            return None
+
+        # 2. Substring / contains check. Short synonyms count only as whole
+        # tokens ("cpi_index", not "discount"); whichever hit comes first in
+        # dictionary order wins, as in a plain scan over all synonyms
+        short_rank = min(
+            (self._short_syns[token] for token in clean.split("_") if token in self._short_syns),
+            default=len(self._synonym_keys),
+        )
+
+        # Long synonyms: trigram candidates only
+        grams = _trigrams(clean)
+        candidates: Set[int] = set()
+        # A synonym containing `clean` contains every trigram of it
+        postings = [self._trigram_index.get(gram) for gram in grams]
+        if all(postings):
+            candidates.update(frozenset.intersection(*postings))
+        # A synonym contained in `clean` starts at one of its trigrams
+        for gram in grams:
+            candidates.update(self._leading_index.get(gram, ()))
+        for pos in sorted(candidates):
+            syn = self._substring_keys[pos]
+            if syn in clean or clean in syn:
+                if self._substring_ranks[pos] < short_rank:
+                    return self._substring_roles[pos], 0.80
+                break
+        if short_rank < len(self._synonym_keys):
+            return self._synonym_roles[short_rank], 0.80
+        return None
+
+    def _match_fuzzy(self, clean: str) -> Tuple[Optional[str], float]:
+        """(role, confidence) of the best fuzzy synonym, or (None, 0.0)."""
+        # 3. Fuzzy matching (best across all synonyms)
+        best_score = 0
+        best_role = None
+        if RAPIDFUZZ_AVAILABLE:
+            # One C-level scan over every synonym instead of a Python loop
+            best = process.extractOne(
+                clean, self._synonym_keys, scorer=fuzz.ratio, score_cutoff=FUZZY_SCORE_CUTOFF
+            )
+            if best is not None:
+                best_score = best[1] / 100.0
+                best_role = self._synonym_roles[best[2]]
+        else:
+            try:
+                from fuzzywuzzy import fuzz as fw_fuzz
+                n = len(clean)
+                for syn, role in zip(self._synonym_keys, self._synonym_roles):
+                    # ratio() is at most 200*min(len)/(len sum); skip synonyms
+                    # whose length alone rules out the cutoff or current best,
+                    # as RapidFuzz's score_cutoff does internally
+                    bound = math.ceil(200 * min(n, len(syn)) / (n + len(syn))) / 100.0
+                    if bound < FUZZY_SCORE_CUTOFF / 100.0 or bound <= best_score:
+                        continue
+                    score = fw_fuzz.ratio(clean, syn) / 100.0
+                    if score > best_score:
+                        best_score = score
+                        best_role = role
+            except ImportError:
+                logger.warning("rapidfuzz/fuzzywuzzy not installed – fuzzy matching disabled")
+
+        if best_score >= FUZZY_SCORE_CUTOFF / 100.0:
+            return best_role, round(best_score, 2)
+
+        # Unknown
+        return None, 0.0
+
+    @staticmethod
+    def _to_mapping(column_name: str, result: Tuple[Optional[str], float]) -> ColumnMapping:
+        """Fresh ColumnMapping per call: match_all mutates the mappings it returns."""
+        role, confidence = result
+        return ColumnMapping(
+            original_name=column_name,
+            matched_role=role,
+            confidence=confidence,
+            suggested_rename=role,
+        )
+
+    def _cache_get(self, clean: str) -> Optional[Tuple[Optional[str], float]]:
+        result = self._match_cache.get(clean)
+        if result is not None:
+            self._match_cache.move_to_end(clean)
+        return result
+
+    def _cache_put(self, clean: str, result: Tuple[Optional[str], float]) -> None:
+        self._match_cache[clean] = result
+        if len(self._match_cache) > MATCH_CACHE_SIZE:
+            self._match_cache.popitem(last=False)
+
     @staticmethod
     def _normalize(name: str) -> str:
         """Lower, strip, replace common separators with underscore."""
-        name = name.lower().strip()
-        name = re.sub(r"[\s\-\.]+", "_", name)
-        return name
+        return _SEPARATOR_RE.sub("_", name.lower().strip())
 
 
 # ---------------------------------------------------------------------------
@@ -230,36 +430,48 @@ class SmartDateParser:
         r"\w+\s\d{1,2},?\s\d{4}",                   # Jan 15, 2020
         r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}",          # ISO 8601
     ]
+    # All of the above as one alternation, so the sample is scanned once
+    _COMBINED_PATTERN = re.compile("|".join(f"(?:{p})" for p in DATE_PATTERNS))
 
     def detect_date_column(self, df: pd.DataFrame) -> Optional[str]:
         """
         Auto-detect which column is the date column.
         Returns the column name or None.
         """
-        # Priority 1: Column already has datetime dtype
-        for col in df.columns:
-            if pd.api.types.is_datetime64_any_dtype(df[col]):
+        # One pass over the dtypes (metadata only) classifies every column;
+        # the first datetime-typed column wins outright
+        hint_cols: List[str] = []
+        text_cols: List[str] = []
+        for col, dtype in df.dtypes.items():
+            # Priority 1: Column already has datetime dtype
+            if pd.api.types.is_datetime64_any_dtype(dtype):
                 logger.info(f"Date column detected (dtype): '{col}'")
                 return col
+            if col.lower().strip().replace(" ", "_") in DATE_NAME_HINTS:
+                hint_cols.append(col)
+            if dtype == "object" or pd.api.types.is_string_dtype(dtype):
+                text_cols.append(col)
+
+        # Sample parsing is the expensive part: try each column at most once,
+        # in priority order
+        parse_ok: Dict[str, bool] = {}
+
+        def parses(col: str) -> bool:
+            if col not in parse_ok:
+                parse_ok[col] = self._try_parse(df[col])
+            return parse_ok[col]
 
         # Priority 2: Column name hints
-        date_hints = {
-            "date", "datetime", "timestamp", "ds", "time", "period",
-            "order_date", "sale_date", "transaction_date",
-            "report_date", "created_at", "calendar_date",
-        }
-        for col in df.columns:
-            if col.lower().strip().replace(" ", "_") in date_hints:
-                if self._try_parse(df[col]):
-                    logger.info(f"Date column detected (name hint): '{col}'")
-                    return col
+        for col in hint_cols:
+            if parses(col):
+                logger.info(f"Date column detected (name hint): '{col}'")
+                return col
 
         # Priority 3: Content sniffing – try parsing sample values
-        for col in df.columns:
-            if df[col].dtype == "object":
-                if self._try_parse(df[col]):
-                    logger.info(f"Date column detected (content): '{col}'")
-                    return col
+        for col in text_cols:
+            if parses(col):
+                logger.info(f"Date column detected (content): '{col}'")
+                return col
 
         # Priority 4: Year + Month synthesis
         year_col, month_col = self._find_year_month_components(df)
@@ -275,7 +487,9 @@ class SmartDateParser:
         create a synthetic Date column from Year + Month components.
         Returns (df, actual_date_col_name).
         """
-        df = df.copy()
+        # Shallow copy: only whole columns are (re)assigned below, so the
+        # caller's frame is untouched without duplicating every column
+        df = df.copy(deep=False)
 
         if date_col == "__synthesize__":
             year_col, month_col = self._find_year_month_components(df)
@@ -291,20 +505,52 @@ class SmartDateParser:
                     logger.warning(f"Date synthesis failed: {exc}")
             return df, date_col  # fallback
 
-        # Try pd.to_datetime with multiple formats
+        # Try pd.to_datetime with a format sniffed from a sample; an explicit
+        # format takes the fast strptime path, and cache=True parses each
+        # distinct string once (time series repeat dates across stores/items)
         try:
-            df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
+            date_format = self._sniff_format(df[date_col])
+            df[date_col] = pd.to_datetime(df[date_col], format=date_format, errors="coerce", cache=True)
         except Exception:
             try:
                 from dateutil import parser as dateutil_parser
-                df[date_col] = df[date_col].apply(
-                    lambda x: dateutil_parser.parse(str(x), fuzzy=True) if pd.notna(x) else pd.NaT
-                )
+                # Fuzzy-parse each distinct value once, then map back
+                values = df[date_col]
+                uniques = values.dropna().unique()
+                parsed = {v: dateutil_parser.parse(str(v), fuzzy=True) for v in uniques}
+                df[date_col] = pd.to_datetime(values.map(parsed))
             except Exception as exc:
                 logger.warning(f"Failed to parse dates in '{date_col}': {exc}")
 
         return df, date_col
 
+    def _sniff_format(self, series: pd.Series, sample_size: int = 20) -> Optional[str]:
+        """
+        Guess a strptime format from a sample of string values.
+
+        Returns the most common per-value guess if it parses at least 70% of
+        the sample, else None (pandas then infers from the first value).
+        """
+        if not (series.dtype == "object" or pd.api.types.is_string_dtype(series)):
+            return None
+        # Look at a bounded head so long columns aren't scanned for NaNs
+        sample = series.head(sample_size * 5).dropna().head(sample_size).astype(str)
+        if len(sample) == 0:
+            return None
+
+        with warnings.catch_warnings():
+            # dayfirst hints are expected for d/m/Y data
+            warnings.simplefilter("ignore", UserWarning)
+            guesses = Counter(
+                fmt for fmt in (guess_datetime_format(v) for v in sample.unique()) if fmt
+            )
+        if not guesses:
+            return None
+
+        date_format = guesses.most_common(1)[0][0]
+        parsed = pd.to_datetime(sample, format=date_format, errors="coerce")
+        return date_format if parsed.notna().mean() >= 0.7 else None
+
     # -- helpers --
     def _try_parse(self, series: pd.Series, sample_size: int = 20) -> bool:
         """Try to parse a sample of values as dates."""
@@ -312,11 +558,11 @@ class SmartDateParser:
         if len(sample) == 0:
             return False
 
-        # Quick regex pre-check
-        str_values = sample.astype(str)
-        regex_matches = 0
-        for pat in self.DATE_PATTERNS:
-            regex_matches += str_values.str.match(pat).sum()
+        # Quick regex pre-check (values matching any date pattern). A plain
+        # loop over the compiled alternation; the .str accessor costs more
+        # than the matching itself on a sample this small.
+        match = self._COMBINED_PATTERN.match
+        regex_matches = sum(1 for v in sample.astype(str).tolist() if match(v))
         if regex_matches > len(sample) * 0.5:
             return True
 
@@ -349,29 +595,37 @@ class DataShapeCorrector:
     Melts it into long format suitable for time-series modelling.
     """
 
-    # Month names for wide-format detection
-    MONTH_NAMES = {
-        "jan", "feb", "mar", "apr", "may", "jun",
-        "jul", "aug", "sep", "oct", "nov", "dec",
-        "january", "february", "march", "april", "may", "june",
-        "july", "august", "september", "october", "november", "december",
+    # Month names (full and 3-letter) for wide-format detection -> month number
+    MONTH_NUMBERS = {
+        name: number
+        for number, full in enumerate(
+            ["january", "february", "march", "april", "may", "june",
+             "july", "august", "september", "october", "november", "december"],
+            start=1,
+        )
+        for name in (full, full[:3])
     }
+    MONTH_NAMES = frozenset(MONTH_NUMBERS)
 
-    def needs_melt(self, df: pd.DataFrame) -> bool:
+    def month_columns(self, df: pd.DataFrame) -> List[str]:
+        """Original names of the month-like columns, in column order."""
+        return [c for c in df.columns if c.lower().strip() in self.MONTH_NAMES]
+
+    def needs_melt(self, df: pd.DataFrame, month_cols: Optional[List[str]] = None) -> bool:
         """Heuristic: if many columns look like months → wide format."""
-        col_names_lower = {c.lower().strip() for c in df.columns}
-        month_cols = col_names_lower & self.MONTH_NAMES
-        return len(month_cols) >= 4  # at least 4 month-like columns
+        if month_cols is None:
+            month_cols = self.month_columns(df)
+        distinct_months = {c.lower().strip() for c in month_cols}
+        return len(distinct_months) >= 4  # at least 4 month-like columns
 
-    def melt_wide(self, df: pd.DataFrame) -> pd.DataFrame:
+    def melt_wide(self, df: pd.DataFrame, month_cols: Optional[List[str]] = None) -> pd.DataFrame:
         """Convert wide-format (months as columns) to long format."""
-        col_names_lower = {c.lower().strip(): c for c in df.columns}
-        month_cols_original = [
-            col_names_lower[m] for m in col_names_lower if m in self.MONTH_NAMES
-        ]
+        if month_cols is None:
+            month_cols = self.month_columns(df)
 
         # ID columns = everything that's not a month column
-        id_cols = [c for c in df.columns if c not in month_cols_original]
+        month_set = set(month_cols)
+        id_cols = [c for c in df.columns if c not in month_set]
 
         if not id_cols:
             id_cols = None  # pandas will use index
@@ -379,10 +633,16 @@ class DataShapeCorrector:
         melted = pd.melt(
             df,
             id_vars=id_cols,
-            value_vars=month_cols_original,
+            value_vars=month_cols,
             var_name="Month_Name",
             value_name="sales",
         )
+        # A dozen labels repeated on every row: store them as int8 codes,
+        # ordered by calendar month
+        months_in_order = sorted(month_cols, key=lambda c: self.MONTH_NUMBERS[c.lower().strip()])
+        melted["Month_Name"] = pd.Categorical(
+            melted["Month_Name"], categories=months_in_order, ordered=True
+        )
 
         logger.info(
             f"Melted wide format: {len(df)} rows × {len(df.columns)} cols → "
@@ -403,11 +663,58 @@ class ValidationResult:
     severity: str = "info"  # info, warning, error
 
 
+def _strip_column_names(columns: pd.Index) -> pd.Index:
+    """str() and strip every column label in one vectorized NumPy pass."""
+    return pd.Index(np.char.strip(np.asarray(columns, dtype=str)))
+
+
+def _missing_count(df: pd.DataFrame) -> int:
+    """Number of missing cells, as one reduction over the boolean mask."""
+    return int(np.count_nonzero(df.isna().to_numpy()))
+
+
+def _duplicate_count(df: pd.DataFrame) -> int:
+    """
+    Number of rows that repeat an earlier row, counted on 64-bit row hashes.
+
+    hash_pandas_object hashes every column vectorized and combines them per
+    row, so counting distinct hashes avoids duplicated()'s multi-column
+    factorization (NaNs hash alike, as duplicated() treats them equal).
+    """
+    if df.empty:
+        return 0
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return len(row_hashes) - len(pd.unique(row_hashes))
+
+
+def _numeric_columns(df: pd.DataFrame) -> List[str]:
+    """
+    Columns select_dtypes(include=["number"]) would return, from one pass
+    over df.dtypes (numeric incl. nullable and timedelta, excluding bool).
+    """
+    return [
+        col for col, dtype in df.dtypes.items()
+        if (is_numeric_dtype(dtype) and not is_bool_dtype(dtype)) or is_timedelta64_dtype(dtype)
+    ]
+
+
 class DataValidator:
     """Lightweight data validation checks (no Pandera dependency)."""
 
-    def validate(self, df: pd.DataFrame) -> List[ValidationResult]:
-        """Run all validation checks and return results."""
+    def validate(
+        self,
+        df: pd.DataFrame,
+        missing_cells: Optional[int] = None,
+        numeric_cols: Optional[List[str]] = None,
+    ) -> List[ValidationResult]:
+        """
+        Run all validation checks and return results.
+
+        Args:
+            df: Frame to validate.
+            missing_cells: Precomputed _missing_count(df), if the caller has it.
+            numeric_cols: Precomputed _numeric_columns(df), if the caller has it.
+        """
         results: List[ValidationResult] = []
 
         # 1. Minimum rows
@@ -446,7 +753,8 @@ class DataValidator:
 
         # 3. Missing data percentage
         total_cells = df.size
-        missing_cells = int(df.isna().sum().sum())
+        if missing_cells is None:
+            missing_cells = _missing_count(df)
         missing_pct = (missing_cells / total_cells * 100) if total_cells > 0 else 0
 
         if missing_pct > 50:
@@ -469,7 +777,8 @@ class DataValidator:
             ))
 
         # 4. Has at least one numeric column
-        numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
+        if numeric_cols is None:
+            numeric_cols = _numeric_columns(df)
         if len(numeric_cols) == 0:
             results.append(ValidationResult(
                 "numeric_columns", False,
@@ -484,7 +793,7 @@ class DataValidator:
             ))
 
         # 5. Duplicate check
-        dup_count = int(df.duplicated().sum())
+        dup_count = _duplicate_count(df)
         if dup_count > 0:
             results.append(ValidationResult(
                 "duplicates", True,
@@ -540,15 +849,15 @@ class UniversalDataAdapter:
         Main entry point. Returns an AdapterResult with the cleaned
         DataFrame and metadata.
         """
-        warnings: List[str] = []
         actions: List[str] = []
 
         # --- Step 0: Basic cleaning ---
         df = self._basic_clean(df, actions)
 
         # --- Step 1: Shape correction (wide → long) ---
-        if self.shape_corrector.needs_melt(df):
-            df = self.shape_corrector.melt_wide(df)
+        month_cols = self.shape_corrector.month_columns(df)
+        if self.shape_corrector.needs_melt(df, month_cols):
+            df = self.shape_corrector.melt_wide(df, month_cols)
             actions.append("Converted wide-format data to long format (melted).")
 
         # --- Step 2: Column matching ---
@@ -563,11 +872,101 @@ class UniversalDataAdapter:
             df, date_col = self.date_parser.parse_dates(df, date_col)
             actions.append(f"Synthesized date column from Year/Month components.")
 
+        return self._finalize(df, mappings, date_col, actions)
+
+    def adapt_csv(self, path: Any, chunksize: int = CSV_CHUNK_ROWS, **read_csv_kwargs) -> AdapterResult:
+        """
+        Adapt a CSV without first materializing the raw frame.
+
+        The file is read in chunks. Column mapping, wide-format and date
+        column detection are decided once from the first chunk; cleaning,
+        melting and date parsing then run chunk by chunk, so only the
+        (smaller, parsed) chunks are held and concatenated at the end.
+
+        Args:
+            path: File path or buffer accepted by pd.read_csv.
+            chunksize: Rows per chunk.
+            **read_csv_kwargs: Passed through to pd.read_csv.
+        """
+        actions: List[str] = []
+        chunks: List[pd.DataFrame] = []
+        mappings: Optional[List[ColumnMapping]] = None
+        month_cols: List[str] = []
+        melt = False
+        date_col: Optional[str] = None
+        parsed_date_col: Optional[str] = None
+        empty_rows = 0
+
+        for chunk in pd.read_csv(path, chunksize=chunksize, **read_csv_kwargs):
+            original_cols = list(chunk.columns)
+            chunk.columns = _strip_column_names(chunk.columns)
+            rows_before = len(chunk)
+            chunk = chunk.dropna(how="all")
+            empty_rows += rows_before - len(chunk)
+
+            if mappings is None:
+                # First chunk fixes the schema decisions for the whole file
+                if list(chunk.columns) != original_cols:
+                    actions.append("Stripped whitespace from column names.")
+                month_cols = self.shape_corrector.month_columns(chunk)
+                melt = self.shape_corrector.needs_melt(chunk, month_cols)
+            if melt:
+                chunk = self.shape_corrector.melt_wide(chunk, month_cols)
+            if mappings is None:
+                mappings = self.column_matcher.match_all(list(chunk.columns))
+                date_col = self._resolve_date_column(chunk, mappings, actions)
+
+            if date_col == "__synthesize__" or (date_col and date_col in chunk.columns):
+                chunk, parsed_date_col = self.date_parser.parse_dates(chunk, date_col)
+            chunks.append(chunk)
+
+        if mappings is None:
+            # Header-only file
+            return self.adapt(pd.read_csv(path, nrows=0, **read_csv_kwargs))
+
+        df = pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+        del chunks
+
+        if empty_rows:
+            actions.append(f"Removed {empty_rows} fully empty rows.")
+        if melt:
+            actions.append("Converted wide-format data to long format (melted).")
+        cols_before = len(df.columns)
+        df = df.dropna(axis=1, how="all")
+        if len(df.columns) < cols_before:
+            actions.append(f"Removed {cols_before - len(df.columns)} fully empty columns.")
+            mappings = [m for m in mappings if m.original_name in df.columns]
+
+        if parsed_date_col is not None:
+            if date_col == "__synthesize__":
+                actions.append(f"Synthesized date column from Year/Month components.")
+            else:
+                actions.append(f"Parsed date column: '{parsed_date_col}'")
+            date_col = parsed_date_col
+
+        return self._finalize(df, mappings, date_col, actions)
+
+    def _finalize(
+        self,
+        df: pd.DataFrame,
+        mappings: List[ColumnMapping],
+        date_col: Optional[str],
+        actions: List[str],
+    ) -> AdapterResult:
+        """Target detection, validation and scoring on the adapted frame."""
+        warnings: List[str] = []
+
         # --- Step 4: Target detection ---
-        target_col = self._resolve_target_column(df, mappings)
+        # One dtype scan shared by target detection and validation
+        numeric_cols = _numeric_columns(df)
+        target_col = self._resolve_target_column(df, mappings, numeric_cols=numeric_cols)
 
         # --- Step 5: Validation ---
-        validation_results = self.validator.validate(df)
+        # The missing-cell count feeds both validation and the quality score
+        missing_cells = _missing_count(df)
+        validation_results = self.validator.validate(
+            df, missing_cells=missing_cells, numeric_cols=numeric_cols
+        )
         for v in validation_results:
             if not v.passed:
                 warnings.append(f"[{v.severity.upper()}] {v.message}")
@@ -575,7 +974,9 @@ class UniversalDataAdapter:
                 warnings.append(f"[WARNING] {v.message}")
 
         # --- Step 6: Quality score ---
-        quality_score = self._compute_quality_score(df, date_col, target_col, validation_results)
+        quality_score = self._compute_quality_score(
+            df, date_col, target_col, validation_results, missing_cells=missing_cells
+        )
 
         return AdapterResult(
             dataframe=df,
@@ -591,11 +992,13 @@ class UniversalDataAdapter:
 
     def _basic_clean(self, df: pd.DataFrame, actions: List[str]) -> pd.DataFrame:
         """Strip whitespace from column names and string values."""
-        df = df.copy()
+        # Shallow copy so renaming doesn't leak into the caller's frame;
+        # dropna below returns new frames anyway
+        df = df.copy(deep=False)
 
         # Clean column names
         original_cols = list(df.columns)
-        df.columns = [str(c).strip() for c in df.columns]
+        df.columns = _strip_column_names(df.columns)
         if list(df.columns) != original_cols:
             actions.append("Stripped whitespace from column names.")
 
@@ -640,6 +1043,7 @@ class UniversalDataAdapter:
         self,
         df: pd.DataFrame,
         mappings: List[ColumnMapping],
+        numeric_cols: Optional[List[str]] = None,
     ) -> Optional[str]:
         """Determine the target (sales) column."""
         # 1. User hint
@@ -652,7 +1056,8 @@ class UniversalDataAdapter:
                 return m.original_name
 
         # 3. Fallback: first numeric column that isn't obviously an ID
-        numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
+        if numeric_cols is None:
+            numeric_cols = _numeric_columns(df)
         for col in numeric_cols:
             col_lower = col.lower()
             if col_lower not in ("id", "index", "row", "row_number"):
@@ -666,28 +1071,34 @@ class UniversalDataAdapter:
         date_col: Optional[str],
         target_col: Optional[str],
         validation_results: List[ValidationResult],
+        missing_cells: Optional[int] = None,
     ) -> float:
         """
         Compute a 0-100 quality score based on:
           Completeness (30%) + Consistency (25%) + Frequency (25%) + Sufficiency (20%)
+
+        missing_cells may be passed in when already computed for validation.
         """
         score = 0.0
 
         # Completeness (30 pts)
         total = df.size
-        missing = int(df.isna().sum().sum())
+        missing = missing_cells if missing_cells is not None else _missing_count(df)
         completeness = (1 - missing / total) * 100 if total > 0 else 0
         score += min(30, completeness / 100 * 30)
 
         # Consistency – simple outlier check on target column (25 pts)
         if target_col and target_col in df.columns:
-            numeric_series = pd.to_numeric(df[target_col], errors="coerce").dropna()
-            if len(numeric_series) > 0:
-                q1 = numeric_series.quantile(0.25)
-                q3 = numeric_series.quantile(0.75)
+            # Plain float64 array: one partition for both quartiles, one mask
+            values = pd.to_numeric(df[target_col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+            values = values[~np.isnan(values)]
+            if len(values) > 0:
+                q1, q3 = np.quantile(values, [0.25, 0.75])
                 iqr = q3 - q1
-                outliers = ((numeric_series < q1 - 3 * iqr) | (numeric_series > q3 + 3 * iqr)).sum()
-                outlier_pct = outliers / len(numeric_series) if len(numeric_series) > 0 else 0
+                # Scalar fences, then one fused mask reduced without a Series
+                lo, hi = q1 - 3 * iqr, q3 + 3 * iqr
+                outliers = np.count_nonzero((values < lo) | (values > hi))
+                outlier_pct = outliers / len(values)
                 score += max(0, 25 * (1 - outlier_pct * 10))  # penalize heavily
             else:
                 score += 10  # partial credit
@@ -8,13 +8,31 @@ This module implements intelligent imputation strategies for:
 Author: ML Team
 Date: 2026-02-08
 """
+import os
+import hashlib
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    import dask
+    DASK_AVAILABLE = True
+except ImportError:
+    DASK_AVAILABLE = False
+
+# Dtypes GeneralImputer fits a median for; Arrow-backed frames (e.g. read with
+# dtype_backend='pyarrow') would otherwise skip median imputation entirely
+NUMERIC_DTYPES = ('float64', 'int64', 'double[pyarrow]', 'int64[pyarrow]')
+
+try:
+    from joblib import Memory
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+
 
 class MarkdownImputer:
     """
@@ -42,6 +60,8 @@ class MarkdownImputer:
             'MarkDown1', 'MarkDown2', 'MarkDown3', 'MarkDown4', 'MarkDown5'
         ]
         self.dept_markdown_patterns = {}
+        # '<col>_active' indicator names, built once for the fitted columns
+        self._active_cols: List[str] = []
         self.fitted = False
         
     def fit(self, df: pd.DataFrame, dept_col: str = 'Dept') -> 'MarkdownImputer':
@@ -63,25 +83,27 @@ class MarkdownImputer:
             return self
         
         self.markdown_cols = existing_cols
+        self._active_cols = [f'{col}_active' for col in existing_cols]
         
-        for dept in df[dept_col].unique():
-            dept_data = df[df[dept_col] == dept]
-            
-            # Calculate markdown usage rate per column
-            usage_rate = dept_data[self.markdown_cols].notna().mean()
-            
-            # Calculate median values when markdown is present
-            median_values = dept_data[self.markdown_cols].median()
-            
-            # Detect seasonal markdown pattern
-            seasonal_pattern = self._detect_seasonal_pattern(dept_data, 'Date')
-            
+        # Month -> markdown presence rate for every department in one pass
+        seasonal_patterns = self._detect_seasonal_patterns(df, dept_col, 'Date')
+        
+        # Usage rates and medians for every department in one grouped pass
+        markdowns = df[self.markdown_cols]
+        depts = df[dept_col]
+        usage_rates = markdowns.notna().groupby(depts, sort=False).mean()
+        median_values = markdowns.groupby(depts, sort=False).median()
+        avg_usage = usage_rates.mean(axis=1)  # Overall usage rate
+        
+        usage_records = usage_rates.to_dict('index')
+        median_records = median_values.to_dict('index')
+        for dept, avg in avg_usage.items():
             self.dept_markdown_patterns[dept] = {
-                'usage_rate': usage_rate.to_dict(),
-                'median_values': median_values.to_dict(),
-                'seasonal_pattern': seasonal_pattern,
-                'avg_usage': usage_rate.mean(),  # Overall usage rate
-                'is_markdown_heavy': usage_rate.mean() > 0.1  # >10% usage
+                'usage_rate': usage_records[dept],
+                'median_values': median_records[dept],
+                'seasonal_pattern': seasonal_patterns.get(dept, {}),
+                'avg_usage': avg,
+                'is_markdown_heavy': avg > 0.1  # >10% usage
             }
         
         self.fitted = True
@@ -89,13 +111,14 @@ class MarkdownImputer:
         
         return self
     
-    def transform(self, df: pd.DataFrame, dept_col: str = 'Dept') -> pd.DataFrame:
+    def transform(self, df: pd.DataFrame, dept_col: str = 'Dept', copy: bool = True) -> pd.DataFrame:
         """
         Impute markdowns using business logic.
         
         Args:
             df: DataFrame to transform
             dept_col: Name of department column
+            copy: If False, df itself is modified and returned
             
         Returns:
             DataFrame with imputed markdowns and indicator features
@@ -103,40 +126,50 @@ class MarkdownImputer:
         if not self.fitted:
             raise ValueError("Imputer must be fitted before transform")
         
-        df = df.copy()
+        if copy:
+            df = df.copy()
         
         # Ensure markdown columns exist
         existing_cols = [c for c in self.markdown_cols if c in df.columns]
         if not existing_cols:
             return df
         
-        for dept in df[dept_col].unique():
-            dept_mask = df[dept_col] == dept
-            patterns = self.dept_markdown_patterns.get(dept, {'is_markdown_heavy': False})
-            
-            if not patterns.get('is_markdown_heavy', False):
-                # Department rarely uses markdowns (<10%) → impute with 0
-                for col in existing_cols:
-                    df.loc[dept_mask, col] = df.loc[dept_mask, col].fillna(0)
-            else:
-                # Department frequently uses markdowns → forward-fill then zero-fill
-                for col in existing_cols:
-                    # Forward-fill (carry forward 2 weeks max)
-                    df.loc[dept_mask, col] = (
-                        df.loc[dept_mask, col]
-                        .ffill(limit=2)
-                    )
-                    # Then fill remaining with 0
-                    df.loc[dept_mask, col] = df.loc[dept_mask, col].fillna(0)
-        
-        # Create markdown indicator features
-        for col in existing_cols:
-            df[f'{col}_active'] = (df[col] > 0).astype(int)
-        
-        # Create aggregate markdown features
-        df['total_markdown'] = df[existing_cols].sum(axis=1)
-        df['n_active_markdowns'] = sum(df[f'{col}_active'] for col in existing_cols)
-        df['has_any_markdown'] = (df['n_active_markdowns'] > 0).astype(int)
+        # Work on the markdown block as one ndarray: markdown-heavy departments
+        # forward-fill (2 weeks max) within the department, then everything
+        # still missing is zero-filled, with a single write back into df
+        heavy_depts = [
+            dept for dept, patterns in self.dept_markdown_patterns.items()
+            if patterns.get('is_markdown_heavy', False)
+        ]
+        dept_values = df[dept_col]
+        heavy_mask = dept_values.isin(heavy_depts).to_numpy()
+        values = df[existing_cols].to_numpy(dtype=np.float64, copy=True)
+        
+        if heavy_mask.any():
+            # Department frequently uses markdowns → forward-fill then zero-fill
+            dept_codes = pd.factorize(dept_values.to_numpy()[heavy_mask])[0]
+            values[heavy_mask] = (
+                pd.DataFrame(values[heavy_mask])
+                .groupby(dept_codes, sort=False)
+                .ffill(limit=2)
+                .to_numpy()
+            )
+        # Departments rarely using markdowns (<10%) are only zero-filled; rows
+        # without a department were never matched by the per-dept loop
+        values[dept_values.notna().to_numpy()[:, None] & np.isnan(values)] = 0.0
+        df[existing_cols] = values
+        
+        # Create markdown indicator and aggregate features from the same block
+        active = values > 0
+        # existing_cols is an in-order subset of markdown_cols: same length, same columns
+        active_cols = (
+            self._active_cols if len(existing_cols) == len(self._active_cols)
+            else [f'{col}_active' for col in existing_cols]
+        )
+        df[active_cols] = active.astype(np.int8)
+        df['total_markdown'] = np.nansum(values, axis=1)
+        df['n_active_markdowns'] = active.sum(axis=1, dtype=np.int16)
+        df['has_any_markdown'] = active.any(axis=1).astype(np.int8)
         
         logger.info(f"Transformed markdowns, created {len(existing_cols)} indicator features")
         
@@ -146,33 +179,37 @@ class MarkdownImputer:
         """Fit and transform in one step."""
         return self.fit(df, dept_col).transform(df, dept_col)
     
-    def _detect_seasonal_pattern(
+    def _detect_seasonal_patterns(
         self, 
-        dept_data: pd.DataFrame, 
+        df: pd.DataFrame, 
+        dept_col: str,
         date_col: str
-    ) -> Dict[int, float]:
+    ) -> Dict[object, Dict[int, float]]:
         """
         Detect if markdowns follow seasonal patterns (Q4 holidays).
         
-        Returns dict of month -> markdown presence rate
+        Returns dict of dept -> {month -> markdown presence rate}
         """
-        if date_col not in dept_data.columns or not len(self.markdown_cols):
+        if date_col not in df.columns or not len(self.markdown_cols):
             return {}
         
         try:
-            dept_data = dept_data.copy()
-            dept_data['_month'] = pd.to_datetime(dept_data[date_col]).dt.month
+            months = pd.to_datetime(df[date_col]).dt.month
             
-            # Calculate markdown presence rate by month
-            markdown_by_month = (
-                dept_data.groupby('_month')[self.markdown_cols[0]]
-                .apply(lambda x: x.notna().mean())
-                .to_dict()
+            # Calculate markdown presence rate by (department, month)
+            presence_rates = (
+                df[self.markdown_cols[0]].notna()
+                .groupby([df[dept_col], months], sort=True)
+                .mean()
             )
-            return markdown_by_month
         except Exception as e:
             logger.warning(f"Could not detect seasonal pattern: {e}")
             return {}
+        
+        patterns: Dict[object, Dict[int, float]] = {}
+        for (dept, month), rate in presence_rates.items():
+            patterns.setdefault(dept, {})[month] = rate
+        return patterns
     
     def get_dept_insights(self) -> pd.DataFrame:
         """
@@ -207,9 +244,24 @@ class GeneralImputer:
     - Fuel_Price: Forward-fill then median
     """
     
-    def __init__(self):
+    def __init__(self, downcast_float32: bool = False):
+        """
+        Args:
+            downcast_float32: Hold float64 columns as float32 from transform on
+                (half the memory traffic for the fills and downstream models,
+                at ~7 significant digits)
+        """
         self.column_strategies = {}
         self.column_medians = {}
+        self.downcast_float32 = downcast_float32
+        self._f32_cols: List[str] = []
+        # Columns grouped by strategy, so transform runs one call per group
+        self._interp_cols: List[str] = []
+        self._ffill_cols: List[str] = []
+        self._ffill_median_cols: List[str] = []
+        self._median_cols: List[str] = []
+        self._mode_cols: List[str] = []
+        self._median_series = pd.Series(dtype=object)
         self.fitted = False
     
     def fit(self, df: pd.DataFrame) -> 'GeneralImputer':
@@ -228,54 +280,89 @@ class GeneralImputer:
         for col in df.columns:
             if col in strategies:
                 self.column_strategies[col] = strategies[col]
-            elif df[col].dtype in ['float64', 'int64']:
+            elif df[col].dtype in NUMERIC_DTYPES:
                 self.column_strategies[col] = 'median'
             
             # Store median/mode for each column
-            if df[col].dtype in ['float64', 'int64']:
+            if df[col].dtype in NUMERIC_DTYPES:
                 self.column_medians[col] = df[col].median()
             elif df[col].dtype == 'object':
                 self.column_medians[col] = df[col].mode()[0] if len(df[col].mode()) > 0 else 'Unknown'
         
+        if self.downcast_float32:
+            # All-NaN columns have a NaN max and are left alone
+            f32_max = np.finfo(np.float32).max
+            self._f32_cols = [
+                col for col in df.columns
+                if df[col].dtype == np.float64 and df[col].abs().max() < f32_max
+            ]
+            for col in self._f32_cols:
+                if col in self.column_medians:
+                    self.column_medians[col] = np.float32(self.column_medians[col])
+        
+        buckets: Dict[str, List[str]] = {}
+        for col, strategy in self.column_strategies.items():
+            buckets.setdefault(strategy, []).append(col)
+        self._interp_cols = buckets.get('interpolate', [])
+        self._ffill_cols = buckets.get('ffill', [])
+        self._ffill_median_cols = buckets.get('ffill_median', [])
+        self._median_cols = buckets.get('median', [])
+        self._mode_cols = buckets.get('mode', [])
+        self._median_series = pd.Series(self.column_medians, dtype=object)
+        
         self.fitted = True
         logger.info(f"Fitted GeneralImputer on {len(self.column_strategies)} columns")
         
         return self
     
-    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Apply imputation strategies."""
+    def transform(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
+        """Apply imputation strategies (in place on df when copy=False)."""
         if not self.fitted:
             raise ValueError("Imputer must be fitted before transform")
         
-        df = df.copy()
+        if copy:
+            df = df.copy()
         
-        for col, strategy in self.column_strategies.items():
-            if col not in df.columns:
-                continue
-            
-            if strategy == 'interpolate':
-                df[col] = df[col].interpolate(method='linear', limit_direction='both')
-                df[col] = df[col].fillna(self.column_medians.get(col, df[col].mean()))
-                
-            elif strategy == 'ffill':
-                df[col] = df[col].ffill()
-                df[col] = df[col].bfill()
-                
-            elif strategy == 'ffill_median':
-                df[col] = df[col].ffill(limit=4)
-                df[col] = df[col].fillna(self.column_medians.get(col, df[col].median()))
-                
-            elif strategy == 'median':
-                df[col] = df[col].fillna(self.column_medians.get(col, df[col].median()))
-                
-            elif strategy == 'mode':
-                df[col] = df[col].fillna(self.column_medians.get(col, 'Unknown'))
+        present = set(df.columns)
+        
+        cols = [c for c in self._f32_cols if c in present]
+        if cols:
+            df[cols] = df[cols].astype(np.float32)
+        
+        cols = [c for c in self._interp_cols if c in present]
+        if cols:
+            df[cols] = df[cols].interpolate(method='linear', limit_direction='both')
+            df[cols] = df[cols].fillna(self._fill_values(df, cols, lambda s: s.mean()))
+        
+        cols = [c for c in self._ffill_cols if c in present]
+        if cols:
+            df[cols] = df[cols].ffill().bfill()
+        
+        cols = [c for c in self._ffill_median_cols if c in present]
+        if cols:
+            df[cols] = df[cols].ffill(limit=4)
+            df[cols] = df[cols].fillna(self._fill_values(df, cols, lambda s: s.median()))
+        
+        cols = [c for c in self._median_cols if c in present]
+        if cols:
+            df[cols] = df[cols].fillna(self._fill_values(df, cols, lambda s: s.median()))
+        
+        cols = [c for c in self._mode_cols if c in present]
+        if cols:
+            df[cols] = df[cols].fillna(self._fill_values(df, cols, lambda s: 'Unknown'))
         
         return df
     
     def fit_transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """Fit and transform in one step."""
         return self.fit(df).transform(df)
+    
+    def _fill_values(self, df: pd.DataFrame, cols: List[str], default) -> Dict[str, object]:
+        """Fitted fill value per column, or default(df[col]) for unseen ones."""
+        return {
+            col: self._median_series[col] if col in self._median_series.index else default(df[col])
+            for col in cols
+        }
 
 
 class DataPreprocessor:
@@ -288,9 +375,20 @@ class DataPreprocessor:
         test_df = preprocessor.transform(test_data)
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        memory: Optional[Union[str, 'Memory']] = None,
+        downcast_float32: bool = False
+    ):
+        """
+        Args:
+            memory: Optional joblib cache (directory path or Memory) for
+                fit_transform, like sklearn Pipeline's ``memory``
+            downcast_float32: Passed to GeneralImputer
+        """
         self.markdown_imputer = MarkdownImputer()
-        self.general_imputer = GeneralImputer()
+        self.general_imputer = GeneralImputer(downcast_float32)
+        self.memory = memory
         self.fitted = False
     
     def fit(self, df: pd.DataFrame) -> 'DataPreprocessor':
@@ -305,19 +403,84 @@ class DataPreprocessor:
         if not self.fitted:
             raise ValueError("Preprocessor must be fitted before transform")
         
+        # The markdown step returns a fresh frame, so the general step can
+        # work on it in place rather than copying it a second time
         df = self.markdown_imputer.transform(df)
-        df = self.general_imputer.transform(df)
+        df = self.general_imputer.transform(df, copy=False)
         
         return df
     
     def fit_transform(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Fit and transform in one step."""
-        return self.fit(df).transform(df)
+        """Fit and transform in one step (served from ``memory`` when set)."""
+        if self.memory is None or not JOBLIB_AVAILABLE:
+            return self.fit(df).transform(df)
+        
+        try:
+            fingerprint = _frame_fingerprint(df)
+        except TypeError:
+            # Unhashable cell values (lists, dicts): just compute
+            return self.fit(df).transform(df)
+        
+        memory = Memory(location=self.memory, verbose=0) if isinstance(self.memory, str) else self.memory
+        cached = memory.cache(_fit_transform_preprocessor, ignore=['df'])
+        self.markdown_imputer, self.general_imputer, result = cached(
+            fingerprint, df, tuple(self.markdown_imputer.markdown_cols),
+            self.general_imputer.downcast_float32
+        )
+        self.fitted = True
+        return result
+    
+    def fit_transform_dask(
+        self,
+        df: pd.DataFrame,
+        npartitions: Optional[int] = None,
+        dept_col: str = 'Dept'
+    ) -> pd.DataFrame:
+        """
+        fit_transform with the markdown step spread over Dask partitions.
+        
+        Rows are split into partitions of whole departments, so the
+        per-department forward-fill gives the same result as the pandas
+        path. GeneralImputer fills along the full frame order and runs on
+        the reassembled frame. Falls back to fit_transform without Dask.
+        
+        Args:
+            df: Training dataframe
+            npartitions: Number of partitions (default: CPU count)
+            dept_col: Name of department column
+        """
+        if not DASK_AVAILABLE or dept_col not in df.columns:
+            return self.fit_transform(df)
+        import dask.dataframe as dd  # Deferred: pulls in most of dask
+        
+        self.fit(df)
+        
+        # Stable sort by department code so each department is contiguous;
+        # from_pandas never splits equal index values across partitions
+        codes = pd.factorize(df[dept_col])[0]
+        order = np.argsort(codes, kind='stable')
+        keyed = df.iloc[order].set_index(pd.Index(codes[order], name='_dept_code'))
+        
+        # Keep the caller's string dtypes instead of Dask's pyarrow strings
+        with dask.config.set({'dataframe.convert-string': False}):
+            ddf = dd.from_pandas(keyed, npartitions=npartitions or os.cpu_count() or 1, sort=True)
+            imputed = ddf.map_partitions(
+                self.markdown_imputer.transform, dept_col=dept_col,
+                meta=self.markdown_imputer.transform(keyed.iloc[:0], dept_col),
+            ).compute()
+        
+        # Back to the caller's row order and index
+        imputed = imputed.iloc[np.argsort(order, kind='stable')]
+        imputed.index = df.index
+        
+        return self.general_imputer.transform(imputed, copy=False)
     
     def get_missing_report(self, df: pd.DataFrame) -> pd.DataFrame:
         """Generate report of missing values before/after preprocessing."""
         before = df.isnull().sum()
-        after = self.transform(df.copy()).isnull().sum()
+        # transform() copies the input itself; indicator columns it adds are
+        # not part of the report
+        after = self.transform(df).isnull().sum().reindex(before.index)
         
         report = pd.DataFrame({
             'column': before.index,
@@ -328,3 +491,29 @@ class DataPreprocessor:
         })
         
         return report[report['missing_before'] > 0].sort_values('missing_before', ascending=False)
+
+
+def _frame_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Content hash of a DataFrame for the fit_transform cache.
+    
+    Vectorized row hashes instead of pickling the frame, which is what
+    joblib would otherwise hash on every call.
+    """
+    digest = hashlib.sha1()
+    digest.update(repr((df.shape, [str(c) for c in df.columns], [str(t) for t in df.dtypes])).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _fit_transform_preprocessor(
+    fingerprint: str,
+    df: pd.DataFrame,
+    markdown_cols: Tuple[str, ...],
+    downcast_float32: bool = False
+) -> Tuple[MarkdownImputer, GeneralImputer, pd.DataFrame]:
+    """Fit a fresh preprocessor; joblib keys on everything but df."""
+    preprocessor = DataPreprocessor(downcast_float32=downcast_float32)
+    preprocessor.markdown_imputer = MarkdownImputer(list(markdown_cols))
+    result = preprocessor.fit(df).transform(df)
+    return preprocessor.markdown_imputer, preprocessor.general_imputer, result
@@ -11,14 +11,76 @@ Date: 2026-02-08
 """
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from scipy.optimize import minimize
 import logging
+from collections import OrderedDict
 
 from app.ml.base_model import BaseForecaster, ForecastResult, TrainingMetrics
 
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Added to the MAPE denominator so zero sales don't divide by zero
+EPSILON = 1e-6
+
+# Base-model forecasts remembered per (model, periods, confidence level)
+PREDICTION_CACHE_SIZE = 32
+
+# Reassociation lets LLVM vectorize the reductions; NaN semantics are kept
+_FASTMATH = {"reassoc", "contract", "arcp"}
+
+
+def _weighted_mape(
+    w: np.ndarray,
+    pred_matrix: np.ndarray,
+    actuals: np.ndarray,
+    inv_actuals: np.ndarray
+) -> float:
+    """
+    MAPE (%) of the blend pred_matrix @ w against actuals
+    
+    inv_actuals is 1 / (actuals + EPSILON), precomputed once per optimization
+    so each objective call is a single allocation-free pass.
+    """
+    n, n_models = pred_matrix.shape
+    total = 0.0
+    for i in range(n):
+        blended = 0.0
+        for j in range(n_models):
+            blended += pred_matrix[i, j] * w[j]
+        total += abs((actuals[i] - blended) * inv_actuals[i])
+    return total / n * 100
+
+
+def _weighted_mape_numpy(
+    w: np.ndarray,
+    pred_matrix: np.ndarray,
+    actuals: np.ndarray,
+    inv_actuals: np.ndarray
+) -> float:
+    """NumPy equivalent of _weighted_mape for when numba is not installed"""
+    return np.mean(np.abs((actuals - pred_matrix @ w) * inv_actuals)) * 100
+
+
+if NUMBA_AVAILABLE:
+    # Explicit signature: compiled (or loaded from the on-disk cache) at import.
+    # C-contiguous layouts (the caller guarantees them) let LLVM vectorize;
+    # read-only types also accept writable arrays.
+    _F8_VECTOR = types.Array(types.float64, 1, 'C', readonly=True)
+    _F8_MATRIX = types.Array(types.float64, 2, 'C', readonly=True)
+    _weighted_mape = njit(
+        types.float64(_F8_VECTOR, _F8_MATRIX, _F8_VECTOR, _F8_VECTOR),
+        cache=True, fastmath=_FASTMATH
+    )(_weighted_mape)
+else:
+    _weighted_mape = _weighted_mape_numpy
+
 
 class DynamicEnsemble(BaseForecaster):
     """
@@ -57,6 +119,11 @@ class DynamicEnsemble(BaseForecaster):
         
         self.available_models = []
         self.weights_learned = False
+        # (column layout, markdown indicator columns) of the last detected frame
+        self._markdown_cols_cache: Optional[Tuple[tuple, List[str]]] = None
+        # (name, periods, confidence_level) -> (training_metrics, is_trained, result);
+        # retraining replaces training_metrics, which invalidates the entry
+        self._pred_cache: "OrderedDict[Tuple[str, int, float], Tuple[Any, bool, ForecastResult]]" = OrderedDict()
         
     def set_base_models(self, models: Dict[str, BaseForecaster]):
         """
@@ -67,6 +134,7 @@ class DynamicEnsemble(BaseForecaster):
         """
         self.base_models = models
         self.available_models = list(models.keys())
+        self._pred_cache.clear()
         
         # Initialize uniform weights for available models
         n_models = len(self.available_models)
@@ -114,13 +182,18 @@ class DynamicEnsemble(BaseForecaster):
         base_predictions = {}
         for name, model in self.base_models.items():
             try:
-                result = model.predict(periods=len(X_val))
-                base_predictions[name] = np.array(result.predictions)
+                result = self._base_predict(name, model, len(X_val))
+                base_predictions[name] = result.predictions
             except Exception as e:
                 logger.warning(f"Could not get predictions from {name}: {e}")
                 # Use dummy predictions
                 base_predictions[name] = np.zeros(len(X_val))
         
+        # One (samples x models) matrix; each context takes its rows once
+        model_names = list(base_predictions)
+        pred_matrix = np.column_stack([base_predictions[name] for name in model_names]).astype(np.float64, copy=False)
+        actuals = y_val.to_numpy(dtype=np.float64)
+        
         # Learn weights for each context
         learned_weights = {}
         
@@ -131,14 +204,8 @@ class DynamicEnsemble(BaseForecaster):
                 logger.warning(f"Insufficient samples for {context_name} context")
                 continue
             
-            context_preds = {
-                name: preds[context_mask] 
-                for name, preds in base_predictions.items()
-            }
-            context_actuals = y_val[context_mask].values
-            
             # Optimize weights
-            optimal = self._optimize_weights(context_preds, context_actuals)
+            optimal = self._optimize_weights(pred_matrix[context_mask], actuals[context_mask], model_names)
             learned_weights[context_name] = optimal
             
             logger.info(f"{context_name.upper()}: MAPE={optimal['mape']:.2f}%, weights={optimal['weights']}")
@@ -150,25 +217,53 @@ class DynamicEnsemble(BaseForecaster):
         self.weights_learned = True
         return learned_weights
     
+    def _base_predict(
+        self,
+        name: str,
+        model: BaseForecaster,
+        periods: int,
+        confidence_level: float = 0.95
+    ) -> ForecastResult:
+        """model.predict(periods, confidence_level), memoized until the model retrains."""
+        key = (name, periods, confidence_level)
+        cached = self._pred_cache.get(key)
+        if cached is not None and cached[0] is model.training_metrics and cached[1] == model.is_trained:
+            self._pred_cache.move_to_end(key)
+            return cached[2]
+        
+        result = model.predict(periods, confidence_level)
+        self._pred_cache[key] = (model.training_metrics, model.is_trained, result)
+        self._pred_cache.move_to_end(key)
+        if len(self._pred_cache) > PREDICTION_CACHE_SIZE:
+            self._pred_cache.popitem(last=False)
+        return result
+    
     def _optimize_weights(
         self,
-        predictions: Dict[str, np.ndarray],
-        actuals: np.ndarray
+        pred_matrix: np.ndarray,
+        actuals: np.ndarray,
+        model_names: List[str]
     ) -> Dict:
-        """Optimize weights to minimize MAPE using constrained optimization."""
-        model_names = list(predictions.keys())
+        """
+        Optimize weights to minimize MAPE using constrained optimization.
+        
+        Args:
+            pred_matrix: (samples x models) base predictions, columns in model_names order
+            actuals: Observed values per sample
+            model_names: Model name of each pred_matrix column
+        """
         n_models = len(model_names)
         
         if n_models == 0:
             return {'weights': {}, 'mape': float('inf')}
         
-        # Convert predictions to matrix
-        pred_matrix = np.column_stack([predictions[name] for name in model_names])
+        # Row-major: one sample's models are adjacent for the objective's inner loop
+        pred_matrix = np.ascontiguousarray(pred_matrix, dtype=np.float64)
+        actuals = np.ascontiguousarray(actuals, dtype=np.float64)
+        inv_actuals = 1.0 / (actuals + EPSILON)
         
         def objective(w):
-            ensemble_pred = pred_matrix @ w
-            mape = np.mean(np.abs((actuals - ensemble_pred) / (actuals + 1e-6))) * 100
-            return mape
+            return _weighted_mape(np.ascontiguousarray(w, dtype=np.float64), pred_matrix, actuals, inv_actuals)
         
         # Constraints: weights sum to 1, all positive
         constraints = {'type': 'eq', 'fun': lambda w: np.sum(w) - 1}
@@ -205,39 +300,39 @@ class DynamicEnsemble(BaseForecaster):
         Returns:
             Array of context labels ('normal', 'holiday', 'promotional')
         """
-        contexts = []
+        n = len(X)
         
-        for i in range(len(X)):
-            if hasattr(X, 'iloc'):
-                row = X.iloc[i]
-            else:
-                row = X[i]
-            
-            # Holiday detection
-            is_holiday = False
-            if 'IsHoliday' in X.columns:
-                is_holiday = bool(row.get('IsHoliday', False))
-            elif 'is_holiday' in X.columns:
-                is_holiday = bool(row.get('is_holiday', False))
-            
-            if is_holiday:
-                contexts.append('holiday')
-                continue
-            
-            # Promotional detection
-            markdown_cols = [c for c in X.columns if 'MarkDown' in c or 'markdown' in c.lower()]
-            has_promotion = False
-            for col in markdown_cols:
-                if col.endswith('_active') and row.get(col, 0) > 0:
-                    has_promotion = True
-                    break
-            
-            if has_promotion:
-                contexts.append('promotional')
-            else:
-                contexts.append('normal')
+        # Holiday detection
+        if 'IsHoliday' in X.columns:
+            is_holiday = X['IsHoliday'].to_numpy().astype(bool)
+        elif 'is_holiday' in X.columns:
+            is_holiday = X['is_holiday'].to_numpy().astype(bool)
+        else:
+            is_holiday = np.zeros(n, dtype=bool)
         
-        return np.array(contexts)
+        # Promotional detection: any active markdown indicator
+        markdown_cols = self._markdown_indicator_cols(X.columns)
+        if markdown_cols:
+            has_promotion = (X[markdown_cols].to_numpy(dtype=np.float64) > 0).any(axis=1)
+        else:
+            has_promotion = np.zeros(n, dtype=bool)
+        
+        return np.where(
+            is_holiday, 'holiday',
+            np.where(has_promotion, 'promotional', 'normal')
+        )
+    
+    def _markdown_indicator_cols(self, columns: pd.Index) -> List[str]:
+        """Markdown '*_active' indicator columns, cached per column layout."""
+        key = tuple(columns)
+        cached = self._markdown_cols_cache
+        if cached is None or cached[0] != key:
+            cols = [
+                c for c in columns
+                if ('MarkDown' in c or 'markdown' in c.lower()) and c.endswith('_active')
+            ]
+            cached = self._markdown_cols_cache = (key, cols)
+        return cached[1]
     
     def predict(
         self,
@@ -265,11 +360,11 @@ class DynamicEnsemble(BaseForecaster):
         
         for name, model in self.base_models.items():
             try:
-                result = model.predict(periods, confidence_level)
+                result = self._base_predict(name, model, periods, confidence_level)
                 model_predictions[name] = {
-                    'predictions': np.array(result.predictions),
-                    'lower': np.array(result.lower_bound),
-                    'upper': np.array(result.upper_bound)
+                    'predictions': result.predictions,
+                    'lower': result.lower_bound,
+                    'upper': result.upper_bound
                 }
                 if dates is None:
                     dates = result.dates
@@ -282,18 +377,20 @@ class DynamicEnsemble(BaseForecaster):
         # Get weights for this context
         context_weights = self.weights.get(context, self.weights['normal'])
         
-        # Compute weighted ensemble
-        ensemble_predictions = np.zeros(periods)
-        ensemble_lower = np.zeros(periods)
-        ensemble_upper = np.zeros(periods)
-        
-        total_weight = sum(context_weights.get(name, 0) for name in model_predictions)
-        
-        for name, preds in model_predictions.items():
-            weight = context_weights.get(name, 0) / total_weight if total_weight > 0 else 1.0 / len(model_predictions)
-            ensemble_predictions += preds['predictions'] * weight
-            ensemble_lower += preds['lower'] * weight
-            ensemble_upper += preds['upper'] * weight
+        # Compute weighted ensemble: (models,) @ (3, models, periods) blends
+        # predictions and both bounds in one matmul
+        names = list(model_predictions)
+        stacked = np.stack([
+            [model_predictions[name][key] for name in names]
+            for key in ('predictions', 'lower', 'upper')
+        ])
+        weights = np.array([context_weights.get(name, 0) for name in names], dtype=np.float64)
+        total_weight = weights.sum()
+        if total_weight > 0:
+            weights /= total_weight
+        else:
+            weights = np.full(len(names), 1.0 / len(names))
+        ensemble_predictions, ensemble_lower, ensemble_upper = weights @ stacked
         
         # Model contributions for transparency
         contributions = {
@@ -321,10 +418,10 @@ class DynamicEnsemble(BaseForecaster):
             )
         
         return ForecastResult(
-            dates=dates or [str(i) for i in range(periods)],
-            predictions=ensemble_predictions.tolist(),
-            lower_bound=ensemble_lower.tolist(),
-            upper_bound=ensemble_upper.tolist(),
+            dates=dates if dates is not None else [str(i) for i in range(periods)],
+            predictions=ensemble_predictions,
+            lower_bound=ensemble_lower,
+            upper_bound=ensemble_upper,
             model_type=f"DynamicEnsemble ({context})",
             confidence_level=confidence_level * 100,
             metrics={
@@ -208,9 +208,9 @@ class EnsembleForecaster(BaseForecaster):
         
         for name, result in model_predictions.items():
             weight = self.weights.get(name, 1.0 / len(model_predictions))
-            ensemble_predictions += np.array(result.predictions) * weight
-            ensemble_lower += np.array(result.lower_bound) * weight
-            ensemble_upper += np.array(result.upper_bound) * weight
+            ensemble_predictions += result.predictions * weight
+            ensemble_lower += result.lower_bound * weight
+            ensemble_upper += result.upper_bound * weight
         
         prediction_time = time.time() - start_time
         
@@ -225,9 +225,9 @@ class EnsembleForecaster(BaseForecaster):
         
         return ForecastResult(
             dates=dates,
-            predictions=ensemble_predictions.tolist(),
-            lower_bound=ensemble_lower.tolist(),
-            upper_bound=ensemble_upper.tolist(),
+            predictions=ensemble_predictions,
+            lower_bound=ensemble_lower,
+            upper_bound=ensemble_upper,
             model_type=f"Ensemble ({'+'.join(self.models.keys())})",
             confidence_level=confidence_level * 100,
             metrics={
@@ -75,7 +75,13 @@ class XGBoostForecaster(BaseForecaster):
         
         # Define feature columns (exclude date and target)
         exclude_cols = [date_col, target_col]
-        self.feature_columns = [col for col in df.columns if col not in exclude_cols and df[col].dtype in ['int64', 'float64']]
+        # Any non-boolean numeric dtype (calendar features are compact ints)
+        self.feature_columns = [
+            col for col in df.columns
+            if col not in exclude_cols
+            and pd.api.types.is_numeric_dtype(df[col])
+            and not pd.api.types.is_bool_dtype(df[col])
+        ]
         
         X = df[self.feature_columns]
         y = df[target_col]
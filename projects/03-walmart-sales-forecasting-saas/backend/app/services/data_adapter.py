@@ -129,14 +129,15 @@ class DataAdapter:
             df = df.rename(columns=rename_dict)
             report["mapped_columns"] = len(rename_dict)
 
-        # Robust Date Parsing
-        if 'date' in df.columns:
+        # Robust Date Parsing (skipped when the reader already produced datetimes)
+        if 'date' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['date']):
             df, date_warnings = self._parse_dates(df, 'date')
             report["warnings"].extend(date_warnings)
 
-        # Numeric Conversion
+        # Numeric Conversion (reuse the dtype inferred at read time when possible)
         if 'target' in df.columns:
-            df['target'] = pd.to_numeric(df['target'], errors='coerce')
+            if not pd.api.types.is_numeric_dtype(df['target']):
+                df['target'] = pd.to_numeric(df['target'], errors='coerce')
             df = df.dropna(subset=['target'])
             
         return df, report
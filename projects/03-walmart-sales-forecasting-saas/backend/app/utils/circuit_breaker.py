@@ -11,7 +11,7 @@ States:
 import time
 import threading
 from enum import Enum
-from typing import Callable, Any, Optional
+from typing import Callable, Any, Optional, Tuple
 from functools import wraps
 
 from .structured_logger import get_logger
@@ -83,6 +83,10 @@ class CircuitBreaker:
         self._last_failure_time: Optional[float] = None
         self._lock = threading.Lock()
 
+        # Bumped on every change visible in get_status(), which caches by it
+        self._version = 0
+        self._status_cache: Optional[Tuple[int, dict]] = None
+
     @property
     def state(self) -> CircuitState:
         """Get current circuit state, transitioning OPEN→HALF_OPEN if timeout elapsed"""
@@ -91,6 +95,7 @@ class CircuitBreaker:
                 if self._last_failure_time and (time.time() - self._last_failure_time) >= self.reset_timeout:
                     self._state = CircuitState.HALF_OPEN
                     self._success_count = 0
+                    self._version += 1
                     logger.info(
                         f"Circuit breaker '{self.name}' transitioning OPEN → HALF_OPEN",
                         service=self.name
@@ -140,19 +145,23 @@ class CircuitBreaker:
                     self._state = CircuitState.CLOSED
                     self._failure_count = 0
                     self._success_count = 0
+                    self._version += 1
                     logger.info(
                         f"Circuit breaker '{self.name}' CLOSED - service recovered",
                         service=self.name
                     )
             elif self._state == CircuitState.CLOSED:
                 # Reset failure count on success
-                self._failure_count = max(0, self._failure_count - 1)
+                if self._failure_count:
+                    self._failure_count -= 1
+                    self._version += 1
 
     def _on_failure(self, error: Exception):
         """Handle failed execution"""
         with self._lock:
             self._failure_count += 1
             self._last_failure_time = time.time()
+            self._version += 1
 
             logger.warning(
                 f"Circuit breaker '{self.name}' recorded failure {self._failure_count}/{self.failure_threshold}",
@@ -178,15 +187,28 @@ class CircuitBreaker:
         return wrapper
 
     def get_status(self) -> dict:
-        """Get current circuit breaker status for health checks"""
-        return {
+        """
+        Get current circuit breaker status for health checks
+
+        The dict is rebuilt only when the breaker has changed since the last
+        call; treat the returned value as read-only.
+        """
+        state = self.state  # May transition OPEN → HALF_OPEN (bumps the version)
+        version = self._version
+        cached = self._status_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        status = {
             "name": self.name,
-            "state": self.state.value,
+            "state": state.value,
             "failure_count": self._failure_count,
             "failure_threshold": self.failure_threshold,
             "last_failure_time": self._last_failure_time,
             "reset_timeout": self.reset_timeout
         }
+        self._status_cache = (version, status)
+        return status
 
     def reset(self):
         """Manually reset circuit breaker to CLOSED state"""
@@ -195,6 +217,7 @@ class CircuitBreaker:
             self._failure_count = 0
             self._success_count = 0
             self._last_failure_time = None
+            self._version += 1
             logger.info(f"Circuit breaker '{self.name}' manually reset to CLOSED", service=self.name)
 
 
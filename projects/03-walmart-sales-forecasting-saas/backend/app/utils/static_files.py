@@ -0,0 +1,193 @@
+"""
+Static File Serving
+StaticFiles variant that keeps small hashed build assets in memory
+"""
+
+import gzip
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Files up to this size are served from memory; larger ones stream from disk
+MEMORY_CACHE_MAX_FILE_BYTES = 64 * 1024
+# Upper bound on the total bytes held by one CachedStaticFiles instance
+MEMORY_CACHE_MAX_TOTAL_BYTES = 32 * 1024 * 1024
+
+# Text-like bundles worth precompressing (images and fonts are already compressed)
+COMPRESSIBLE_SUFFIXES = (".html", ".js", ".mjs", ".css", ".json", ".svg", ".txt", ".map")
+
+# Preference order when the client accepts several encodings
+PREFERRED_ENCODINGS = ("br", "gzip")
+
+
+def compress_variants(data: bytes) -> Dict[str, bytes]:
+    """
+    Precompute the encoded representations of a payload
+
+    Args:
+        data: Raw (identity) bytes
+
+    Returns:
+        Mapping of content-encoding to bytes; always has "identity", and
+        "br"/"gzip" only when they actually shrink the payload
+    """
+    variants = {"identity": data}
+    if BROTLI_AVAILABLE:
+        encoded = brotli.compress(data, quality=11)
+        if len(encoded) < len(data):
+            variants["br"] = encoded
+    encoded = gzip.compress(data, compresslevel=9, mtime=0)
+    if len(encoded) < len(data):
+        variants["gzip"] = encoded
+    return variants
+
+
+def select_encoding(accept_encoding: str, variants: Dict[str, bytes]) -> str:
+    """Pick the best precomputed encoding the client accepts"""
+    if accept_encoding:
+        accepted = set()
+        for token in accept_encoding.lower().split(","):
+            coding, _, params = token.partition(";")
+            params = params.replace(" ", "")
+            if params.startswith("q="):
+                try:
+                    if float(params[2:]) <= 0:
+                        continue
+                except ValueError:
+                    continue
+            accepted.add(coding.strip())
+        for encoding in PREFERRED_ENCODINGS:
+            if encoding in variants and encoding in accepted:
+                return encoding
+    return "identity"
+
+
+def encoded_response(variants: Dict[str, bytes], accept_encoding: str, status_code: int = 200,
+                     headers: Optional[Dict[str, str]] = None, media_type: Optional[str] = None) -> Response:
+    """
+    Build a response from precompressed variants
+
+    Args:
+        variants: Output of compress_variants
+        accept_encoding: Request Accept-Encoding header value
+        status_code: HTTP status
+        headers: Base headers (content-length is recomputed)
+        media_type: Content type when not already in headers
+
+    Returns:
+        Response carrying the chosen representation
+    """
+    encoding = select_encoding(accept_encoding, variants)
+    body = variants[encoding]
+    headers = {k: v for k, v in (headers or {}).items() if k.lower() != "content-length"}
+    if len(variants) > 1:
+        headers["vary"] = "Accept-Encoding"
+    if encoding != "identity":
+        headers["content-encoding"] = encoding
+        etag = headers.get("etag")
+        if etag and etag.endswith('"'):
+            # Distinct representation, distinct entity tag
+            headers["etag"] = f'{etag[:-1]}-{encoding}"'
+    return Response(content=body, status_code=status_code, headers=headers, media_type=media_type)
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles with a bounded in-memory LRU for small files
+
+    Vite emits content-hashed bundles that never change in place, so after
+    the first hit their bytes are served straight from memory, with text
+    assets precompressed once (brotli/gzip) and picked per Accept-Encoding.
+    Entries are keyed by (path, mtime, size) so a rebuilt file is picked up.
+    Conditional (304), HEAD and Range requests, and files above the size
+    threshold, keep the stock FileResponse path.
+    """
+
+    def __init__(self, *args, max_file_bytes: int = MEMORY_CACHE_MAX_FILE_BYTES,
+                 max_total_bytes: int = MEMORY_CACHE_MAX_TOTAL_BYTES, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_file_bytes = max_file_bytes
+        self.max_total_bytes = max_total_bytes
+        self._cache: "OrderedDict[Tuple[str, int, int], Dict[str, bytes]]" = OrderedDict()
+        self._cache_bytes = 0
+        self._cache_lock = threading.Lock()
+
+    def file_response(self, full_path, stat_result, scope: Scope, status_code: int = 200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+
+        if (
+            not isinstance(response, FileResponse)
+            or stat_result.st_size > self.max_file_bytes
+            or scope["method"] != "GET"
+            or any(name == b"range" for name, _ in scope["headers"])
+        ):
+            return response
+
+        variants = self._get_variants(str(full_path), stat_result)
+        if variants is None:
+            return response
+
+        # FileResponse already computed content-type, etag and last-modified
+        accept_encoding = ""
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        return encoded_response(variants, accept_encoding, status_code, dict(response.headers))
+
+    def preload(self) -> int:
+        """
+        Warm the cache with every eligible file under the directory
+
+        Returns:
+            Number of files cached
+        """
+        if self.directory is None:
+            return 0
+        count = 0
+        for path in sorted(os.scandir(self.directory), key=lambda e: e.name):
+            if path.is_file() and path.stat().st_size <= self.max_file_bytes:
+                if self._get_variants(path.path, path.stat()) is not None:
+                    count += 1
+        return count
+
+    def _get_variants(self, path: str, stat_result) -> Optional[Dict[str, bytes]]:
+        """Return cached file variants, reading and compressing them on a miss"""
+        key = (path, stat_result.st_mtime_ns, stat_result.st_size)
+        with self._cache_lock:
+            variants = self._cache.get(key)
+            if variants is not None:
+                self._cache.move_to_end(key)
+                return variants
+
+        try:
+            with open(path, "rb") as f:
+                body = f.read()
+        except OSError:
+            return None
+
+        if path.endswith(COMPRESSIBLE_SUFFIXES):
+            variants = compress_variants(body)
+        else:
+            variants = {"identity": body}
+        size = sum(len(v) for v in variants.values())
+
+        with self._cache_lock:
+            if key not in self._cache:
+                self._cache[key] = variants
+                self._cache_bytes += size
+                while self._cache_bytes > self.max_total_bytes and self._cache:
+                    _, evicted = self._cache.popitem(last=False)
+                    self._cache_bytes -= sum(len(v) for v in evicted.values())
+        return variants
@@ -3,13 +3,103 @@ Enterprise Structured Logging System
 Provides JSON-formatted, production-ready logging with correlation IDs and contextual information
 """
 
+import atexit
 import logging
+import logging.handlers
 import json
 import os
+import queue
+from dataclasses import fields, is_dataclass
 from datetime import datetime
+from enum import Enum
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for values the JSON backend can't serialize natively"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if hasattr(obj, 'tolist'):
+        # NumPy arrays/scalars (orjson handles these natively via OPT_SERIALIZE_NUMPY)
+        return obj.tolist()
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        # Shallow projection - avoids asdict()'s deep copy of nested objects
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    # Non-serializable payloads (e.g. trained models in metadata) are logged by type only
+    return f"<{type(obj).__name__}>"
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize a log payload to a JSON string
+    
+    Uses orjson when installed (dataclasses, enums and datetimes are encoded
+    natively), falling back to the standard library json module.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS).decode()
+    return json.dumps(obj, default=_json_default)
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a listener living in the same process
+    
+    The stock handler pre-formats each record (including the traceback) on the
+    calling thread so it can be pickled. Records never leave this process, so
+    formatting is left to the listener thread's handlers instead.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+    
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Bounded queue under overload: shed log records rather than block requests
+            pass
+
+
+def queue_logger_handlers(logger: logging.Logger,
+                          maxsize: int = 10000) -> Optional[logging.handlers.QueueListener]:
+    """
+    Move a logger's handlers behind a background listener thread
+    
+    Callers then only push records onto a bounded queue; formatting and the
+    (locking, flushing) stream writes happen on the listener thread.
+    
+    Args:
+        logger: Logger whose handlers should be queued (e.g. the root logger)
+        maxsize: Queue bound; records are dropped once it is full
+        
+    Returns:
+        The started listener, or None if the logger had no handlers
+    """
+    handlers = list(logger.handlers)
+    if not handlers:
+        return None
+    
+    log_queue = queue.Queue(maxsize=maxsize)
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(_InProcessQueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
 
 class StructuredLogger:
     """
@@ -21,9 +111,11 @@ class StructuredLogger:
     - Multiple log levels (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     - File and console handlers
     - Automatic log rotation
+    - Optional background writer thread (queued=True)
     """
     
-    def __init__(self, name: str, log_level: str = "INFO", log_dir: str = "logs"):
+    def __init__(self, name: str, log_level: str = "INFO", log_dir: str = "logs",
+                 queued: bool = False):
         """
         Initialize structured logger
         
@@ -31,10 +123,13 @@ class StructuredLogger:
             name: Logger name (usually module/service name)
             log_level: Minimum log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
             log_dir: Directory for log files (relative to project root)
+            queued: If True, callers only enqueue records and a background
+                listener thread performs the formatting and file writes
         """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(getattr(logging, log_level.upper()))
         self.name = name
+        self._listener: Optional[logging.handlers.QueueListener] = None
         
         # Prevent duplicate handlers
         if self.logger.handlers:
@@ -49,7 +144,8 @@ class StructuredLogger:
         class JSONFormatter(logging.Formatter):
             def format(self, record: logging.LogRecord) -> str:
                 log_data = {
-                    "timestamp": datetime.utcnow().isoformat(),
+                    # Use the record's creation time - formatting may run later on the writer thread
+                    "timestamp": datetime.utcfromtimestamp(record.created).isoformat(),
                     "level": record.levelname,
                     "logger": record.name,
                     "message": record.getMessage(),
@@ -65,12 +161,14 @@ class StructuredLogger:
                     log_data['user_id'] = record.user_id
                 if hasattr(record, 'session_id'):
                     log_data['session_id'] = record.session_id
+                if hasattr(record, 'error_context'):
+                    log_data['context'] = record.error_context
                 
                 # Add exception info if present
                 if record.exc_info:
                     log_data['exception'] = self.formatException(record.exc_info)
                 
-                return json.dumps(log_data)
+                return dumps(log_data)
         
         # Console handler - structured format for development
         console_handler = logging.StreamHandler()
@@ -80,19 +178,37 @@ class StructuredLogger:
         )
         console_handler.setFormatter(console_formatter)
         console_handler.setLevel(logging.INFO)
-        self.logger.addHandler(console_handler)
         
         # File handler - JSON format for production
         file_handler = logging.FileHandler(log_path / f'{name}.log')
         file_handler.setFormatter(JSONFormatter())
         file_handler.setLevel(logging.DEBUG)
-        self.logger.addHandler(file_handler)
         
         # Error file handler - separate file for errors
         error_handler = logging.FileHandler(log_path / f'{name}_errors.log')
         error_handler.setFormatter(JSONFormatter())
         error_handler.setLevel(logging.ERROR)
-        self.logger.addHandler(error_handler)
+        
+        handlers = (console_handler, file_handler, error_handler)
+        
+        if queued:
+            # Hot path becomes a single queue push; I/O happens on the listener thread
+            log_queue = queue.SimpleQueue()
+            self.logger.addHandler(_InProcessQueueHandler(log_queue))
+            self._listener = logging.handlers.QueueListener(
+                log_queue, *handlers, respect_handler_level=True
+            )
+            self._listener.start()
+            atexit.register(self.shutdown)
+        else:
+            for handler in handlers:
+                self.logger.addHandler(handler)
+    
+    def shutdown(self):
+        """Flush pending records and stop the background writer (if any)"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
     
     def log_event(self, event_type: str, data: Dict[str, Any], 
                   level: str = "info", **extra_fields):
@@ -113,33 +229,28 @@ class StructuredLogger:
         # Create a log record with extra fields
         extra = {k: v for k, v in extra_fields.items()}
         
-        message = f"[{event_type}] {json.dumps(data)}"
+        message = f"[{event_type}] {dumps(data)}"
         log_method = getattr(self.logger, level.lower())
         log_method(message, extra=extra)
     
-    def log_error(self, error: Exception, context: Dict[str, Any], 
+    def log_error(self, error: Exception, context: Any, 
                   operation: str, **extra_fields):
         """
         Log error with full context for debugging
         
         Args:
             error: Exception object
-            context: Additional context about the error
+            context: Additional context about the error (dict or dataclass,
+                e.g. a PipelineContext passed as-is)
             operation: Operation being performed when error occurred
             **extra_fields: Additional fields (correlation_id, user_id, etc.)
         """
-        import traceback
-        
-        error_data = {
+        extra = {k: v for k, v in extra_fields.items()}
+        extra['error_context'] = dumps({
             "operation": operation,
             "error_type": type(error).__name__,
-            "error_message": str(error),
-            "stack_trace": traceback.format_exc(),
             "context": context,
-            "severity": "ERROR"
-        }
-        
-        extra = {k: v for k, v in extra_fields.items()}
+        })
         self.logger.error(
             f"Error in {operation}: {str(error)}", 
             exc_info=True,
@@ -173,7 +284,7 @@ class StructuredLogger:
 
 
 # Global logger instances for common services
-pipeline_logger = StructuredLogger("forecastai_pipeline")
+pipeline_logger = StructuredLogger("forecastai_pipeline", queued=True)
 api_logger = StructuredLogger("forecastai_api")
 ml_logger = StructuredLogger("forecastai_ml")
 validation_logger = StructuredLogger("forecastai_validation")
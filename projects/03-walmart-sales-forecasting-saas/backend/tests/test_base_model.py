@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ml.base_model import ForecastResult
+
+
+def make_result(dates):
+    n = len(dates)
+    return ForecastResult(
+        dates=dates, predictions=np.ones(n), lower_bound=np.zeros(n), upper_bound=np.full(n, 2.0),
+        model_type="test", confidence_level=95.0, metrics={}, training_time=0.0
+    )
+
+
+def test_daily_dates_serialize_as_days():
+    result = make_result(pd.date_range("2024-01-01", periods=3, freq="D"))
+    assert result.dates.dtype == np.dtype("datetime64[D]")
+    assert result.to_json_dict()["dates"] == ["2024-01-01", "2024-01-02", "2024-01-03"]
+
+
+@pytest.mark.parametrize("dates", [
+    pd.date_range("2024-01-01", periods=3, freq="h"),
+    ["2024-01-01T00:00", "2024-01-01T01:00", "2024-01-01T02:00"],
+])
+def test_sub_daily_dates_keep_time_of_day(dates):
+    labels = make_result(dates).to_json_dict()["dates"]
+    assert labels == ["2024-01-01T00:00", "2024-01-01T01:00", "2024-01-01T02:00"]
+    assert len(set(labels)) == 3
+
+
+def test_mixed_labels_stay_strings():
+    result = make_result(["2024-01-01", "week 2"])
+    assert result.dates.dtype.kind == "U"
+    assert result.to_json_dict()["dates"] == ["2024-01-01", "week 2"]
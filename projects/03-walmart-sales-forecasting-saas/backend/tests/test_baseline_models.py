@@ -0,0 +1,172 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ml import baseline_models
+from app.ml.baseline_models import MovingAverageForecaster, NaiveForecaster
+
+
+def make_sales(n, nan_at=()):
+    rng = np.random.default_rng(0)
+    sales = 100 + rng.normal(0, 5, n)
+    sales[list(nan_at)] = np.nan
+    return pd.DataFrame({
+        "date": pd.date_range("2023-01-01", periods=n, freq="D"),
+        "sales": sales
+    })
+
+
+@pytest.mark.parametrize("n", [50, 2000])
+@pytest.mark.parametrize("model_cls", [NaiveForecaster, MovingAverageForecaster])
+def test_nan_target_keeps_std_and_bounds_finite(model_cls, n):
+    df = make_sales(n, nan_at=[5])
+    model = model_cls()
+    model.train(df, target_col="sales", date_col="date")
+
+    assert model.std_dev == pytest.approx(df["sales"].std())
+    forecast = model.predict(periods=7)
+    assert np.isfinite(forecast.lower_bound).all()
+    assert np.isfinite(forecast.upper_bound).all()
+
+
+@pytest.mark.parametrize("model_cls", [NaiveForecaster, MovingAverageForecaster])
+def test_nan_target_without_metrics(model_cls):
+    df = make_sales(50, nan_at=[5])
+    model = model_cls()
+    model.train(df, target_col="sales", date_col="date", compute_metrics=False)
+
+    assert model.std_dev == pytest.approx(df["sales"].std())
+    assert np.isfinite(model.predict(periods=7).lower_bound).all()
+
+
+def reference_ma_mape(df, window=7):
+    """MAPE as the original pandas implementation computed it"""
+    series = df["sales"]
+    y_true = series.iloc[window:].values
+    y_pred = series.rolling(window=window).mean().shift(1).iloc[window:].values
+    valid = ~np.isnan(y_pred)
+    y_true, y_pred = y_true[valid], y_pred[valid]
+    return np.mean(np.abs((y_true - y_pred) / (y_true + 1e-6))) * 100
+
+
+@pytest.mark.parametrize("n", [50, 2000])
+def test_moving_average_metrics_skip_nan_windows(n):
+    df = make_sales(n, nan_at=[5])
+    metrics = MovingAverageForecaster().train(df, target_col="sales", date_col="date")
+
+    assert np.isfinite([metrics.mape, metrics.rmse, metrics.mae, metrics.r2]).all()
+    assert metrics.mape == round(reference_ma_mape(df), 2)
+
+
+# ---------------------------------------------------------------------------
+# Kernel equivalence against the original pandas/NumPy formulas
+# ---------------------------------------------------------------------------
+def reference_metrics(y_true, y_pred):
+    """(mape, rmse, mae, r2) as the original implementation computed them"""
+    diff = y_true - y_pred
+    mape = np.mean(np.abs(diff / (y_true + 1e-6))) * 100
+    rmse = np.sqrt(np.mean(diff ** 2))
+    mae = np.mean(np.abs(diff))
+    ss_tot = np.sum((y_true - np.mean(y_true)) ** 2)
+    r2 = 1 - np.sum(diff ** 2) / (ss_tot + 1e-6)
+    return mape, rmse, mae, r2
+
+
+def reference_ma_fit(series, window):
+    """(last_window_mean, mape, rmse, mae, r2, std) of the original MovingAverageForecaster"""
+    y_true = series.iloc[window:].values
+    y_pred = series.rolling(window=window).mean().shift(1).iloc[window:].values
+    valid = ~np.isnan(y_pred)
+    y_true, y_pred = y_true[valid], y_pred[valid]
+    metrics = reference_metrics(y_true, y_pred) if len(y_true) else (0, 0, 0, 0)
+    return (series.iloc[-window:].mean(), *metrics, series.std())
+
+
+METRIC_KERNELS = [
+    pytest.param(baseline_models._regression_metrics, id="numba"),
+    pytest.param(baseline_models._regression_metrics_numpy, id="numpy"),
+]
+SIZES = [1, 2, 50, baseline_models.NUMBA_MIN_SAMPLES + 500]
+
+
+@pytest.mark.parametrize("kernel", METRIC_KERNELS)
+@pytest.mark.parametrize("n", SIZES)
+def test_regression_metrics_match_reference(kernel, n):
+    rng = np.random.default_rng(n)
+    y_true = 1e5 + rng.normal(0, 50, n)
+    y_pred = y_true + rng.normal(0, 10, n)
+
+    mape, rmse, mae, r2, sum_c, sum_c_sq = kernel(y_true, y_pred)
+    np.testing.assert_allclose([mape, rmse, mae, r2], reference_metrics(y_true, y_pred), rtol=1e-7, atol=1e-9)
+    centered = y_true - y_true[0]
+    np.testing.assert_allclose([sum_c, sum_c_sq], [centered.sum(), centered @ centered], rtol=1e-7, atol=1e-6)
+
+
+@pytest.mark.parametrize("kernel", METRIC_KERNELS)
+def test_regression_metrics_empty_and_nan(kernel):
+    empty = np.empty(0)
+    assert np.isnan(kernel(empty, empty)[:4]).all()
+
+    y = np.array([1.0, 2.0, np.nan, 4.0])
+    assert np.isnan(kernel(y, y + 1)[:4]).all()
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_fit_stats_matches_pandas_std(n):
+    rng = np.random.default_rng(n)
+    x = 500 + rng.normal(0, 20, n)
+    *_, std = baseline_models._fit_stats(x[:1], x[1:], x[:-1])
+    expected = pd.Series(x).std()
+    if np.isnan(expected):
+        assert np.isnan(std)
+    else:
+        assert std == pytest.approx(expected, rel=1e-9)
+
+
+BATCH_KERNELS = [
+    pytest.param(baseline_models._batch_ma_stats, id="numba"),
+    pytest.param(baseline_models._batch_ma_stats_numpy, id="numpy"),
+]
+
+
+def make_wide(n_time, n_series=4, nan_at=()):
+    rng = np.random.default_rng(n_time)
+    X = 100 + rng.normal(0, 5, (n_series, n_time))
+    for s, t in nan_at:
+        X[s, t] = np.nan
+    return X
+
+
+@pytest.mark.parametrize("kernel", BATCH_KERNELS)
+@pytest.mark.parametrize("n_time, nan_at", [
+    (3, ()),                                  # shorter than the window
+    (7, ()),                                  # exactly one window, no backtest
+    (60, ()),
+    (60, [(1, 3), (2, 30)]),                  # NaN in the warm-up and mid-series
+    (baseline_models.NUMBA_MIN_SAMPLES + 200, [(0, 500)]),
+])
+def test_batch_ma_stats_match_reference(kernel, n_time, nan_at):
+    window = 7
+    X = make_wide(n_time, nan_at=nan_at)
+    stats = kernel(X, window)
+    for s in range(X.shape[0]):
+        np.testing.assert_allclose(stats[s], reference_ma_fit(pd.Series(X[s]), window),
+                                   rtol=1e-7, atol=1e-9, err_msg=f"series {s}")
+
+
+@pytest.mark.parametrize("n_time", [60, baseline_models.NUMBA_MIN_SAMPLES + 200])
+def test_fit_many_matches_train(n_time):
+    window = 7
+    X = make_wide(n_time, nan_at=[(1, 3)])
+    dates = pd.date_range("2023-01-01", periods=n_time, freq="D")
+    df_wide = pd.DataFrame(X.T, index=dates, columns=[f"s{i}" for i in range(X.shape[0])])
+
+    means, stds, metrics = MovingAverageForecaster.fit_many(df_wide.iloc[::-1], window=window)
+    for i, col in enumerate(df_wide.columns):
+        model = MovingAverageForecaster(window)
+        expected = model.train(pd.DataFrame({"date": dates, "sales": df_wide[col].to_numpy()}),
+                               target_col="sales", date_col="date", window=window)
+        assert means[i] == pytest.approx(model.last_window_mean)
+        assert stds[i] == pytest.approx(model.std_dev)
+        assert (metrics[i].mape, metrics[i].rmse, metrics[i].mae, metrics[i].r2) == \
+            (expected.mape, expected.rmse, expected.mae, expected.r2)
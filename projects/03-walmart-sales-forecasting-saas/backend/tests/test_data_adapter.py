@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from app.ml.data_adapter import (
+    COLUMN_SYNONYMS,
+    FUZZY_SCORE_CUTOFF,
+    PARALLEL_MATCH_MIN_COLUMNS,
+    RAPIDFUZZ_AVAILABLE,
+    SimpleColumnMatcher,
+)
+
+if RAPIDFUZZ_AVAILABLE:
+    from rapidfuzz import fuzz
+
+
+@pytest.mark.parametrize("name, role", [
+    ("y", "sales"),
+    ("ds", "date"),
+    ("Weekly_Sales", "sales"),
+    ("Store", "store"),
+])
+def test_match_known_names(name, role):
+    mapping = SimpleColumnMatcher().match(name)
+    assert mapping.matched_role == role
+    assert mapping.confidence == 1.0
+
+
+def test_single_letter_names_do_not_substring_match():
+    matcher = SimpleColumnMatcher()
+    assert matcher.match("x").matched_role is None
+    assert matcher.match_all(["ds", "y", "x"])[1].matched_role == "sales"
+
+
+def mutated_names(count, seed=0):
+    """Misspelled synonyms that only the fuzzy pass can resolve"""
+    rng = np.random.default_rng(seed)
+    syns = [syn for syns in COLUMN_SYNONYMS.values() for syn in syns if len(syn) > 4]
+    lexical = SimpleColumnMatcher()
+    names = []
+    while len(names) < count:
+        chars = list(syns[rng.integers(len(syns))])
+        pos = rng.integers(len(chars))
+        chars[pos] = "qxz"[rng.integers(3)]
+        name = "".join(chars)
+        if name not in names and lexical._match_lexical(name) is None:
+            names.append(name)
+    return names
+
+
+def brute_force_fuzzy(matcher, name):
+    """First synonym with the highest fuzz.ratio, as a plain Python loop"""
+    best_score, best_role = 0.0, None
+    for syn, role in zip(matcher._synonym_keys, matcher._synonym_roles):
+        score = fuzz.ratio(name, syn)
+        if score > best_score:
+            best_score, best_role = score, role
+    if best_score >= FUZZY_SCORE_CUTOFF:
+        return best_role, round(best_score / 100.0, 2)
+    return None, 0.0
+
+
+@pytest.mark.skipif(not RAPIDFUZZ_AVAILABLE, reason="rapidfuzz not installed")
+@pytest.mark.parametrize("count", [PARALLEL_MATCH_MIN_COLUMNS // 2, PARALLEL_MATCH_MIN_COLUMNS * 4])
+def test_cdist_matches_per_column_fuzzy(count):
+    names = mutated_names(count) + ["zzzzzz_unrelated"]
+    matcher = SimpleColumnMatcher()
+    matcher.match_all(names)
+
+    single = SimpleColumnMatcher()
+    for name in names:
+        cached = matcher._cache_get(name)
+        assert cached == single._match_fuzzy(name) == brute_force_fuzzy(single, name), name
+
+
+@pytest.mark.parametrize("name, role", [
+    ("cpi_index", "economic"),   # short synonym as a whole token
+    ("sku_id", "product"),
+    ("store_cnt", "sales"),      # first synonym in dictionary order wins
+    ("IsHoliday", "promotion"),  # 'day' inside a token is not a match
+])
+def test_short_synonyms_match_whole_tokens(name, role):
+    mapping = SimpleColumnMatcher().match(name)
+    assert mapping.matched_role == role
+    assert mapping.confidence > 0
+
+
+@pytest.mark.parametrize("name", ["a", "ID", "goods"])
+def test_short_synonyms_do_not_match_inside_words(name):
+    assert SimpleColumnMatcher().match(name).matched_role is None
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ml.data_imputer import DASK_AVAILABLE, JOBLIB_AVAILABLE, DataPreprocessor
+
+
+def make_walmart_frame(seed=0, stores=3, depts=8, weeks=30):
+    """Shuffled Walmart-style frame with sparse markdowns and gaps elsewhere"""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2010-02-05", periods=weeks, freq="W-FRI")
+    idx = pd.MultiIndex.from_product(
+        [range(1, stores + 1), range(1, depts + 1), dates], names=["Store", "Dept", "Date"]
+    )
+    df = idx.to_frame(index=False)
+    n = len(df)
+    df["Weekly_Sales"] = rng.gamma(2, 5000, n)
+    usage = rng.random(depts + 1) * 0.4
+    for k in range(1, 6):
+        values = rng.gamma(2, 3000, n)
+        values[rng.random(n) > usage[df["Dept"].to_numpy()]] = np.nan
+        df[f"MarkDown{k}"] = values
+    for col in ("Temperature", "Fuel_Price", "CPI"):
+        values = rng.normal(50, 5, n)
+        values[rng.random(n) < 0.1] = np.nan
+        df[col] = values
+    df["Type"] = rng.choice(["A", "B", None], n)
+    return df.sample(frac=1, random_state=seed).reset_index(drop=True)
+
+
+@pytest.fixture
+def frame():
+    return make_walmart_frame()
+
+
+@pytest.fixture
+def expected(frame):
+    return DataPreprocessor().fit(frame).transform(frame)
+
+
+@pytest.mark.skipif(not JOBLIB_AVAILABLE, reason="joblib not installed")
+def test_joblib_cached_fit_transform_matches(frame, expected, tmp_path):
+    first = DataPreprocessor(memory=str(tmp_path)).fit_transform(frame)
+    pd.testing.assert_frame_equal(first, expected)
+
+    # Second call is served from the cache and still yields a fitted preprocessor
+    cached = DataPreprocessor(memory=str(tmp_path))
+    pd.testing.assert_frame_equal(cached.fit_transform(frame), expected)
+    assert cached.fitted
+    other = make_walmart_frame(seed=1)
+    pd.testing.assert_frame_equal(
+        cached.transform(other), DataPreprocessor().fit(frame).transform(other)
+    )
+
+
+@pytest.mark.skipif(not JOBLIB_AVAILABLE, reason="joblib not installed")
+def test_joblib_cache_keys_on_content(frame, tmp_path):
+    DataPreprocessor(memory=str(tmp_path)).fit_transform(frame)
+    changed = frame.copy()
+    changed.loc[0, "Temperature"] = np.nan
+    pd.testing.assert_frame_equal(
+        DataPreprocessor(memory=str(tmp_path)).fit_transform(changed),
+        DataPreprocessor().fit(changed).transform(changed)
+    )
+
+
+@pytest.mark.skipif(not DASK_AVAILABLE, reason="dask not installed")
+@pytest.mark.parametrize("npartitions", [1, 3, 8])
+def test_dask_fit_transform_matches(frame, expected, npartitions):
+    result = DataPreprocessor().fit_transform_dask(frame, npartitions=npartitions)
+    pd.testing.assert_frame_equal(result, expected)
+
@@ -0,0 +1,126 @@
+import os
+import stat
+import time
+
+import pandas as pd
+import pytest
+
+from app.core.pipeline_orchestrator import EnterprisePipelineOrchestrator
+
+VALIDATION = {
+    "passed": ["_check_file_size"],
+    "failed": [],
+    "warnings": [{"check": "_check_outliers", "message": "3 outliers"}],
+    "quality_score": 87.5,
+    "total_checks": 8
+}
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    orch = EnterprisePipelineOrchestrator(cache_dir=tmp_path / "cache")
+    yield orch
+    orch.shutdown()
+
+
+@pytest.fixture
+def upload(tmp_path):
+    path = tmp_path / "sales.csv"
+    path.write_text("date,sales\n2024-01-01,10\n2024-01-02,12\n")
+    return path
+
+
+def make_context(orch, upload, user_id="user-1"):
+    return orch.create_session(user_id, str(upload), upload.name,
+                               upload.stat().st_size, {"target": "sales", "date": "date"})
+
+
+def store(orch, context):
+    df = pd.DataFrame({"date": pd.to_datetime(["2024-01-01", "2024-01-02"]), "sales": [10.0, 12.0]})
+    assert orch._load_cached_preprocessing(context) is None
+    orch._store_cached_preprocessing(context, df, {"dimensions": {"rows": 2}}, VALIDATION)
+    return df
+
+
+def test_cache_hit_returns_frame_and_validation(orchestrator, upload):
+    df = store(orchestrator, make_context(orchestrator, upload))
+
+    context = make_context(orchestrator, upload)
+    cached_df, profile, validation = orchestrator._load_cached_preprocessing(context)
+    pd.testing.assert_frame_equal(cached_df, df)
+    assert profile == {"dimensions": {"rows": 2}}
+    assert validation == VALIDATION
+
+    assert orchestrator._apply_cached_validation(context, validation) is True
+    assert context.data_quality_score == 87.5
+    assert context.warnings[0]["check"] == "_check_outliers"
+
+
+def test_cached_validation_failure_is_reported(orchestrator):
+    context = orchestrator.create_session("user-1", "x.csv", "x.csv", 1, {})
+    results = dict(VALIDATION, failed=[{"check": "_check_date_column", "error": "missing"}])
+    assert orchestrator._apply_cached_validation(context, results) is False
+
+
+def test_cache_miss_for_other_user_or_content(orchestrator, upload):
+    store(orchestrator, make_context(orchestrator, upload))
+
+    assert orchestrator._load_cached_preprocessing(make_context(orchestrator, upload, "user-2")) is None
+
+    # Same size and prefix, different trailing bytes
+    upload.write_text(upload.read_text()[:-3] + "99\n")
+    assert orchestrator._load_cached_preprocessing(make_context(orchestrator, upload)) is None
+
+
+def test_corrupt_entry_is_a_miss_and_removed(orchestrator, upload):
+    context = make_context(orchestrator, upload)
+    store(orchestrator, context)
+    cache_key = context.metadata["cache_key"]
+    frame_path = orchestrator._cache_dir / f"{cache_key}.feather"
+    frame_path.write_bytes(b"not a feather file")
+
+    assert orchestrator._load_cached_preprocessing(make_context(orchestrator, upload)) is None
+    assert not frame_path.exists()
+    assert not (orchestrator._cache_dir / f"{cache_key}.json").exists()
+
+
+def test_cache_dir_is_private(orchestrator, upload):
+    store(orchestrator, make_context(orchestrator, upload))
+    assert stat.S_IMODE(os.stat(orchestrator._cache_dir).st_mode) == 0o700
+
+
+def test_default_cache_dir_is_private_and_removed_on_shutdown(upload):
+    orch = EnterprisePipelineOrchestrator()
+    try:
+        store(orch, make_context(orch, upload))
+        cache_dir = orch._cache_dir
+        assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
+    finally:
+        orch.shutdown()
+    assert not cache_dir.exists()
+
+
+def test_configured_cache_dir_survives_shutdown(orchestrator, upload):
+    store(orchestrator, make_context(orchestrator, upload))
+    cache_dir = orchestrator._cache_dir
+    orchestrator.shutdown()
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_eviction_by_age_and_size(orchestrator, upload):
+    context = make_context(orchestrator, upload)
+    store(orchestrator, context)
+    cache_key = context.metadata["cache_key"]
+    files = list(orchestrator._cache_dir.iterdir())
+    assert len(files) == 2
+
+    assert orchestrator._evict_cache() == 0
+    assert orchestrator._evict_cache(max_bytes=0) == 1
+    assert list(orchestrator._cache_dir.iterdir()) == []
+
+    store(orchestrator, make_context(orchestrator, upload))
+    old = time.time() - 3600
+    for path in orchestrator._cache_dir.iterdir():
+        os.utime(path, (old, old))
+    assert orchestrator._evict_cache(max_age_s=60) == 1
+    assert not (orchestrator._cache_dir / f"{cache_key}.feather").exists()
@@ -0,0 +1,97 @@
+import json
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from app.core.pipeline_orchestrator import EnterprisePipelineOrchestrator, PipelineStage
+from app.ml.base_model import ForecastResult
+
+
+class FakeEnsemble:
+    def predict(self, periods, confidence_level):
+        return ForecastResult(
+            dates=np.arange('2024-01-01', '2024-01-04', dtype='datetime64[D]'),
+            predictions=np.array([10.123, 11.456, 12.789]),
+            lower_bound=np.array([8.0, 9.0, 10.0]),
+            upper_bound=np.array([12.0, 13.0, 14.0]),
+            model_type="ensemble",
+            confidence_level=95.0,
+            metrics={},
+            training_time=0.0
+        )
+
+    def get_model_comparison(self):
+        return {"prophet": {"mape": 5.0, "weight": np.float64(1.0)}}
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    orch = EnterprisePipelineOrchestrator(cache_dir=tmp_path / "cache")
+    yield orch
+    orch.shutdown()
+
+
+def test_ensemble_forecast_is_json_serializable(orchestrator):
+    context = orchestrator.create_session("user-1", "x.csv", "x.csv", 1, {})
+    result = orchestrator._create_ensemble(context, {"ensemble": FakeEnsemble(), "models_used": ["prophet"]})
+
+    forecast = result["forecast"]
+    assert forecast["dates"] == ["2024-01-01", "2024-01-02", "2024-01-03"]
+    assert forecast["predictions"] == [10.12, 11.46, 12.79]
+    assert all(isinstance(v, list) for v in forecast.values())
+    json.dumps(jsonable_encoder(result))
+
+
+def test_concurrent_stage_failure_reports_failing_stage(orchestrator, tmp_path, monkeypatch):
+    upload = tmp_path / "sales.csv"
+    upload.write_text("date,sales\n2024-01-01,10\n")
+    context = orchestrator.create_session("user-1", str(upload), upload.name, 1, {})
+    df = pd.DataFrame({"date": ["2024-01-01"], "sales": [10]})
+    preprocess_failed = threading.Event()
+
+    def profile(ctx, frame):
+        # Runs (and claims the stage) after preprocessing has already failed
+        preprocess_failed.wait(5)
+        ctx.current_stage = PipelineStage.PROFILING
+        return {}
+
+    def preprocess(ctx, frame):
+        ctx.current_stage = PipelineStage.PREPROCESSING
+        preprocess_failed.set()
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(orchestrator, "_ingest_data", lambda ctx: df)
+    monkeypatch.setattr(orchestrator, "validate_data", lambda ctx, frame: (True, {}))
+    monkeypatch.setattr(orchestrator, "_profile_data", profile)
+    monkeypatch.setattr(orchestrator, "_preprocess_data", preprocess)
+
+    result = orchestrator.execute_pipeline(context)
+    assert result["error_type"] == "unexpected_error"
+    assert result["error_stage"] == "preprocessing"
+
+
+def test_pruner_starts_lazily_and_shuts_down(tmp_path):
+    orch = EnterprisePipelineOrchestrator(cache_dir=tmp_path / "cache")
+    assert orch._pruner is None
+
+    orch.create_session("user-1", "x.csv", "x.csv", 1, {})
+    assert orch._pruner.is_alive()
+
+    orch.shutdown()
+    assert not orch._pruner.is_alive()
+
+
+def test_engineer_features_leaves_input_untouched(orchestrator):
+    df = pd.DataFrame({"date": pd.date_range("2024-01-01", periods=20), "sales": np.arange(20.0)})
+    context = orchestrator.create_session("user-1", "x.csv", "x.csv", 1, {"target": "sales"})
+    features = orchestrator._engineer_features(context, df)
+    assert features is not df
+    assert list(df.columns) == ["date", "sales"]
+
+    # Already engineered, or no target: the same object comes back
+    assert orchestrator._engineer_features(context, features) is features
+    no_target = orchestrator.create_session("user-1", "x.csv", "x.csv", 1, {})
+    assert orchestrator._engineer_features(no_target, df) is df